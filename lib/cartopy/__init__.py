@@ -37,6 +37,8 @@ config = {'pre_existing_data_dir': '',
           'data_dir': _data_dir,
           'repo_data_dir': os.path.join(os.path.dirname(__file__), 'data'),
           'downloaders': {},
+          'feature_cache_dir': None,
+          'warped_image_cache_dir': None,
           }
 """
 The config dictionary stores global configuration values for cartopy.
@@ -78,6 +80,21 @@ Keys in the config dictionary:
     :class:`~cartopy.io.Downloader`. For further documentation and an example
     see :func:`cartopy.io.Downloader.from_config`.
 
+``feature_cache_dir``
+    The absolute path to a directory in which the projected paths of
+    features (such as those from NaturalEarth) are persisted between
+    sessions, or None (the default) to disable the persistent cache. See
+    :attr:`cartopy.mpl.feature_artist.FeatureArtist.persistent_cache_size`
+    for the limit on the size of this directory.
+
+``warped_image_cache_dir``
+    The absolute path to a directory in which background images warped into
+    the projection of a map (by :meth:`~cartopy.mpl.geoaxes.GeoAxes.stock_img`
+    and :meth:`~cartopy.mpl.geoaxes.GeoAxes.background_img`) are persisted
+    between sessions, or None (the default) to keep them only in memory. See
+    :attr:`cartopy.mpl.geoaxes.GeoAxes.warped_image_dir_size` for the limit
+    on the size of this directory.
+
 """  # n.b. docstring changes should be propagated to docs/source/cartopy.rst
 
 del _data_dir
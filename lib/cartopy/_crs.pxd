@@ -26,6 +26,7 @@ cdef class CRS:
     """
 
     cdef projPJ proj4
+    cdef object proj4_handle
     cdef readonly proj4_init
     cdef proj4_params
 
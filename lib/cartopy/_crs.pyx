@@ -24,20 +24,23 @@ The CRS class is the base-class for all projections defined in :mod:`cartopy.crs
 """
 
 from collections import OrderedDict
+import concurrent.futures
 import re
 import warnings
 
 import numpy as np
 import six
 
+cimport cython
 cimport numpy as np
 
 from cython.operator cimport dereference as deref
 
 
-from ._proj4 cimport (pj_init_plus, pj_free, pj_transform, pj_is_latlong,
-                      pj_strerrno, pj_get_errno_ref, pj_get_release,
-                      DEG_TO_RAD, RAD_TO_DEG)
+from ._proj4 cimport (projPJ, projCtx, pj_init_plus, pj_init_plus_ctx,
+                      pj_ctx_alloc, pj_ctx_free, pj_free, pj_transform,
+                      pj_is_latlong, pj_strerrno, pj_get_errno_ref,
+                      pj_get_release, DEG_TO_RAD, RAD_TO_DEG)
 
 
 cdef double NAN = float('nan')
@@ -72,6 +75,47 @@ class Proj4Error(Exception):
         Exception.__init__(self, msg)
 
 
+@cython.boundscheck(False)
+def _transform_in_context(bytes src_init, bytes dest_init,
+                          double[:, ::1] points):
+    """
+    Transform the given (N, 3) array of points in place, from the source to
+    the destination proj definition.
+
+    The transformation uses its own proj context and is done without the
+    GIL, so it is safe to call concurrently from several threads.
+
+    """
+    cdef:
+        char *c_src_init = src_init
+        char *c_dest_init = dest_init
+        long npts = points.shape[0]
+        projCtx ctx
+        projPJ src_proj
+        projPJ dest_proj
+        bint initialised
+
+    if npts == 0:
+        return
+
+    with nogil:
+        ctx = pj_ctx_alloc()
+        src_proj = pj_init_plus_ctx(ctx, c_src_init)
+        dest_proj = pj_init_plus_ctx(ctx, c_dest_init)
+        initialised = src_proj != NULL and dest_proj != NULL
+        if initialised:
+            pj_transform(src_proj, dest_proj, npts, 3,
+                         &points[0, 0], &points[0, 1], &points[0, 2])
+        if src_proj != NULL:
+            pj_free(src_proj)
+        if dest_proj != NULL:
+            pj_free(dest_proj)
+        pj_ctx_free(ctx)
+
+    if not initialised:
+        raise Proj4Error()
+
+
 class Globe(object):
     """
     Define an ellipsoid and, optionally, how to relate it to the real world.
@@ -124,6 +168,48 @@ class Globe(object):
         return OrderedDict((k, v) for k, v in proj4_params if v is not None)
 
 
+@cython.final
+cdef class _ProjHandle:
+    """
+    Own a proj handle, which is freed when the last :class:`CRS` using it
+    is deallocated.
+
+    """
+    cdef projPJ proj4
+
+    def __cinit__(self):
+        self.proj4 = NULL
+
+    def __dealloc__(self):
+        if self.proj4 != NULL:
+            pj_free(self.proj4)
+
+
+#: The maximum number of recently used proj handles which are kept alive by
+#: :func:`_proj_handle`, even when no CRS refers to them.
+_PROJ_HANDLE_CACHE_SIZE = 64
+_PROJ_HANDLE_CACHE = OrderedDict()
+
+
+cdef _ProjHandle _proj_handle(proj4_init):
+    """
+    Return the (interned) proj handle for the given proj4 definition string,
+    initialising a new one only if it has not been recently used.
+
+    """
+    cdef _ProjHandle handle = _PROJ_HANDLE_CACHE.pop(proj4_init, None)
+    if handle is None:
+        handle = _ProjHandle()
+        handle.proj4 = pj_init_plus(six.b(proj4_init))
+        if not handle.proj4:
+            raise Proj4Error()
+        if len(_PROJ_HANDLE_CACHE) >= _PROJ_HANDLE_CACHE_SIZE:
+            _PROJ_HANDLE_CACHE.popitem(last=False)
+    # (Re-)insert the handle as the most recently used.
+    _PROJ_HANDLE_CACHE[proj4_init] = handle
+    return handle
+
+
 cdef class CRS:
     """
     Define a Coordinate Reference System using proj.
@@ -136,10 +222,6 @@ cdef class CRS:
     def __cinit__(self):
         self.proj4 = NULL
 
-    def __dealloc__(self):
-        if self.proj4 != NULL:
-            pj_free(self.proj4)
-
     def __init__(self, proj4_params, globe=None):
         """
         Parameters
@@ -184,12 +266,10 @@ cdef class CRS:
             else:
                 init_items.append('+{}'.format(k))
         self.proj4_init = ' '.join(init_items) + ' +no_defs'
-        proj4_init_bytes = six.b(self.proj4_init)
-        if self.proj4 != NULL:
-            pj_free(self.proj4)
-        self.proj4 = pj_init_plus(proj4_init_bytes)
-        if not self.proj4:
-            raise Proj4Error()
+        # Equal CRSs share a single proj handle, which is kept alive by the
+        # reference to its owner.
+        self.proj4_handle = _proj_handle(self.proj4_init)
+        self.proj4 = (<_ProjHandle>self.proj4_handle).proj4
 
     # Cython uses this method instead of the normal rich comparisons.
     def __richcmp__(self, other, op):
@@ -297,34 +377,16 @@ cdef class CRS:
         (x, y) in this coordinate system
 
         """
-        cdef:
-            double cx, cy
-            int status
-        cx = x
-        cy = y
-        if src_crs.is_geodetic():
-            cx *= DEG_TO_RAD
-            cy *= DEG_TO_RAD
-        status = pj_transform(src_crs.proj4, self.proj4, 1, 1, &cx, &cy, NULL);
-
-        if trap and status == -14 or status == -20:
-            # -14 => "latitude or longitude exceeded limits"
-            # -20 => "tolerance condition error"
-            cx = cy = NAN
-        elif trap and status != 0:
-            raise Proj4Error()
-
-        if self.is_geodetic():
-            cx *= RAD_TO_DEG
-            cy *= RAD_TO_DEG
-        return (cx, cy)
+        return Transformer.from_crs(src_crs, self).transform_point(x, y,
+                                                                   trap=trap)
 
     def transform_points(self, CRS src_crs not None,
                                 np.ndarray x not None,
                                 np.ndarray y not None,
-                                np.ndarray z=None):
+                                np.ndarray z=None,
+                                out=None, threads=None):
         """
-        transform_points(src_crs, x, y[, z])
+        transform_points(src_crs, x, y[, z, out=None, threads=None])
 
         Transform the given coordinates, in the given source
         coordinate system (``src_crs``), to this coordinate system.
@@ -344,66 +406,59 @@ cdef class CRS:
             the z coordinates (array), in ``src_crs`` coordinates, to
             transform.  Defaults to None.
             If supplied, its shape must match that of x.
+        out: optional
+            A C-contiguous float64 array of shape ``x.shape + (3, )`` (or
+            ``(x.size, 3)``) into which the result is written. Defaults to
+            None, in which case a new array is allocated.
+        threads: optional
+            If given, the transformation is done without holding the GIL,
+            using a private proj context per thread, making it safe to call
+            concurrently. If greater than 1, the points are split into
+            chunks which are transformed by that many worker threads.
+            Defaults to None, in which case the transformation is done in
+            the calling thread while holding the GIL.
 
         Returns
         -------
             Array of shape ``x.shape + (3, )`` in this coordinate system.
 
         """
-        cdef np.ndarray[np.double_t, ndim=2] result
+        return Transformer.from_crs(src_crs, self).transform_points(
+            x, y, z, out=out, threads=threads)
 
-        result_shape = tuple(x.shape[i] for i in range(x.ndim)) + (3, )
-
-        if z is None:
-            if x.ndim > 2 or y.ndim > 2:
-                raise ValueError('x and y arrays must be 1 or 2 dimensional')
-            elif x.ndim != 1 or y.ndim != 1:
-                x, y = x.flatten(), y.flatten()
-
-            if x.shape[0] != y.shape[0]:
-                raise ValueError('x and y arrays must have the same length')
-        else:
-            if x.ndim > 2 or y.ndim > 2 or z.ndim > 2:
-                raise ValueError('x, y and z arrays must be 1 or 2 '
-                                 'dimensional')
-            elif x.ndim != 1 or y.ndim != 1 or z.ndim != 1:
-                x, y, z = x.flatten(), y.flatten(), z.flatten()
+    def transform_coords(self, CRS src_crs not None, np.ndarray coords not None,
+                         np.ndarray out=None):
+        """
+        transform_coords(src_crs, coords, out=None)
 
-            if not x.shape[0] == y.shape[0] == z.shape[0]:
-                raise ValueError('x, y, and z arrays must have the same '
-                                 'length')
+        Transform the given array of interleaved coordinates, in the given
+        source coordinate system (``src_crs``), to this coordinate system.
 
-        npts = x.shape[0]
+        Unlike :meth:`transform_points`, the coordinates are transformed
+        directly in the (possibly strided) memory of the output array, so
+        no intermediate arrays are created.
 
-        result = np.empty([npts, 3], dtype=np.double)
-        if src_crs.is_geodetic():
-            result[:, 0] = np.deg2rad(x)
-            result[:, 1] = np.deg2rad(y)
-        else:
-            result[:, 0] = x
-            result[:, 1] = y
-        # if a z has been given, put it in the result array which will be
-        # transformed in-place
-        if z is None:
-            result[:, 2] = 0
-        else:
-            result[:, 2] = z
-
-        # call proj. The result array is modified in place. This is only
-        # safe if npts is not 0.
-        if npts:
-            status = pj_transform(src_crs.proj4, self.proj4, npts, 3,
-                                  &result[0, 0], &result[0, 1], &result[0, 2])
-
-        if self.is_geodetic():
-            result[:, :2] = np.rad2deg(result[:, :2])
-        #if status:
-        #    raise Proj4Error()
+        Parameters
+        ----------
+        src_crs
+            instance of :class:`CRS` that represents the
+            coordinate system of ``coords``.
+        coords
+            An (N, 2) array of x and y coordinates, or an (N, 3) array of x,
+            y and z coordinates, in ``src_crs`` coordinates.
+        out: optional
+            A float64 array of the same shape as ``coords`` into which the
+            transformed coordinates are written. This may be ``coords``
+            itself, to transform in place. Defaults to None, in which case
+            a new array is allocated.
 
-        if len(result_shape) > 2:
-            return result.reshape(result_shape)
+        Returns
+        -------
+            Array of the same shape as ``coords`` in this coordinate system.
 
-        return result
+        """
+        return Transformer.from_crs(src_crs, self).transform_coords(
+            coords, out=out)
 
     def transform_vectors(self, src_proj, x, y, u, v):
         """
@@ -449,32 +504,43 @@ cdef class CRS:
             raise ValueError('x, y, u and v arrays must be the same shape')
         if x.ndim not in (1, 2):
             raise ValueError('x, y, u and v must be 1 or 2 dimensional')
-        # Transform the coordinates to the target projection.
-        proj_xyz = self.transform_points(src_proj, x, y)
-        target_x, target_y = proj_xyz[..., 0], proj_xyz[..., 1]
-        # Rotate the input vectors to the projection.
-        #
-        # 1: Find the magnitude and direction of the input vectors.
-        vector_magnitudes = (u**2 + v**2)**0.5
-        vector_angles = np.arctan2(v, u)
-        # 2: Find a point in the direction of the original vector that is
-        #    a small distance away from the base point of the vector (near
-        #    the poles the point may have to be in the opposite direction
-        #    to be valid).
+        npts = x.size
+        # The base point of each vector, and a point a small distance away
+        # in its direction, are held in a single buffer, so that they are
+        # all transformed to this projection in one call, in place.
+        points = np.empty((2 * npts, 3), dtype=np.double)
+        base = points[:npts]
+        perturbed = points[npts:]
+        # 1: Apply the native transform to the input coordinates to make
+        #    sure they are in the appropriate range of the source projection.
+        src_proj.transform_points(src_proj, x.ravel(), y.ravel(), out=base)
+        source_x, source_y = base[:, 0], base[:, 1]
+        # 2: Find a perturbation of each point, a small distance in the
+        #    direction of its vector (eastward for a vector of zero
+        #    magnitude).
         factor = 360000.
         delta = (src_proj.x_limits[1] - src_proj.x_limits[0]) / factor
-        x_perturbations = delta * np.cos(vector_angles)
-        y_perturbations = delta * np.sin(vector_angles)
+        vector_magnitudes = np.hypot(u, v)
+        magnitudes = np.ma.getdata(vector_magnitudes).ravel()
+        x_perturbations = perturbed[:, 0]
+        y_perturbations = perturbed[:, 1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(np.ma.getdata(u).ravel(), magnitudes,
+                      out=x_perturbations)
+            np.divide(np.ma.getdata(v).ravel(), magnitudes,
+                      out=y_perturbations)
+        zero_vectors = magnitudes == 0
+        x_perturbations[zero_vectors] = 1
+        y_perturbations[zero_vectors] = 0
+        x_perturbations *= delta
+        y_perturbations *= delta
         # 3: Handle points that are invalid. These come from picking a new
-        #    point that is outside the domain of the CRS. The first step is
-        #    to apply the native transform to the input coordinates to make
-        #    sure they are in the appropriate range. Then detect all the
+        #    point that is outside the domain of the CRS. Detect all the
         #    coordinates where the perturbation takes the point out of the
         #    valid x-domain and fix them. After that do the same for points
         #    that are outside the valid y-domain, which may reintroduce some
-        #    points outside of the valid x-domain
-        proj_xyz = src_proj.transform_points(src_proj, x, y)
-        source_x, source_y = proj_xyz[..., 0], proj_xyz[..., 1]
+        #    points outside of the valid x-domain.
+        #
         #    Detect all the coordinates where the perturbation takes the point
         #    outside of the valid x-domain, and reverse the direction of the
         #    perturbation to fix this.
@@ -507,26 +573,267 @@ cdef class CRS:
         if problem_points.any():
             warnings.warn('Some vectors at source domain corners '
                           'may not have been transformed correctly')
-        # 4: Transform this set of points to the projection coordinates and
-        #    find the angle between the base point and the perturbed point
-        #    in the projection coordinates (reversing the direction at any
-        #    points where the original was reversed in step 3).
-        proj_xyz = self.transform_points(src_proj,
-                                         source_x + x_perturbations,
-                                         source_y + y_perturbations)
-        target_x_perturbed = proj_xyz[..., 0]
-        target_y_perturbed = proj_xyz[..., 1]
-        projected_angles = np.arctan2(target_y_perturbed - target_y,
-                                      target_x_perturbed - target_x)
+        # 4: Transform the base and perturbed points to the projection
+        #    coordinates together.
+        perturbed[:, 0] += source_x
+        perturbed[:, 1] += source_y
+        perturbed[:, 2] = base[:, 2]
+        self.transform_coords(src_proj, points, out=points)
+        # 5: Form the projected vector components, in the direction from
+        #    the base point to the perturbed point in the projection
+        #    coordinates (reversing the direction at any points where the
+        #    original was reversed in step 3), preserving the magnitude of
+        #    the original vectors.
+        target_dx = perturbed[:, 0]
+        target_dx -= base[:, 0]
+        target_dy = perturbed[:, 1]
+        target_dy -= base[:, 1]
+        lengths = np.hypot(target_dx, target_dy)
+        zero_lengths = lengths == 0
+        target_dx[zero_lengths] = lengths[zero_lengths] = 1
         if reversed_vectors.any():
-            projected_angles[reversed_vectors] += np.pi
-        # 5: Form the projected vector components, preserving the magnitude
-        #    of the original vectors.
-        projected_u = vector_magnitudes * np.cos(projected_angles)
-        projected_v = vector_magnitudes * np.sin(projected_angles)
+            lengths[reversed_vectors] *= -1
+        scale = vector_magnitudes / lengths.reshape(x.shape)
+        projected_u = target_dx.reshape(x.shape) * scale
+        projected_v = target_dy.reshape(x.shape) * scale
         return projected_u, projected_v
 
 
+#: The maximum number of :class:`Transformer` instances which are memoized
+#: by :meth:`Transformer.from_crs`.
+_TRANSFORMER_CACHE_SIZE = 64
+_TRANSFORMER_CACHE = OrderedDict()
+
+
+cdef class Transformer:
+    """
+    Transform coordinates from one :class:`CRS` to another.
+
+    The properties of the CRS pair which are needed for every
+    transformation, such as whether each CRS is geodetic, are determined
+    once when the transformer is created. Use :meth:`Transformer.from_crs`
+    to obtain a memoized instance for a CRS pair.
+
+    """
+    cdef readonly CRS src_crs
+    cdef readonly CRS dest_crs
+    cdef readonly bint src_geodetic
+    cdef readonly bint dest_geodetic
+
+    def __init__(self, CRS src_crs not None, CRS dest_crs not None):
+        """
+        Parameters
+        ----------
+        src_crs
+            The :class:`CRS` of the coordinates to be transformed.
+        dest_crs
+            The :class:`CRS` of the transformed coordinates.
+
+        """
+        self.src_crs = src_crs
+        self.dest_crs = dest_crs
+        self.src_geodetic = src_crs.is_geodetic()
+        self.dest_geodetic = dest_crs.is_geodetic()
+
+    @staticmethod
+    def from_crs(CRS src_crs not None, CRS dest_crs not None):
+        """
+        Return a :class:`Transformer` from ``src_crs`` to ``dest_crs``.
+
+        Transformers are memoized on the ``proj4_init`` of the CRS pair, so
+        that repeated transformations between the same pair of coordinate
+        systems share one transformer.
+
+        """
+        key = (src_crs.proj4_init, dest_crs.proj4_init)
+        transformer = _TRANSFORMER_CACHE.pop(key, None)
+        if transformer is None:
+            transformer = Transformer(src_crs, dest_crs)
+            if len(_TRANSFORMER_CACHE) >= _TRANSFORMER_CACHE_SIZE:
+                _TRANSFORMER_CACHE.popitem(last=False)
+        # (Re-)insert the transformer as the most recently used.
+        _TRANSFORMER_CACHE[key] = transformer
+        return transformer
+
+    def __repr__(self):
+        return '<{} {!r} -> {!r}>'.format(self.__class__.__name__,
+                                          self.src_crs.proj4_init,
+                                          self.dest_crs.proj4_init)
+
+    def transform_point(self, double x, double y, trap=True):
+        """
+        Transform a single coordinate pair.
+
+        See :meth:`CRS.transform_point`.
+
+        """
+        cdef:
+            double cx, cy
+            int status
+        cx = x
+        cy = y
+        if self.src_geodetic:
+            cx *= DEG_TO_RAD
+            cy *= DEG_TO_RAD
+        status = pj_transform(self.src_crs.proj4, self.dest_crs.proj4, 1, 1,
+                              &cx, &cy, NULL);
+
+        if trap and status == -14 or status == -20:
+            # -14 => "latitude or longitude exceeded limits"
+            # -20 => "tolerance condition error"
+            cx = cy = NAN
+        elif trap and status != 0:
+            raise Proj4Error()
+
+        if self.dest_geodetic:
+            cx *= RAD_TO_DEG
+            cy *= RAD_TO_DEG
+        return (cx, cy)
+
+    def transform_points(self, np.ndarray x not None, np.ndarray y not None,
+                         np.ndarray z=None, out=None, threads=None):
+        """
+        Transform arrays of coordinates.
+
+        See :meth:`CRS.transform_points`.
+
+        """
+        cdef np.ndarray[np.double_t, ndim=2] result
+
+        result_shape = tuple(x.shape[i] for i in range(x.ndim)) + (3, )
+
+        if z is None:
+            if x.ndim > 2 or y.ndim > 2:
+                raise ValueError('x and y arrays must be 1 or 2 dimensional')
+            elif x.ndim != 1 or y.ndim != 1:
+                x, y = x.ravel(), y.ravel()
+
+            if x.shape[0] != y.shape[0]:
+                raise ValueError('x and y arrays must have the same length')
+        else:
+            if x.ndim > 2 or y.ndim > 2 or z.ndim > 2:
+                raise ValueError('x, y and z arrays must be 1 or 2 '
+                                 'dimensional')
+            elif x.ndim != 1 or y.ndim != 1 or z.ndim != 1:
+                x, y, z = x.ravel(), y.ravel(), z.ravel()
+
+            if not x.shape[0] == y.shape[0] == z.shape[0]:
+                raise ValueError('x, y, and z arrays must have the same '
+                                 'length')
+
+        npts = x.shape[0]
+
+        if out is None:
+            result = np.empty([npts, 3], dtype=np.double)
+        else:
+            if (not isinstance(out, np.ndarray) or
+                    out.dtype != np.double or
+                    not out.flags.c_contiguous or
+                    out.shape not in (result_shape, (npts, 3))):
+                raise ValueError('out must be a C-contiguous float64 array '
+                                 'of shape {}'.format(result_shape))
+            result = out.reshape(npts, 3)
+
+        # Fill the result array, which will then be transformed in-place,
+        # without creating any temporary arrays.
+        if self.src_geodetic:
+            np.deg2rad(x, out=result[:, 0])
+            np.deg2rad(y, out=result[:, 1])
+        else:
+            result[:, 0] = x
+            result[:, 1] = y
+        if z is None:
+            result[:, 2] = 0
+        else:
+            result[:, 2] = z
+
+        # call proj. The result array is modified in place. This is only
+        # safe if npts is not 0.
+        if threads is None:
+            if npts:
+                status = pj_transform(self.src_crs.proj4, self.dest_crs.proj4,
+                                      npts, 3, &result[0, 0], &result[0, 1],
+                                      &result[0, 2])
+        else:
+            src_init = six.b(self.src_crs.proj4_init)
+            dest_init = six.b(self.dest_crs.proj4_init)
+            threads = max(1, min(int(threads), npts))
+            if threads == 1:
+                _transform_in_context(src_init, dest_init, result)
+            else:
+                chunks = np.array_split(result, threads)
+                with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=threads) as executor:
+                    futures = [executor.submit(_transform_in_context,
+                                               src_init, dest_init, chunk)
+                               for chunk in chunks]
+                    for future in futures:
+                        future.result()
+
+        if self.dest_geodetic:
+            np.rad2deg(result[:, :2], out=result[:, :2])
+        #if status:
+        #    raise Proj4Error()
+
+        if out is not None:
+            return out
+
+        if len(result_shape) > 2:
+            return result.reshape(result_shape)
+
+        return result
+
+    def transform_coords(self, np.ndarray coords not None,
+                         np.ndarray out=None):
+        """
+        Transform an array of interleaved coordinates.
+
+        See :meth:`CRS.transform_coords`.
+
+        """
+        cdef:
+            double[:, :] view
+            double *z_ptr = NULL
+            long npts
+            int point_offset
+
+        if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+            raise ValueError('coords must be an (N, 2) or (N, 3) array')
+
+        if out is None:
+            out = np.array(coords, dtype=np.double)
+        else:
+            shape = (coords.shape[0], coords.shape[1])
+            if (out.dtype != np.double or out.ndim != 2 or
+                    (out.shape[0], out.shape[1]) != shape):
+                raise ValueError('out must be a float64 array of shape '
+                                 '{}'.format(shape))
+            if out is not coords:
+                out[...] = coords
+
+        npts = out.shape[0]
+        if npts == 0:
+            return out
+
+        view = out
+        if view.strides[0] % sizeof(double) or view.strides[1] % sizeof(double):
+            raise ValueError('out must be aligned to its float64 items')
+        point_offset = view.strides[0] // sizeof(double)
+        if out.shape[1] == 3:
+            z_ptr = &view[0, 2]
+
+        if self.src_geodetic:
+            out[:, :2] *= DEG_TO_RAD
+
+        pj_transform(self.src_crs.proj4, self.dest_crs.proj4, npts,
+                     point_offset, &view[0, 0], &view[0, 1], z_ptr)
+
+        if self.dest_geodetic:
+            out[:, :2] *= RAD_TO_DEG
+
+        return out
+
+
 class Geodetic(CRS):
     """
     Define a latitude/longitude coordinate system with spherical topology,
@@ -23,11 +23,15 @@ This file declares the Proj API, version 4.
 
 cdef extern from "proj_api.h":
     ctypedef void *projPJ
+    ctypedef void *projCtx
     ctypedef struct projLP:
         double u
         double v
 
     projPJ pj_init_plus(char *) nogil
+    projPJ pj_init_plus_ctx(projCtx, char *) nogil
+    projCtx pj_ctx_alloc() nogil
+    void pj_ctx_free(projCtx) nogil
     void pj_free(projPJ) nogil
     void pj_get_spheroid_defn(projPJ, double *, double *) nogil
     int pj_transform(projPJ, projPJ, long, int, double *, double *, double *) nogil
@@ -25,6 +25,7 @@ between them.
 from __future__ import (absolute_import, division, print_function)
 
 from abc import ABCMeta, abstractproperty
+from collections import OrderedDict
 import math
 import warnings
 
@@ -36,10 +37,17 @@ import six
 from cartopy._crs import (CRS, Geodetic, Globe, PROJ4_VERSION,
                           WGS84_SEMIMAJOR_AXIS, WGS84_SEMIMINOR_AXIS)
 from cartopy._crs import Geocentric  # noqa: F401 (flake8 = unused import)
+from cartopy._crs import Transformer  # noqa: F401 (flake8 = unused import)
 import cartopy.trace
 
 
-__document_these__ = ['CRS', 'Geocentric', 'Geodetic', 'Globe']
+__document_these__ = ['CRS', 'Geocentric', 'Geodetic', 'Globe', 'Transformer']
+
+
+#: The maximum number of projection boundaries for which the derived
+#: geometries (domain, oriented boundaries etc.) are kept.
+_BOUNDARY_GEOMETRY_CACHE_SIZE = 64
+_BOUNDARY_GEOMETRY_CACHE = OrderedDict()
 
 
 class RotatedGeodetic(CRS):
@@ -116,31 +124,86 @@ class Projection(six.with_metaclass(ABCMeta, CRS)):
         pass
 
     @property
-    def cw_boundary(self):
+    def _boundary_geometries(self):
+        """
+        A dictionary of the geometries derived from :attr:`boundary`, which
+        is shared between all the projections that have an identical
+        boundary.
+
+        """
         try:
-            boundary = self._cw_boundary
+            geometries = self._shared_boundary_geometries
         except AttributeError:
+            key = self.boundary.wkb
+            cache = _BOUNDARY_GEOMETRY_CACHE
+            geometries = cache.pop(key, None)
+            if geometries is None:
+                geometries = {}
+                if len(cache) >= _BOUNDARY_GEOMETRY_CACHE_SIZE:
+                    cache.popitem(last=False)
+            # (Re-)insert the geometries as the most recently used.
+            cache[key] = geometries
+            self._shared_boundary_geometries = geometries
+        return geometries
+
+    @property
+    def cw_boundary(self):
+        geometries = self._boundary_geometries
+        boundary = geometries.get('cw_boundary')
+        if boundary is None:
             boundary = sgeom.LinearRing(self.boundary)
-            self._cw_boundary = boundary
+            geometries['cw_boundary'] = boundary
         return boundary
 
     @property
     def ccw_boundary(self):
-        try:
-            boundary = self._ccw_boundary
-        except AttributeError:
+        geometries = self._boundary_geometries
+        boundary = geometries.get('ccw_boundary')
+        if boundary is None:
             boundary = sgeom.LinearRing(self.boundary.coords[::-1])
-            self._ccw_boundary = boundary
+            geometries['ccw_boundary'] = boundary
         return boundary
 
     @property
     def domain(self):
-        try:
-            domain = self._domain
-        except AttributeError:
-            domain = self._domain = sgeom.Polygon(self.boundary)
+        geometries = self._boundary_geometries
+        domain = geometries.get('domain')
+        if domain is None:
+            domain = geometries['domain'] = sgeom.Polygon(self.boundary)
         return domain
 
+    @property
+    def _prepared_domain(self):
+        """
+        The GEOS prepared form of :attr:`domain`, shared between all the
+        geometry projections into this projection.
+
+        """
+        geometries = self._boundary_geometries
+        prepared = geometries.get('prepared_domain')
+        if prepared is None:
+            prepared = cartopy.trace.PreparedDomain(self.domain)
+            geometries['prepared_domain'] = prepared
+        return prepared
+
+    def _boundary_points(self, is_ccw):
+        """
+        Return a list of ``(distance, point)`` pairs for the vertices of the
+        ccw (or cw) boundary, where distance is that along the boundary.
+
+        """
+        geometries = self._boundary_geometries
+        key = 'ccw_boundary_points' if is_ccw else 'cw_boundary_points'
+        points = geometries.get(key)
+        if points is None:
+            boundary = self.ccw_boundary if is_ccw else self.cw_boundary
+            points = []
+            for xy in boundary.coords[:-1]:
+                point = sgeom.Point(*xy)
+                points.append((boundary.project(point), point))
+            geometries[key] = points
+        return points
+
     def _determine_longitude_bounds(self, central_longitude):
         # In new proj, using exact limits will wrap-around, so subtract a
         # small epsilon:
@@ -226,13 +289,21 @@ class Projection(six.with_metaclass(ABCMeta, CRS)):
         returns a list of LinearRings and a single MultiLineString.
 
         """
-        debug = False
         # 1) Resolve the initial lines into projected segments
         # 1abc
         # def23ghi
         # jkl41
         multi_line_string = cartopy.trace.project_linear(linear_ring,
                                                          src_crs, self)
+        return self._split_projected_ring(multi_line_string)
+
+    def _split_projected_ring(self, multi_line_string):
+        """
+        Return a list of LinearRings and a single MultiLineString from the
+        MultiLineString which results from projecting a LinearRing.
+
+        """
+        debug = False
 
         # Threshold for whether a point is close enough to be the same
         # point as another.
@@ -316,8 +387,7 @@ class Projection(six.with_metaclass(ABCMeta, CRS)):
 
     def _project_multiline(self, geometry, src_crs):
         geoms = []
-        for geom in geometry.geoms:
-            r = self._project_line_string(geom, src_crs)
+        for r in cartopy.trace.project_linears(geometry.geoms, src_crs, self):
             if r:
                 geoms.extend(r.geoms)
         if geoms:
@@ -354,8 +424,10 @@ class Projection(six.with_metaclass(ABCMeta, CRS)):
         # lines.
         rings = []
         multi_lines = []
-        for src_ring in [polygon.exterior] + list(polygon.interiors):
-            p_rings, p_mline = self._project_linear_ring(src_ring, src_crs)
+        src_rings = [polygon.exterior] + list(polygon.interiors)
+        for multi_line_string in cartopy.trace.project_linears(src_rings,
+                                                               src_crs, self):
+            p_rings, p_mline = self._split_projected_ring(multi_line_string)
             if p_rings:
                 rings.extend(p_rings)
             if len(p_mline) > 0:
@@ -410,9 +482,7 @@ class Projection(six.with_metaclass(ABCMeta, CRS)):
             edge_things.append(thing)
 
         # Record the positions of all the boundary vertices
-        for xy in boundary.coords[:-1]:
-            point = sgeom.Point(*xy)
-            dist = boundary.project(point)
+        for dist, point in self._boundary_points(is_ccw):
             thing = _BoundaryPoint(dist, True, point)
             edge_things.append(thing)
 
@@ -1869,7 +1939,8 @@ class Robinson(_WarpedRectangularProjection):
             result = super(Robinson, self).transform_point(x, y, src_crs)
         return result
 
-    def transform_points(self, src_crs, x, y, z=None):
+    def transform_points(self, src_crs, x, y, z=None, out=None,
+                         threads=None):
         """
         Capture and handle NaNs in input points -- else as parent function,
         :meth:`_WarpedRectangularProjection.transform_points`.
@@ -1894,10 +1965,38 @@ class Robinson(_WarpedRectangularProjection):
             y[input_point_nans] = 0.0
             if z is not None:
                 z[input_point_nans] = 0.0
-        result = super(Robinson, self).transform_points(src_crs, x, y, z)
+        result = super(Robinson, self).transform_points(src_crs, x, y, z,
+                                                        out=out,
+                                                        threads=threads)
         if handle_nans:
-            # Result always has shape (N, 3).
             # Blank out each (whole) point where we had a NaN in the input.
+            # The result may have the shape of the input, or be (N, 3).
+            result.reshape(-1, 3)[input_point_nans.ravel()] = np.nan
+        return result
+
+    def transform_coords(self, src_crs, coords, out=None):
+        """
+        Capture and handle NaNs in input points -- else as parent function,
+        :meth:`_WarpedRectangularProjection.transform_coords`.
+
+        Needed because input NaNs can trigger a fatal error in the underlying
+        implementation of the Robinson projection. Any point that contains a
+        NaN is invalidated.
+
+        """
+        input_point_nans = np.isnan(coords).any(axis=1)
+        handle_nans = np.any(input_point_nans)
+        if handle_nans:
+            # Remove NaN points from the data to transform to avoid the error.
+            if out is None:
+                out = np.array(coords, dtype=np.double)
+            elif out is not coords:
+                out[...] = coords
+            out[input_point_nans] = 0.0
+            coords = out
+        result = super(Robinson, self).transform_coords(src_crs, coords,
+                                                        out=out)
+        if handle_nans:
             result[input_point_nans] = np.nan
         return result
 
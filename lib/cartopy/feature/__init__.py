@@ -26,6 +26,7 @@ from abc import ABCMeta, abstractmethod
 
 import numpy as np
 import shapely.geometry as sgeom
+from shapely.strtree import STRtree
 import six
 
 import cartopy.io.shapereader as shapereader
@@ -46,8 +47,8 @@ feature being plotted.
 
 _NATURAL_EARTH_GEOM_CACHE = {}
 """
-Caches a mapping between (name, category, scale) and a tuple of the
-resulting geometries.
+Caches a mapping between (name, category, scale) and a
+:class:`_GeometryIndex` of the resulting geometries.
 
 Provides a significant performance benefit (when combined with object id
 caching in GeoAxes.add_geometries) when producing multiple maps of the
@@ -56,6 +57,57 @@ same projection.
 """
 
 
+class _GeometryIndex(object):
+    """
+    An immutable sequence of geometries, with a lazily built bounding box
+    spatial index for finding the geometries which intersect a given
+    geometry.
+
+    """
+    def __init__(self, geometries):
+        self.geometries = tuple(geometries)
+        self._tree = None
+        self._tree_geometries = None
+        self._positions = None
+
+    def __iter__(self):
+        return iter(self.geometries)
+
+    def __len__(self):
+        return len(self.geometries)
+
+    def _build(self):
+        # None and empty geometries can never intersect anything, and
+        # cannot be put in the tree.
+        self._tree_geometries = [geom for geom in self.geometries
+                                 if geom is not None and not geom.is_empty]
+        # The same geometry may appear more than once.
+        self._positions = {}
+        for i, geom in enumerate(self.geometries):
+            self._positions.setdefault(id(geom), []).append(i)
+        if self._tree_geometries:
+            self._tree = STRtree(self._tree_geometries)
+
+    def intersecting(self, geometry):
+        """
+        Return a list of the geometries which intersect the given geometry,
+        in their original order.
+
+        """
+        if self._positions is None:
+            self._build()
+        if self._tree is None:
+            return []
+        candidates = self._tree.query(geometry)
+        if isinstance(candidates, np.ndarray):
+            # Newer versions of shapely return the indices of the matches.
+            candidates = [self._tree_geometries[i] for i in candidates]
+        positions = sorted(set(i for geom in candidates
+                               for i in self._positions[id(geom)]))
+        return [self.geometries[i] for i in positions
+                if geometry.intersects(self.geometries[i])]
+
+
 class Feature(six.with_metaclass(ABCMeta)):
     """
     Represents a collection of points, lines and polygons with convenience
@@ -122,6 +174,17 @@ class Feature(six.with_metaclass(ABCMeta)):
         else:
             return self.geometries()
 
+    def _persistent_key(self):
+        """
+        Return a hashable which identifies the current geometries of this
+        feature between sessions, or None if they cannot be identified.
+
+        Features which return a key may have their projected paths persisted
+        in the ``feature_cache_dir`` of :data:`cartopy.config`.
+
+        """
+        return None
+
 
 class Scaler(object):
     """
@@ -228,11 +291,18 @@ class ShapelyFeature(Feature):
 
         """
         super(ShapelyFeature, self).__init__(crs, **kwargs)
-        self._geoms = tuple(geometries)
+        self._geoms = _GeometryIndex(geometries)
 
     def geometries(self):
         return iter(self._geoms)
 
+    def intersecting_geometries(self, extent):
+        if extent is None:
+            return self.geometries()
+        extent_geom = sgeom.box(extent[0], extent[2],
+                                extent[1], extent[3])
+        return iter(self._geoms.intersecting(extent_geom))
+
 
 class NaturalEarthFeature(Feature):
     """
@@ -275,9 +345,10 @@ class NaturalEarthFeature(Feature):
     def scale(self):
         return self.scaler.scale
 
-    def geometries(self):
+    def _geometry_index(self):
         """
-        Returns an iterator of (shapely) geometries for this feature.
+        Return the (cached) :class:`_GeometryIndex` of the geometries of
+        this feature at its current scale.
 
         """
         key = (self.name, self.category, self.scale)
@@ -285,12 +356,18 @@ class NaturalEarthFeature(Feature):
             path = shapereader.natural_earth(resolution=self.scale,
                                              category=self.category,
                                              name=self.name)
-            geometries = tuple(shapereader.Reader(path).geometries())
+            geometries = _GeometryIndex(shapereader.Reader(path).geometries())
             _NATURAL_EARTH_GEOM_CACHE[key] = geometries
         else:
             geometries = _NATURAL_EARTH_GEOM_CACHE[key]
+        return geometries
 
-        return iter(geometries)
+    def geometries(self):
+        """
+        Returns an iterator of (shapely) geometries for this feature.
+
+        """
+        return iter(self._geometry_index())
 
     def intersecting_geometries(self, extent):
         """
@@ -300,7 +377,19 @@ class NaturalEarthFeature(Feature):
         If extent is None, the method returns all geometries for this dataset.
         """
         self.scaler.scale_from_extent(extent)
-        return super(NaturalEarthFeature, self).intersecting_geometries(extent)
+        if extent is None:
+            return self.geometries()
+        extent_geom = sgeom.box(extent[0], extent[2],
+                                extent[1], extent[3])
+        return self._intersecting_geometries(extent_geom)
+
+    def _intersecting_geometries(self, extent_geom):
+        # A generator, so that the geometries are only loaded once needed.
+        for geom in self._geometry_index().intersecting(extent_geom):
+            yield geom
+
+    def _persistent_key(self):
+        return ('natural_earth', self.category, self.name, self.scale)
 
     def with_scale(self, new_scale):
         """
@@ -343,9 +432,10 @@ class GSHHSFeature(Feature):
 
     _geometries_cache = {}
     """
-    A mapping from scale and level to GSHHS shapely geometry::
+    A mapping from scale and level to a :class:`_GeometryIndex` of GSHHS
+    shapely geometries::
 
-        {(scale, level): geom}
+        {(scale, level): geoms}
 
     This provides a performance boost when plotting in interactive mode or
     instantiating multiple GSHHS artists, by reducing repeated file IO.
@@ -416,11 +506,12 @@ class GSHHSFeature(Feature):
                 # Load GSHHS geometries from appropriate shape file.
                 # TODO selective load based on bbox of each geom in file.
                 path = shapereader.gshhs(scale, level)
-                geoms = tuple(shapereader.Reader(path).geometries())
+                geoms = _GeometryIndex(shapereader.Reader(path).geometries())
                 GSHHSFeature._geometries_cache[(scale, level)] = geoms
+            if extent is not None:
+                geoms = geoms.intersecting(extent_geom)
             for geom in geoms:
-                if extent is None or extent_geom.intersects(geom):
-                    yield geom
+                yield geom
 
 
 class WFSFeature(Feature):
@@ -68,7 +68,19 @@ def mesh_projection(projection, nx, ny,
         ``(x-lower, x-upper, y-lower, y-upper)``.
 
     """
+    x, y, extent = _mesh_points(projection, nx, ny, x_extents, y_extents)
 
+    # Generate the x-direction and y-direction meshgrids.
+    x, y = np.meshgrid(x, y)
+    return x, y, extent
+
+
+def _mesh_points(projection, nx, ny, x_extents, y_extents):
+    """
+    Return the x-direction and y-direction sample points, and extent, of
+    :func:`mesh_projection` as 1-dimensional arrays.
+
+    """
     # Establish the x-direction and y-direction extents.
     x_lower = x_extents[0] or projection.x_limits[0]
     x_upper = x_extents[1] or projection.x_limits[1]
@@ -94,8 +106,6 @@ def mesh_projection(projection, nx, ny,
     x += 0.5 * xstep
     y += 0.5 * ystep
 
-    # Generate the x-direction and y-direction meshgrids.
-    x, y = np.meshgrid(x, y)
     return x, y, [x_lower, x_upper, y_lower, y_upper]
 
 
@@ -126,7 +136,7 @@ def warp_img(fname, target_proj, source_proj=None, target_res=(400, 200)):
 
 def warp_array(array, target_proj, source_proj=None, target_res=(400, 200),
                source_extent=None, target_extent=None,
-               mask_extrapolated=False):
+               mask_extrapolated=False, method='nearest'):
     """
     Regrid the data array from the source projection to the target projection.
 
@@ -155,6 +165,9 @@ def warp_array(array, target_proj, source_proj=None, target_res=(400, 200),
         Assume that the source coordinate is rectilinear and so mask the
         resulting target grid values which lie outside the source grid
         domain.
+    method: optional
+        The regridding method, one of ``'nearest'``, ``'bilinear'`` or
+        ``'area'``. See :class:`Regridder`. Defaults to ``'nearest'``.
 
     Returns
     -------
@@ -182,9 +195,12 @@ def warp_array(array, target_proj, source_proj=None, target_res=(400, 200),
         source_proj = ccrs.PlateCarree()
 
     ny, nx = array.shape[:2]
-    source_native_xy = mesh_projection(source_proj, nx, ny,
-                                       x_extents=source_x_extents,
-                                       y_extents=source_y_extents)
+    source_x, source_y, source_extent = _mesh_points(
+        source_proj, nx, ny, source_x_extents, source_y_extents)
+    # The regular source mesh is only needed for its shape and extent, so
+    # use read-only views of the sample points rather than copying them to
+    # an array as large as the source array.
+    source_x, source_y = np.meshgrid(source_x, source_y, copy=False)
 
     # XXX Take into account the extents of the original to determine
     # target_extents?
@@ -192,16 +208,24 @@ def warp_array(array, target_proj, source_proj=None, target_res=(400, 200),
         target_proj, target_res[0], target_res[1],
         x_extents=target_x_extents, y_extents=target_y_extents)
 
-    array = regrid(array, source_native_xy[0], source_native_xy[1],
-                   source_proj, target_proj,
-                   target_native_x, target_native_y,
-                   mask_extrapolated)
+    # The source mesh is regular, so its cells can be found arithmetically.
+    regridder = Regridder(source_x, source_y, source_proj, target_proj,
+                          target_native_x, target_native_y,
+                          mask_extrapolated, source_extent=source_extent,
+                          method=method)
+    array = regridder.regrid(array)
     return array, extent
 
 
 def _determine_bounds(x_coords, y_coords, source_cs):
     # Returns bounds corresponding to one or two rectangles depending on
     # transformation between ranges.
+    # Skip the repeated points of broadcast (e.g. np.meshgrid(copy=False))
+    # coordinates.
+    x_coords, y_coords = [
+        coords[tuple(slice(None, 1) if stride == 0 else slice(None)
+                     for stride in coords.strides)]
+        for coords in (x_coords, y_coords)]
     bounds = dict(x=[])
     half_px = abs(np.diff(x_coords[:2])).max() / 2.
 
@@ -222,11 +246,224 @@ def _determine_bounds(x_coords, y_coords, source_cs):
     return bounds
 
 
+def _source_kdtree(source_x_coords, source_y_coords, source_cs):
+    """
+    Return a KD-tree of the geocentric positions of the source points.
+
+    """
+    geo_cent = source_cs.as_geocentric()
+    xyz = geo_cent.transform_points(source_cs,
+                                    source_x_coords.flatten(),
+                                    source_y_coords.flatten())
+    if _is_pykdtree:
+        kdtree = pykdtree.kdtree.KDTree(xyz)
+    else:
+        # Versions of scipy >= v0.16 added the balanced_tree argument,
+        # which caused the KDTree to hang with this input.
+        try:
+            kdtree = scipy.spatial.cKDTree(xyz, balanced_tree=False)
+        except TypeError:
+            kdtree = scipy.spatial.cKDTree(xyz)
+    return kdtree
+
+
+def _nearest_indices(kdtree, source_size, source_cs, target_proj,
+                     target_x_points, target_y_points):
+    """
+    Return the index, into the flattened source points, of the source point
+    nearest to each target point, and whether no such point was found.
+
+    """
+    geo_cent = source_cs.as_geocentric()
+    target_xyz = geo_cent.transform_points(target_proj,
+                                           target_x_points.flatten(),
+                                           target_y_points.flatten())
+    if _is_pykdtree:
+        # Use sqr_dists=True because we don't care about distances,
+        # and it saves a sqrt.
+        _, indices = kdtree.query(target_xyz, k=1, sqr_dists=True)
+    else:
+        _, indices = kdtree.query(target_xyz, k=1)
+    mask = indices >= source_size
+    indices[mask] = 0
+    return indices, mask
+
+
+def _source_cell_coords(source_shape, source_extent, source_cs,
+                        target_in_source_x, target_in_source_y):
+    """
+    Return the position of each target point (given in source coordinates)
+    within a regular source grid, in units of cells from its lower-left
+    corner, and whether the target point could not be transformed.
+
+    Also return the number of cells spanning 360 degrees of longitude, or
+    None if the source grid is not periodic.
+
+    """
+    ny, nx = source_shape
+    x_lower, x_upper, y_lower, y_upper = source_extent
+    x = target_in_source_x
+    period = None
+    if (((hasattr(source_cs, 'is_geodetic') and source_cs.is_geodetic()) or
+            isinstance(source_cs, ccrs.PlateCarree))):
+        # Use the longitudes nearest to the source grid, which may lie
+        # outside of [-180, 180].
+        x_mid = (x_lower + x_upper) / 2
+        x = x_mid + (x - x_mid + 180) % 360 - 180
+        period = 360 * nx / (x_upper - x_lower)
+
+    invalid = ~(np.isfinite(x) & np.isfinite(target_in_source_y))
+    i = (x - x_lower) * (nx / (x_upper - x_lower))
+    j = (target_in_source_y - y_lower) * (ny / (y_upper - y_lower))
+    return i, j, invalid, period
+
+
+def _regular_grid_indices(source_shape, i, j, invalid):
+    """
+    Return the index, into the flattened source grid, of the cell of a
+    regular source grid containing each target point, given the cell
+    coordinates from :func:`_source_cell_coords`.
+
+    Target points beyond the source extent use the nearest edge cell.
+
+    """
+    ny, nx = source_shape
+    i = np.where(invalid, 0, i)
+    j = np.where(invalid, 0, j)
+    i = np.clip(np.floor(i), 0, nx - 1).astype(np.intp)
+    j = np.clip(np.floor(j), 0, ny - 1).astype(np.intp)
+    return j * nx + i
+
+
+def _bilinear_weights(source_shape, i, j, invalid, period):
+    """
+    Return the indices, into the flattened source grid, and weights of the
+    four source points surrounding each target point, given the cell
+    coordinates from :func:`_source_cell_coords`.
+
+    """
+    ny, nx = source_shape
+    # The source points lie at the centre of each cell.
+    i = np.where(invalid, 0, i - 0.5)
+    j = np.where(invalid, 0, j - 0.5)
+    i0 = np.floor(i)
+    j0 = np.floor(j)
+    ti = i - i0
+    tj = j - j0
+    if period is not None and np.isclose(period, nx):
+        # The grid spans the globe, so interpolate across its seam.
+        i0 = i0 % nx
+        i1 = (i0 + 1) % nx
+    else:
+        i1 = np.clip(i0 + 1, 0, nx - 1)
+        i0 = np.clip(i0, 0, nx - 1)
+    j1 = np.clip(j0 + 1, 0, ny - 1)
+    j0 = np.clip(j0, 0, ny - 1)
+    indices = np.stack([j0 * nx + i0, j0 * nx + i1,
+                        j1 * nx + i0, j1 * nx + i1], axis=-1)
+    weights = np.stack([(1 - ti) * (1 - tj), ti * (1 - tj),
+                        (1 - ti) * tj, ti * tj], axis=-1)
+    return indices.astype(np.intp), weights
+
+
+def _cell_corners(points):
+    """
+    Return the (ny + 1, nx + 1) corners of the cells centred on the given
+    (ny, nx) points.
+
+    """
+    # Extrapolate a row and column of points beyond each edge, then
+    # average each 2x2 block of points.
+    points = np.pad(np.asarray(points, dtype=np.float64), 1,
+                    mode='reflect', reflect_type='odd')
+    return (points[:-1, :-1] + points[1:, :-1] +
+            points[:-1, 1:] + points[1:, 1:]) / 4
+
+
+def _box_bounds(corners, centres, invalid, n):
+    """
+    Return the lower and upper bounds, in one dimension of a grid of *n*
+    source cells, of the box enclosing each target cell.
+
+    Boxes are at least one source cell wide, and clipped to the grid.
+
+    """
+    lower = corners.min(axis=-1)
+    upper = corners.max(axis=-1)
+    # Target cells with corners that could not be transformed use a box
+    # around their centre.
+    bad = ~np.isfinite(lower) | ~np.isfinite(upper)
+    lower = np.where(bad, centres, lower)
+    upper = np.where(bad, centres, upper)
+    mid = (lower + upper) / 2
+    half = np.maximum((upper - lower) / 2, 0.5)
+    lower = np.where(invalid, 0, np.clip(mid - half, 0, n - 1))
+    upper = np.minimum(np.maximum(mid + half, lower + 1), n)
+    return lower, upper
+
+
+def _area_weights(source_shape, corner_i, corner_j, i, j, invalid, period):
+    """
+    Return the indices, into the flattened summed-area table of a regular
+    source grid, and weights which give the mean of the source over the box
+    enclosing each target cell.
+
+    The (ny + 1, nx + 1) corners of the target cells, and their centres,
+    are given as cell coordinates from :func:`_source_cell_coords`.
+
+    """
+    ny, nx = source_shape
+
+    def cells(corner):
+        # The four corners of each target cell.
+        return np.stack([corner[:-1, :-1], corner[:-1, 1:],
+                         corner[1:, :-1], corner[1:, 1:]], axis=-1)
+
+    corner_i = cells(corner_i)
+    corner_j = cells(corner_j)
+    if period is not None:
+        # Keep the corners of each cell on the same side of the seam of
+        # the grid as its centre.
+        corner_i = (i[..., np.newaxis] +
+                    (corner_i - i[..., np.newaxis] + period / 2) % period -
+                    period / 2)
+    i0, i1 = _box_bounds(corner_i, i, invalid, nx)
+    j0, j1 = _box_bounds(corner_j, j, invalid, ny)
+
+    def table_weights(i, j):
+        # The summed-area table of a piecewise constant field is bilinear
+        # within each cell.
+        i_floor = np.minimum(np.floor(i), nx - 1)
+        j_floor = np.minimum(np.floor(j), ny - 1)
+        ti = i - i_floor
+        tj = j - j_floor
+        base = j_floor * (nx + 1) + i_floor
+        indices = [base, base + 1, base + nx + 1, base + nx + 2]
+        weights = [(1 - ti) * (1 - tj), ti * (1 - tj),
+                   (1 - ti) * tj, ti * tj]
+        return indices, weights
+
+    indices = []
+    weights = []
+    area = (i1 - i0) * (j1 - j0)
+    for sign, box_i, box_j in [(1, i1, j1), (-1, i0, j1),
+                               (-1, i1, j0), (1, i0, j0)]:
+        corner_indices, corner_weights = table_weights(box_i, box_j)
+        indices.extend(corner_indices)
+        weights.extend(sign * weight / area for weight in corner_weights)
+    return (np.stack(indices, axis=-1).astype(np.intp),
+            np.stack(weights, axis=-1))
+
+
 def regrid(array, source_x_coords, source_y_coords, source_cs, target_proj,
-           target_x_points, target_y_points, mask_extrapolated=False):
+           target_x_points, target_y_points, mask_extrapolated=False,
+           source_extent=None, method='nearest'):
     """
     Regrid the data array from the source projection to the target projection.
 
+    To regrid many arrays between the same pair of grids, create a
+    :class:`Regridder` once and reuse it instead.
+
     Parameters
     ----------
     array
@@ -252,6 +489,11 @@ def regrid(array, source_x_coords, source_y_coords, source_cs, target_proj,
         Assume that the source coordinate is rectilinear and so mask the
         resulting target grid values which lie outside the source grid domain.
         Defaults to False.
+    source_extent: optional
+        The extent of a regular source grid. See :class:`Regridder`.
+    method: optional
+        The regridding method. See :class:`Regridder`. Defaults to
+        ``'nearest'``.
 
     Returns
     -------
@@ -259,100 +501,392 @@ def regrid(array, source_x_coords, source_y_coords, source_cs, target_proj,
         The data array regridded in the target projection.
 
     """
+    regridder = Regridder(source_x_coords, source_y_coords, source_cs,
+                          target_proj, target_x_points, target_y_points,
+                          mask_extrapolated, source_extent, method)
+    return regridder.regrid(array)
 
-    # n.b. source_cs is actually a projection (the coord system of the
-    # source coordinates), but not necessarily the native projection of
-    # the source array (i.e. you can provide a warped image with lat lon
-    # coordinates).
 
-    # XXX NB. target_x and target_y must currently be rectangular (i.e.
-    # be a 2d np array)
-    geo_cent = source_cs.as_geocentric()
-    xyz = geo_cent.transform_points(source_cs,
-                                    source_x_coords.flatten(),
-                                    source_y_coords.flatten())
-    target_xyz = geo_cent.transform_points(target_proj,
-                                           target_x_points.flatten(),
-                                           target_y_points.flatten())
+class Regridder(object):
+    """
+    Regrid data arrays from a source grid to a target grid.
 
-    if _is_pykdtree:
-        kdtree = pykdtree.kdtree.KDTree(xyz)
-        # Use sqr_dists=True because we don't care about distances,
-        # and it saves a sqrt.
-        _, indices = kdtree.query(target_xyz, k=1, sqr_dists=True)
-    else:
-        # Versions of scipy >= v0.16 added the balanced_tree argument,
-        # which caused the KDTree to hang with this input.
-        try:
-            kdtree = scipy.spatial.cKDTree(xyz, balanced_tree=False)
-        except TypeError:
-            kdtree = scipy.spatial.cKDTree(xyz)
-        _, indices = kdtree.query(target_xyz, k=1)
-    mask = indices >= len(xyz)
-    indices[mask] = 0
+    The source points (and their weights) used by every target point, and
+    whether it is masked, are computed once, when the regridder is created.
+    Each call to :meth:`regrid` is then just an indexing operation, so
+    regridding many arrays (such as the frames of an animation) between the
+    same grids is much cheaper than repeated calls to :func:`regrid`.
 
-    desired_ny, desired_nx = target_x_points.shape
+    Parameters
+    ----------
+    source_x_coords
+        A source projection :class:`numpy.ndarray` of x-direction sample
+        points.
+    source_y_coords
+        A source projection :class:`numpy.ndarray` of y-direction sample
+        points, of the same shape as *source_x_coords*.
+    source_cs
+        The source :class:`~cartopy.crs.Projection` instance.
+    target_proj
+        The target :class:`~cartopy.crs.Projection` instance.
+    target_x_points
+        A 2-dimensional target projection :class:`numpy.ndarray` of
+        x-direction sample points.
+    target_y_points
+        A 2-dimensional target projection :class:`numpy.ndarray` of
+        y-direction sample points.
+    mask_extrapolated: optional
+        Assume that the source coordinate is rectilinear and so mask the
+        resulting target grid values which lie outside the source grid domain.
+        Defaults to False.
+    source_extent: optional
+        The (x-lower, x-upper, y-lower, y-upper) extent of the source grid,
+        if it is a regular grid of cells spanning that extent, with sample
+        points at the centre of each cell (such as a grid returned by
+        :func:`mesh_projection`). The source cell containing each target
+        point is then computed arithmetically, which is much faster than
+        the nearest neighbour search otherwise used.
+    method: optional
+        The regridding method, which is one of:
+
+        * ``'nearest'``: the value of the nearest source point,
+        * ``'bilinear'``: bilinear interpolation between the four source
+          points surrounding each target point,
+        * ``'area'``: the mean of the source over the area of each target
+          cell (approximated by the box enclosing it in the source grid).
+          Target cells smaller than a source cell take the mean over a
+          source cell sized box, which is equivalent to bilinear
+          interpolation.
+
+        The bilinear and area methods require a regular source grid, given
+        by *source_extent*. Integer data is rounded to its original type.
+        Defaults to ``'nearest'``.
 
-    # Squash the first two dims of the source array into one
-    temp_array = array.reshape((-1,) + array.shape[2:])
-    if np.any(mask):
-        new_array = np.ma.array(temp_array[indices])
-        new_array[mask] = np.ma.masked
-    else:
-        new_array = temp_array[indices]
-    new_array.shape = (desired_ny, desired_nx) + (array.shape[2:])
-
-    # Do double transform to clip points that do not map back and forth
-    # to the same point to within a fixed fractional offset.
-    # XXX THIS ONLY NEEDS TO BE DONE FOR (PSEUDO-)CYLINDRICAL PROJECTIONS
-    # (OR ANY OTHERS WHICH HAVE THE CONCEPT OF WRAPPING)
-    source_desired_xyz = source_cs.transform_points(target_proj,
-                                                    target_x_points.flatten(),
-                                                    target_y_points.flatten())
-    back_to_target_xyz = target_proj.transform_points(source_cs,
-                                                      source_desired_xyz[:, 0],
-                                                      source_desired_xyz[:, 1])
-    back_to_target_x = back_to_target_xyz[:, 0].reshape(desired_ny,
-                                                        desired_nx)
-    back_to_target_y = back_to_target_xyz[:, 1].reshape(desired_ny,
-                                                        desired_nx)
-    FRACTIONAL_OFFSET_THRESHOLD = 0.1  # data has moved by 10% of the map
-
-    x_extent = np.abs(target_proj.x_limits[1] - target_proj.x_limits[0])
-    y_extent = np.abs(target_proj.y_limits[1] - target_proj.y_limits[0])
-
-    non_self_inverse_points = (((np.abs(target_x_points - back_to_target_x) /
-                                 x_extent) > FRACTIONAL_OFFSET_THRESHOLD) |
-                               ((np.abs(target_y_points - back_to_target_y) /
-                                 y_extent) > FRACTIONAL_OFFSET_THRESHOLD))
-    if np.any(non_self_inverse_points):
-        if not np.ma.isMaskedArray(new_array):
-            new_array = np.ma.array(new_array, mask=False)
-
-        new_array[non_self_inverse_points] = np.ma.masked
-
-    # Transform the target points to the source projection and mask any points
-    # that fall outside the original source domain.
-    if mask_extrapolated:
-        target_in_source_xyz = source_cs.transform_points(
-            target_proj, target_x_points, target_y_points)
-        target_in_source_x = target_in_source_xyz[..., 0]
-        target_in_source_y = target_in_source_xyz[..., 1]
-
-        bounds = _determine_bounds(source_x_coords, source_y_coords, source_cs)
-
-        outside_source_domain = ((target_in_source_y >= bounds['y'][1]) |
-                                 (target_in_source_y <= bounds['y'][0]))
-
-        tmp_inside = np.zeros_like(outside_source_domain)
-        for bound_x in bounds['x']:
-            tmp_inside = tmp_inside | ((target_in_source_x <= bound_x[1]) &
-                                       (target_in_source_x >= bound_x[0]))
-        outside_source_domain = outside_source_domain | ~tmp_inside
-
-        if np.any(outside_source_domain):
-            if not np.ma.isMaskedArray(new_array):
-                new_array = np.ma.array(new_array, mask=False)
-            new_array[outside_source_domain] = np.ma.masked
-
-    return new_array
+    """
+    #: The maximum number of target points processed at once, which bounds
+    #: the memory used by the temporary arrays of the regridding.
+    block_size = 2 ** 20
+
+    def __init__(self, source_x_coords, source_y_coords, source_cs,
+                 target_proj, target_x_points, target_y_points,
+                 mask_extrapolated=False, source_extent=None,
+                 method='nearest'):
+        # n.b. source_cs is actually a projection (the coord system of the
+        # source coordinates), but not necessarily the native projection of
+        # the source array (i.e. you can provide a warped image with lat lon
+        # coordinates).
+
+        # XXX NB. target_x and target_y must currently be rectangular (i.e.
+        # be a 2d np array)
+        if method not in ('nearest', 'bilinear', 'area'):
+            raise ValueError('Unknown regridding method {!r}.'.format(method))
+        if method != 'nearest' and source_extent is None:
+            raise ValueError('The {!r} regridding method requires the '
+                             'source_extent of a regular source '
+                             'grid.'.format(method))
+        if target_x_points.shape != target_y_points.shape:
+            raise ValueError('The target x and y points must have the same '
+                             'shape.')
+
+        #: The regridding method.
+        self.method = method
+
+        #: The shape of the source grid.
+        self.source_shape = source_x_coords.shape
+
+        #: The shape of the target grid.
+        self.shape = target_x_points.shape
+
+        desired_ny, desired_nx = self.shape
+        n_weights = {'nearest': None, 'bilinear': 4, 'area': 16}[method]
+        if n_weights is None:
+            indices = np.empty(self.shape, dtype=np.intp)
+            weights = None
+        else:
+            indices = np.empty(self.shape + (n_weights, ), dtype=np.intp)
+            weights = np.empty(self.shape + (n_weights, ))
+        mask = np.empty(self.shape, dtype=bool)
+
+        if source_extent is None:
+            kdtree = _source_kdtree(source_x_coords, source_y_coords,
+                                    source_cs)
+        elif method == 'area':
+            corner_x = _cell_corners(target_x_points)
+            corner_y = _cell_corners(target_y_points)
+        if mask_extrapolated:
+            bounds = _determine_bounds(source_x_coords, source_y_coords,
+                                       source_cs)
+
+        FRACTIONAL_OFFSET_THRESHOLD = 0.1  # data has moved by 10% of the map
+
+        x_extent = np.abs(target_proj.x_limits[1] - target_proj.x_limits[0])
+        y_extent = np.abs(target_proj.y_limits[1] - target_proj.y_limits[0])
+
+        for rows in self._blocks():
+            target_x = target_x_points[rows]
+            target_y = target_y_points[rows]
+            block_shape = target_x.shape
+            source_desired_xyz = source_cs.transform_points(
+                target_proj, target_x.flatten(), target_y.flatten())
+            target_in_source_x = source_desired_xyz[:, 0]
+            target_in_source_y = source_desired_xyz[:, 1]
+
+            if source_extent is None:
+                block_indices, block_mask = _nearest_indices(
+                    kdtree, source_x_coords.size, source_cs, target_proj,
+                    target_x, target_y)
+            else:
+                i, j, block_mask, period = _source_cell_coords(
+                    self.source_shape, source_extent, source_cs,
+                    target_in_source_x, target_in_source_y)
+                if method == 'nearest':
+                    block_indices = _regular_grid_indices(
+                        self.source_shape, i, j, block_mask)
+                elif method == 'bilinear':
+                    block_indices, block_weights = _bilinear_weights(
+                        self.source_shape, i, j, block_mask, period)
+                else:
+                    corner_rows = slice(rows.start, rows.stop + 1)
+                    corner_shape = corner_x[corner_rows].shape
+                    corners = source_cs.transform_points(
+                        target_proj, corner_x[corner_rows].flatten(),
+                        corner_y[corner_rows].flatten())
+                    corner_i, corner_j, _, _ = _source_cell_coords(
+                        self.source_shape, source_extent, source_cs,
+                        corners[:, 0], corners[:, 1])
+                    block_indices, block_weights = _area_weights(
+                        self.source_shape, corner_i.reshape(corner_shape),
+                        corner_j.reshape(corner_shape),
+                        i.reshape(block_shape), j.reshape(block_shape),
+                        block_mask.reshape(block_shape), period)
+                if weights is not None:
+                    weights[rows] = block_weights.reshape(
+                        weights[rows].shape)
+            indices[rows] = block_indices.reshape(indices[rows].shape)
+            block_mask = block_mask.reshape(block_shape)
+
+            # Do double transform to clip points that do not map back and
+            # forth to the same point to within a fixed fractional offset.
+            # XXX THIS ONLY NEEDS TO BE DONE FOR (PSEUDO-)CYLINDRICAL
+            # PROJECTIONS (OR ANY OTHERS WHICH HAVE THE CONCEPT OF WRAPPING)
+            back_to_target_xyz = target_proj.transform_points(
+                source_cs, target_in_source_x, target_in_source_y)
+            back_to_target_x = back_to_target_xyz[:, 0].reshape(block_shape)
+            back_to_target_y = back_to_target_xyz[:, 1].reshape(block_shape)
+
+            non_self_inverse_points = (
+                ((np.abs(target_x - back_to_target_x) /
+                  x_extent) > FRACTIONAL_OFFSET_THRESHOLD) |
+                ((np.abs(target_y - back_to_target_y) /
+                  y_extent) > FRACTIONAL_OFFSET_THRESHOLD))
+            block_mask |= non_self_inverse_points
+
+            # Mask any target points that fall outside the original source
+            # domain.
+            if mask_extrapolated:
+                target_in_source_x = target_in_source_x.reshape(block_shape)
+                target_in_source_y = target_in_source_y.reshape(block_shape)
+
+                outside_source_domain = (
+                    (target_in_source_y >= bounds['y'][1]) |
+                    (target_in_source_y <= bounds['y'][0]))
+
+                tmp_inside = np.zeros_like(outside_source_domain)
+                for bound_x in bounds['x']:
+                    tmp_inside = tmp_inside | (
+                        (target_in_source_x <= bound_x[1]) &
+                        (target_in_source_x >= bound_x[0]))
+                block_mask |= outside_source_domain | ~tmp_inside
+            mask[rows] = block_mask
+
+        #: The index, into the flattened source grid, of the source point
+        #: used for each target point. For the bilinear method, the indices
+        #: of the source points combined for each target point are held in
+        #: a trailing dimension, and for the area method, the indices are
+        #: those of the summed-area table of the source grid.
+        self.indices = indices
+
+        #: The weights of the source points given by :attr:`indices`, or
+        #: None for the nearest method.
+        self.weights = weights
+
+        #: Whether each target point is masked, or None if none are.
+        self.mask = mask if mask.any() else None
+
+    def _blocks(self):
+        """
+        Generate the slices of the blocks of target rows which are
+        processed at once.
+
+        """
+        ny, nx = self.shape
+        if self.method == 'area':
+            # Each block needs a few rows of the summed-area table of the
+            # source for each of its rows.
+            nx = max(nx, self.source_shape[1] + 1)
+        block_rows = max(1, self.block_size // max(nx, 1))
+        for start in range(0, ny, block_rows):
+            yield slice(start, min(start + block_rows, ny))
+
+    def regrid(self, array, out=None):
+        """
+        Regrid the given data array from the source grid to the target grid.
+
+        The target grid is filled a block of rows at a time, so the memory
+        used, beyond that of the input and output arrays, is bounded by
+        :attr:`block_size`.
+
+        Parameters
+        ----------
+        array
+            The :class:`numpy.ndarray` of data to be regridded. Its first two
+            dimensions must match the source grid, and any trailing
+            dimensions (such as the bands of an image, or a stack of time
+            slices) are preserved. It may be a memory-mapped array.
+        out: optional
+            The :class:`numpy.ndarray` (such as a :class:`numpy.memmap`)
+            to store the regridded data in, of the target grid shape plus
+            the trailing dimensions of *array*. Defaults to a new array.
+
+        Returns
+        -------
+        new_array
+            The data array regridded to the target grid, which is a masked
+            array (sharing the data of *out*) if *array* is masked or any
+            of the target points are masked.
+
+        """
+        # Squash the first two dims of the array into one.
+        temp_array = array.reshape((-1,) + array.shape[2:])
+        source_size = np.prod(self.source_shape)
+        if len(temp_array) != source_size:
+            raise ValueError('The array of shape {} does not match the source '
+                             'grid of {} points.'.format(array.shape,
+                                                         source_size))
+        shape = self.shape + array.shape[2:]
+        if out is None:
+            if self.weights is None or array.dtype.kind in 'iu':
+                dtype = array.dtype
+            else:
+                dtype = np.result_type(array.dtype, np.float64)
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            raise ValueError('The output array of shape {} does not match the '
+                             'target grid of shape {}.'.format(out.shape,
+                                                               shape))
+
+        data = np.ma.getdata(temp_array)
+        source_mask = np.ma.getmask(temp_array)
+        masked = np.ma.isMaskedArray(array)
+        if masked:
+            new_mask = np.zeros(shape, dtype=bool)
+        for rows in self._blocks():
+            if self.weights is None:
+                indices = self.indices[rows]
+                out[rows] = data[indices]
+                if source_mask is not np.ma.nomask:
+                    new_mask[rows] = source_mask[indices]
+            else:
+                block, block_mask = self._interpolate(data, source_mask,
+                                                      rows)
+                out[rows] = block
+                if block_mask is not None:
+                    new_mask[rows] = block_mask
+
+        if self.mask is not None:
+            if not masked:
+                masked = True
+                new_mask = np.zeros(shape, dtype=bool)
+            new_mask[self.mask] = True
+        if masked:
+            return np.ma.array(out, mask=new_mask, copy=False)
+        return out
+
+    def _summed_area_tables(self, data, source_mask, indices):
+        """
+        Return the rows of the summed-area tables, of the (flattened) data
+        and of its mask, needed by the given indices into the summed-area
+        table of the whole source grid, and the indices adjusted to them.
+
+        The source rows are summed a chunk at a time, so that a table of
+        the whole source grid is never held in memory.
+
+        """
+        ny, nx = self.source_shape
+        trailing = data.shape[1:]
+        table_rows, columns = np.divmod(indices, nx + 1)
+        needed, row_indices = np.unique(table_rows, return_inverse=True)
+        indices = row_indices.reshape(indices.shape) * (nx + 1) + columns
+
+        data = data.reshape((ny, nx) + trailing)
+        masked = source_mask is not np.ma.nomask
+        if masked:
+            source_mask = source_mask.reshape(data.shape)
+            mask_table = np.zeros((len(needed), nx + 1) + trailing)
+            mask_sum = np.zeros((nx, ) + trailing)
+        table = np.zeros((len(needed), nx + 1) + trailing)
+        row_sum = np.zeros((nx, ) + trailing)
+
+        # The tables hold the sums of the source rows from the first row
+        # needed, rather than from the first row of the grid, which makes
+        # no difference to the area means calculated from them.
+        chunk_rows = max(1, self.block_size // nx)
+        row = needed[0]
+        for k, table_row in enumerate(needed):
+            while row < table_row:
+                stop = min(table_row, row + chunk_rows)
+                values = data[row:stop]
+                if masked:
+                    chunk_mask = source_mask[row:stop]
+                    values = np.where(chunk_mask, 0, values)
+                    mask_sum += chunk_mask.sum(axis=0)
+                row_sum += values.sum(axis=0, dtype=np.float64)
+                row = stop
+            np.cumsum(row_sum, axis=0, out=table[k, 1:])
+            if masked:
+                np.cumsum(mask_sum, axis=0, out=mask_table[k, 1:])
+
+        table = table.reshape((-1, ) + trailing)
+        if masked:
+            mask_table = mask_table.reshape((-1, ) + trailing)
+        else:
+            mask_table = np.ma.nomask
+        return table, mask_table, indices
+
+    def _interpolate(self, data, source_mask, rows):
+        indices = self.indices[rows]
+        weights = self.weights[rows]
+        masked = source_mask is not np.ma.nomask
+        if self.method == 'area':
+            values, masked_values, indices = self._summed_area_tables(
+                data, source_mask, indices)
+        else:
+            values, masked_values = data, source_mask
+
+        # Sum the weighted source values one source point at a time, which
+        # needs much less memory than gathering them all at once.
+        new_array = 0
+        masked_weight = 0
+        for k in range(indices.shape[-1]):
+            index = indices[..., k]
+            weight = weights[..., k]
+            weight = weight.reshape(weight.shape + (1, ) * (data.ndim - 1))
+            value = values[index]
+            if masked:
+                value_mask = masked_values[index]
+                if self.method != 'area':
+                    value = np.where(value_mask, 0, value)
+                masked_weight = masked_weight + value_mask * weight
+            new_array = new_array + value * weight
+
+        new_mask = None
+        if masked:
+            # Mask the target points which are mostly derived from masked
+            # source points.
+            valid_weight = 1 - masked_weight
+            new_mask = valid_weight < 0.5
+            with np.errstate(divide='ignore', invalid='ignore'):
+                new_array = np.where(new_mask, 0, new_array / valid_weight)
+        if data.dtype.kind in 'iu':
+            new_array = np.round(new_array)
+        return new_array, new_mask
@@ -24,8 +24,10 @@ various data formats.
 from __future__ import (absolute_import, division, print_function)
 
 import collections
+import contextlib
 import os
 import string
+import tempfile
 import warnings
 
 import six
@@ -78,6 +80,79 @@ def fh_getter(fh, mode='r', needs_filename=False):
     return fh, filename
 
 
+def _replace(src, dst):
+    """
+    Rename the file ``src`` to ``dst``, replacing ``dst`` if it exists
+    (which :func:`os.rename` does not do on Windows).
+
+    """
+    if six.PY3:
+        os.replace(src, dst)
+        return
+    try:
+        os.rename(src, dst)
+    except OSError:
+        if not os.path.exists(dst):
+            raise
+        # Windows will not rename over an existing file.
+        try:
+            os.remove(dst)
+        except OSError:
+            # Another process may have replaced it first.
+            pass
+        os.rename(src, dst)
+
+
+@contextlib.contextmanager
+def _atomic_write(fname, mode='wb'):
+    """
+    Return a context manager which opens a temporary file, alongside the
+    given file, for writing, and then moves it into place. Concurrent
+    readers therefore never see a partially written file.
+
+    """
+    directory = os.path.dirname(os.path.abspath(fname))
+    fd, tmp_fname = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode) as fh:
+            yield fh
+        _replace(tmp_fname, fname)
+    except BaseException:
+        try:
+            os.remove(tmp_fname)
+        except OSError:
+            pass
+        raise
+
+
+def _evict_lru(directory, max_size, suffix='.npz'):
+    """
+    Remove the least recently modified files with the given suffix from the
+    given directory until their total size no longer exceeds ``max_size``
+    bytes.
+
+    """
+    entries = []
+    for fname in os.listdir(directory):
+        if fname.endswith(suffix):
+            fname = os.path.join(directory, fname)
+            try:
+                stat = os.stat(fname)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, fname))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, fname in sorted(entries):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(fname)
+        except OSError:
+            pass
+        total_size -= size
+
+
 class DownloadWarning(Warning):
     """Issued when a file is being downloaded by a :class:`Downloader`."""
     pass
@@ -342,6 +417,15 @@ class RasterSource(object):
     .. _raster-source-interface:
 
     """
+    tiled = False
+    """
+    Whether the raster is better fetched in small tiles, which can be cached
+    and reused as the view is panned and zoomed, than in a single request
+    per view (see
+    :class:`~cartopy.mpl.slippy_image_artist.SlippyImageArtist`).
+
+    """
+
     def validate_projection(self, projection):
         """
         Raise an error if this raster source cannot provide images in the
@@ -399,6 +483,10 @@ class RasterSourceContainer(RasterSource):
         """
         self._source = contained_source
 
+    @property
+    def tiled(self):
+        return getattr(self._source, 'tiled', False)
+
     def fetch_raster(self, projection, extent, target_resolution):
         return self._source.fetch_raster(projection, extent,
                                          target_resolution)
@@ -0,0 +1,248 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of cartopy.
+#
+# cartopy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cartopy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with cartopy.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Provides an engine for fetching many small resources, such as map tiles,
+over HTTP.
+
+A single :class:`HTTPFetcher` keeps a pool of persistent (keep-alive)
+connections per host, bounds the number of requests in flight, and retries
+failed requests with an exponential backoff. The fetcher returned by
+:func:`default_fetcher` is shared by all of the image tile sources of
+:mod:`cartopy.io.img_tiles`:
+
+    >>> from cartopy.io.fetch import default_fetcher
+    >>> fetcher = default_fetcher()
+    >>> url = 'https://a.tile.openstreetmap.org/0/0/0.png'
+    >>> data = fetcher.fetch(url)  # doctest: +SKIP
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+import concurrent.futures
+import socket
+import threading
+import time
+
+from six.moves import http_client
+from six.moves.urllib.error import HTTPError
+from six.moves.urllib.parse import urljoin, urlsplit
+from six.moves.urllib.request import Request, urlopen
+
+import cartopy
+
+
+class HTTPFetcher(object):
+    """
+    Fetch the content of URLs over a pool of persistent HTTP connections.
+
+    Parameters
+    ----------
+    max_connections: optional
+        The maximum number of requests in flight at any one time, which is
+        also the number of worker threads used by :meth:`submit`. Defaults
+        to 24.
+    max_retries: optional
+        The number of times a request is retried if the connection fails or
+        the server responds with a transient error (a 429 or 5xx status).
+        Defaults to 3.
+    backoff: optional
+        The delay, in seconds, before the first retry of a request. The
+        delay doubles for each subsequent retry. Defaults to 0.1.
+    timeout: optional
+        The timeout, in seconds, of the socket operations of each request.
+        Defaults to 30.
+
+    """
+    #: The statuses which are worth retrying.
+    retry_statuses = (429, 500, 502, 503, 504)
+
+    #: The maximum number of redirects followed for a single request.
+    max_redirects = 5
+
+    def __init__(self, max_connections=24, max_retries=3, backoff=0.1,
+                 timeout=30):
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.headers = {'User-Agent': 'CartoPy/{}'.format(
+            cartopy.__version__)}
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._executor = None
+
+    def close(self):
+        """
+        Close all idle connections and shut down the worker threads.
+
+        The fetcher may continue to be used afterwards, in which case new
+        connections and workers are created as needed.
+
+        """
+        with self._lock:
+            idle, self._idle = self._idle, {}
+            executor, self._executor = self._executor, None
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Schedule ``fn(*args, **kwargs)`` to be run by one of the worker
+        threads of this fetcher, returning a
+        :class:`concurrent.futures.Future`.
+
+        The workers are shared by all callers, so the number of callables
+        running concurrently never exceeds ``max_connections``.
+
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_connections)
+            executor = self._executor
+        return executor.submit(fn, *args, **kwargs)
+
+    def fetch(self, url):
+        """
+        Return the content of the given URL as bytes.
+
+        Raises
+        ------
+        IOError
+            If the resource could not be fetched, even after retrying. An
+            error status from the server is raised as a
+            :class:`~urllib.error.HTTPError`.
+
+        """
+        attempt = 0
+        while True:
+            try:
+                return self._fetch(url)
+            except HTTPError as err:
+                if (err.code not in self.retry_statuses or
+                        attempt >= self.max_retries):
+                    raise
+            except (IOError, http_client.HTTPException) as err:
+                if attempt >= self.max_retries:
+                    if isinstance(err, IOError):
+                        raise
+                    raise IOError('Unable to fetch {}: {!r}'.format(url, err))
+            time.sleep(self.backoff * 2 ** attempt)
+            attempt += 1
+
+    def fetch_async(self, url, loop=None):
+        """
+        Return an :mod:`asyncio` future of the content of the given URL,
+        fetched by one of the worker threads of this fetcher.
+
+        """
+        import asyncio
+        return asyncio.wrap_future(self.submit(self.fetch, url), loop=loop)
+
+    def _fetch(self, url):
+        for _ in range(self.max_redirects + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ('http', 'https'):
+                # Leave anything other than HTTP (such as file URLs) to
+                # urllib.
+                response = urlopen(Request(url, headers=self.headers),
+                                   timeout=self.timeout)
+                try:
+                    return response.read()
+                finally:
+                    response.close()
+
+            with self._slots:
+                status, reason, headers, data = self._request(parts)
+            if status in (301, 302, 303, 307, 308) and 'location' in headers:
+                url = urljoin(url, headers['location'])
+                continue
+            if status >= 400:
+                raise HTTPError(url, status, reason, headers, None)
+            return data
+        raise IOError('Too many redirects fetching {}.'.format(url))
+
+    def _request(self, parts):
+        """
+        Make a GET request on a pooled connection, returning the status,
+        reason, (lower-cased) headers and body of the response.
+
+        """
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        connection = self._checkout(key)
+        try:
+            connection.request('GET', path, headers=self.headers)
+            response = connection.getresponse()
+            data = response.read()
+        except (socket.error, http_client.HTTPException):
+            connection.close()
+            raise
+        headers = {name.lower(): value
+                   for name, value in response.getheaders()}
+        if response.will_close:
+            connection.close()
+        else:
+            self._checkin(key, connection)
+        return response.status, response.reason, headers, data
+
+    def _checkout(self, key):
+        with self._lock:
+            connections = self._idle.get(key)
+            if connections:
+                return connections.pop()
+        scheme, netloc = key
+        if scheme == 'https':
+            connection_cls = http_client.HTTPSConnection
+        else:
+            connection_cls = http_client.HTTPConnection
+        return connection_cls(netloc, timeout=self.timeout)
+
+    def _checkin(self, key, connection):
+        with self._lock:
+            connections = self._idle.setdefault(key, [])
+            if len(connections) < self.max_connections:
+                connections.append(connection)
+                return
+        connection.close()
+
+
+_DEFAULT_FETCHER = None
+"""The :class:`HTTPFetcher` returned by :func:`default_fetcher`."""
+
+_DEFAULT_FETCHER_LOCK = threading.Lock()
+
+
+def default_fetcher():
+    """
+    Return the :class:`HTTPFetcher` shared by everything in this process
+    that has not been given a fetcher of its own.
+
+    """
+    global _DEFAULT_FETCHER
+    with _DEFAULT_FETCHER_LOCK:
+        if _DEFAULT_FETCHER is None:
+            _DEFAULT_FETCHER = HTTPFetcher()
+        return _DEFAULT_FETCHER
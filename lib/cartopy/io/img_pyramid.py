@@ -0,0 +1,278 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of cartopy.
+#
+# cartopy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cartopy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with cartopy.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Provides multi-resolution pyramids of pre-cut image tiles, so that a small
+region of a very large image can be read without decoding all of it.
+
+A pyramid is built once from a large image::
+
+    from cartopy.io.img_pyramid import build_pyramid
+
+    build_pyramid('NE1_HR_LC_SR_W.tif', '/path/to/backgrounds/ne_shaded_hr')
+
+Level 0 of the pyramid holds the image at its full resolution, and each
+subsequent level halves the resolution of the one before, until the image
+fits in a single tile. The tiles of each level are stored as individual
+image files, alongside a ``pyramid.json`` file describing the pyramid.
+
+A pyramid directory may be given in place of an image file in the JSON file
+of the CARTOPY_USER_BACKGROUNDS directory, in which case
+:meth:`cartopy.mpl.geoaxes.GeoAxes.background_img` reads only the tiles
+covering the map, from the coarsest level which still resolves it.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+import collections
+import json
+import os
+
+import numpy as np
+from PIL import Image
+import six
+
+from cartopy.io import _atomic_write
+
+
+#: The name of the file which describes a pyramid within its directory.
+METADATA_FNAME = 'pyramid.json'
+
+
+def build_pyramid(image, directory, extent=(-180, 180, -90, 90),
+                  tile_size=256, format='png'):
+    """
+    Cut an image into a multi-resolution pyramid of tiles.
+
+    Parameters
+    ----------
+    image
+        The filename of the image, a PIL image, or an image array (with an
+        'upper' origin).
+    directory
+        The directory to write the pyramid to, which is created if
+        necessary.
+    extent: optional
+        The (x_lower, x_upper, y_lower, y_upper) extent of the image.
+        Defaults to the whole globe, in degrees.
+    tile_size: optional
+        The width and height, in pixels, of each tile. Defaults to 256.
+    format: optional
+        The file format, and extension, of the tiles. Defaults to 'png'.
+
+    Returns
+    -------
+    pyramid
+        The :class:`ImagePyramid` which was written.
+
+    """
+    if isinstance(image, six.string_types):
+        image = Image.open(image)
+    elif not isinstance(image, Image.Image):
+        image = Image.fromarray(np.asarray(image))
+    if image.mode == 'P':
+        # Palette images cannot be resampled.
+        image = image.convert('RGBA')
+
+    shapes = []
+    while True:
+        width, height = image.size
+        for row in range(-(-height // tile_size)):
+            row_dir = os.path.join(directory, str(len(shapes)), str(row))
+            if not os.path.isdir(row_dir):
+                os.makedirs(row_dir)
+            for col in range(-(-width // tile_size)):
+                box = (col * tile_size, row * tile_size,
+                       min((col + 1) * tile_size, width),
+                       min((row + 1) * tile_size, height))
+                image.crop(box).save(
+                    os.path.join(row_dir, '{}.{}'.format(col, format)))
+        shapes.append([height, width])
+        if width <= tile_size and height <= tile_size:
+            break
+        image = image.resize(((width + 1) // 2, (height + 1) // 2),
+                             Image.BILINEAR)
+
+    metadata = {'extent': [float(value) for value in extent],
+                'tile_size': tile_size, 'format': format, 'shapes': shapes}
+    # The metadata is written last, and atomically, so that a partially
+    # built pyramid is never read.
+    with _atomic_write(os.path.join(directory, METADATA_FNAME), 'w') as fh:
+        json.dump(metadata, fh)
+    return ImagePyramid(directory)
+
+
+def is_pyramid(path):
+    """Return whether the given path is the directory of a pyramid."""
+    return os.path.isfile(os.path.join(path, METADATA_FNAME))
+
+
+class ImagePyramid(object):
+    """
+    A multi-resolution pyramid of image tiles, as written by
+    :func:`build_pyramid`.
+
+    Decoded tiles are kept in memory (see :attr:`max_cached_tiles`), so
+    that neighbouring regions read from the same pyramid share them.
+
+    Parameters
+    ----------
+    directory
+        The directory of the pyramid.
+
+    """
+    #: The maximum number of decoded tiles kept in memory.
+    max_cached_tiles = 64
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, METADATA_FNAME)) as fh:
+            metadata = json.load(fh)
+        #: The (x_lower, x_upper, y_lower, y_upper) extent of the image.
+        self.extent = metadata['extent']
+        #: The width and height, in pixels, of each tile.
+        self.tile_size = metadata['tile_size']
+        #: The file format, and extension, of the tiles.
+        self.format = metadata['format']
+        #: The (height, width), in pixels, of the image at each level.
+        self.shapes = [tuple(shape) for shape in metadata['shapes']]
+        self._tiles = collections.OrderedDict()
+
+    def level(self, extent, target_res):
+        """
+        Return the coarsest level which has at least the given number of
+        pixels across the given extent.
+
+        Parameters
+        ----------
+        extent
+            The (x_lower, x_upper, y_lower, y_upper) extent to be read.
+        target_res
+            The (nx, ny) number of pixels wanted across that extent.
+
+        """
+        x0, x1, y0, y1 = self.extent
+        if np.isclose(x1 - x0, 360):
+            # The extent may wrap around the image.
+            dx = min(extent[1] - extent[0], x1 - x0)
+        else:
+            dx = min(extent[1], x1) - max(extent[0], x0)
+        dy = min(extent[3], y1) - max(extent[2], y0)
+        for level in range(len(self.shapes) - 1, 0, -1):
+            height, width = self.shapes[level]
+            if (width * dx / (x1 - x0) >= target_res[0] and
+                    height * dy / (y1 - y0) >= target_res[1]):
+                return level
+        return 0
+
+    def image(self, extent, target_res=None):
+        """
+        Read the given extent of the pyramid, decoding only the tiles which
+        cover it.
+
+        If the pyramid spans 360 degrees of longitude, the extent may wrap
+        around it, for instance [167, 193, 47, 68] to cross the date line.
+
+        Parameters
+        ----------
+        extent
+            The (x_lower, x_upper, y_lower, y_upper) extent to be read.
+        target_res: optional
+            The (nx, ny) number of pixels wanted across the extent, from
+            which the level is chosen with :meth:`level`. Defaults to None,
+            meaning the full resolution.
+
+        Returns
+        -------
+        img
+            The image array, with an 'upper' origin.
+        img_extent
+            The extent of the image, which covers the given extent to the
+            nearest whole pixel.
+
+        """
+        level = 0 if target_res is None else self.level(extent, target_res)
+        height, width = self.shapes[level]
+        x0, x1, y0, y1 = self.extent
+        dx = (x1 - x0) / width
+        dy = (y1 - y0) / height
+
+        wraps = np.isclose(x1 - x0, 360)
+        col0 = int(np.floor((extent[0] - x0) / dx))
+        col1 = int(np.ceil((extent[1] - x0) / dx))
+        if wraps:
+            col1 = min(col1, col0 + width)
+        else:
+            col0, col1 = max(col0, 0), min(col1, width)
+        row0 = max(int(np.floor((y1 - extent[3]) / dy)), 0)
+        row1 = min(int(np.ceil((y1 - extent[2]) / dy)), height)
+        if col0 >= col1 or row0 >= row1:
+            raise ValueError('The extent {} does not overlap the image '
+                             'pyramid in {!r}.'.format(list(extent),
+                                                       self.directory))
+
+        # Split the columns wherever they wrap around the image.
+        windows = []
+        col = col0
+        while col < col1:
+            offset = (col // width) * width
+            end = min(col1, offset + width)
+            windows.append(self._window(level, row0, row1, col - offset,
+                                        end - offset))
+            col = end
+        img = windows[0] if len(windows) == 1 else np.concatenate(windows,
+                                                                  axis=1)
+        img_extent = [x0 + col0 * dx, x0 + col1 * dx,
+                      y1 - row1 * dy, y1 - row0 * dy]
+        return img, img_extent
+
+    def _window(self, level, row0, row1, col0, col1):
+        """
+        Return the given rows and columns of a level, which must lie within
+        it, as a mosaic of its tiles.
+
+        """
+        size = self.tile_size
+        img = None
+        for row in range(row0 // size, (row1 - 1) // size + 1):
+            for col in range(col0 // size, (col1 - 1) // size + 1):
+                tile = self.tile(level, row, col)
+                if img is None:
+                    img = np.empty((row1 - row0, col1 - col0) +
+                                   tile.shape[2:], dtype=tile.dtype)
+                # The intersection of the tile and the window, in the
+                # pixels of the level.
+                i0, i1 = max(row * size, row0), min((row + 1) * size, row1)
+                j0, j1 = max(col * size, col0), min((col + 1) * size, col1)
+                img[i0 - row0:i1 - row0, j0 - col0:j1 - col0] = \
+                    tile[i0 - row * size:i1 - row * size,
+                         j0 - col * size:j1 - col * size]
+        return img
+
+    def tile(self, level, row, col):
+        """Return the decoded image array of the given tile."""
+        key = (level, row, col)
+        tile = self._tiles.pop(key, None)
+        if tile is None:
+            fname = os.path.join(self.directory, str(level), str(row),
+                                 '{}.{}'.format(col, self.format))
+            with Image.open(fname) as image:
+                tile = np.array(image)
+        self._tiles[key] = tile
+        while len(self._tiles) > self.max_cached_tiles:
+            self._tiles.popitem(last=False)
+        return tile
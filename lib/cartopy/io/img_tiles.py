@@ -36,10 +36,12 @@ import warnings
 
 from PIL import Image
 import shapely.geometry as sgeom
+from shapely.prepared import prep
 import numpy as np
 import six
 
 import cartopy.crs as ccrs
+from cartopy.io.fetch import default_fetcher
 
 
 class GoogleWTS(six.with_metaclass(ABCMeta, object)):
@@ -49,13 +51,77 @@ class GoogleWTS(six.with_metaclass(ABCMeta, object)):
     A "tile" in this class refers to the coordinates (x, y, z).
 
     """
-    _MAX_THREADS = 24
+    fetcher = None
+    """
+    The :class:`~cartopy.io.fetch.HTTPFetcher` used to download tiles. If
+    None, the fetcher shared by the whole process (see
+    :func:`~cartopy.io.fetch.default_fetcher`) is used, so that connections
+    are reused, and concurrency bounded, across all tile sources.
+
+    """
+
+    cache = None
+    """
+    The :class:`~cartopy.io.tile_cache.TileCache` in which downloaded tiles
+    are kept, or None if they are not cached.
+
+    """
+
+    _cache_source_attrs = ('url', 'style', 'layer', 'username', 'map_id')
+    """
+    The names of the attributes which, where they exist, identify the
+    tiles of an instance in a tile cache (see :meth:`_cache_source`).
+
+    """
 
     def __init__(self, desired_tile_form='RGB'):
         self.imgs = []
         self.crs = ccrs.Mercator.GOOGLE
         self.desired_tile_form = desired_tile_form
 
+    def _fetcher(self):
+        return self.fetcher or default_fetcher()
+
+    def _cache_source(self):
+        """
+        Return the string which identifies this source of tiles in a tile
+        cache: the qualified name of its class, and the values of those of
+        its :attr:`_cache_source_attrs` which exist.
+
+        """
+        cls = type(self)
+        name = getattr(cls, '__qualname__', cls.__name__)
+        attrs = ', '.join('{}={!r}'.format(attr, getattr(self, attr))
+                          for attr in self._cache_source_attrs
+                          if hasattr(self, attr))
+        return '{}.{}({})'.format(cls.__module__, name, attrs)
+
+    def _tile_xyz(self, tile):
+        """Return the ``(z, x, y)`` position of the given tile."""
+        x, y, z = tile
+        return z, x, y
+
+    def _tile_data(self, tile):
+        """
+        Return the (encoded) image data of the given tile, from the tile
+        cache if possible.
+
+        """
+        url = self._image_url(tile)
+        cache = self.cache
+        if cache is None:
+            return self._fetcher().fetch(url)
+
+        key = (self._cache_source(), ) + tuple(self._tile_xyz(tile))
+        data = cache.get(key)
+        if data is None:
+            if cache.offline:
+                raise IOError('The tile {} is not in the (offline) tile '
+                              'cache.'.format(tile))
+            data = self._fetcher().fetch(url)
+            cache.put(key, data)
+        return data
+
     def image_for_domain(self, target_domain, target_z):
         tiles = []
 
@@ -71,17 +137,16 @@ class GoogleWTS(six.with_metaclass(ABCMeta, object)):
             y = np.linspace(extent[2], extent[3], img.shape[0])
             return img, x, y, origin
 
-        with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self._MAX_THREADS) as executor:
-            futures = []
-            for tile in self.find_images(target_domain, target_z):
-                futures.append(executor.submit(fetch_tile, tile))
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    img, x, y, origin = future.result()
-                    tiles.append([img, x, y, origin])
-                except IOError:
-                    pass
+        fetcher = self._fetcher()
+        futures = []
+        for tile in self.find_images(target_domain, target_z):
+            futures.append(fetcher.submit(fetch_tile, tile))
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                img, x, y, origin = future.result()
+                tiles.append([img, x, y, origin])
+            except IOError:
+                pass
 
         img, extent, origin = _merge_tiles(tiles)
         return img, extent, origin
@@ -93,18 +158,80 @@ class GoogleWTS(six.with_metaclass(ABCMeta, object)):
                                                              'be an integer '
                                                              '>=0.')
 
-        # Recursively drill down to the images at the target zoom.
+        if target_domain.is_empty:
+            return
+        if target_domain.equals(target_domain.envelope):
+            # The tiles intersecting a rectangle can be found directly.
+            tiles = self._find_images_in_bounds(target_domain.bounds,
+                                                target_z, start_tile)
+        else:
+            tiles = self._find_images_prepared(prep(target_domain),
+                                               target_z, start_tile)
+        for tile in tiles:
+            yield tile
+
+    def _find_images_prepared(self, target_domain, target_z, start_tile):
+        """
+        Recursively drill down to the tiles at the target zoom which
+        intersect the given (prepared) target domain.
+
+        """
         x0, x1, y0, y1 = self._tileextent(start_tile)
         domain = sgeom.box(x0, y0, x1, y1)
-        if domain.intersects(target_domain):
+        if target_domain.intersects(domain):
             if start_tile[2] == target_z:
-                    yield start_tile
+                yield start_tile
             else:
                 for tile in self._subtiles(start_tile):
-                    for result in self._find_images(target_domain, target_z,
-                                                    start_tile=tile):
+                    for result in self._find_images_prepared(
+                            target_domain, target_z, tile):
                         yield result
 
+    def _find_images_in_bounds(self, bounds, target_z, start_tile):
+        """
+        Return the tiles at the target zoom, within the given start tile,
+        which intersect the given ``(x0, y0, x1, y1)`` bounds.
+
+        The tiles are in the same order as they are found by recursively
+        descending the quadtree.
+
+        """
+        start_x, start_y, start_z = start_tile
+        n = 2 ** target_z
+        scale = 2 ** (target_z - start_z)
+
+        x0, x1 = self.crs.x_limits
+        y0, y1 = self.crs.y_limits
+        box_w = (x1 - x0) / n
+        box_h = (y1 - y0) / n
+        min_x, min_y, max_x, max_y = bounds
+
+        def tile_range(start, lower, upper):
+            # Generous candidate indices, to be refined by comparing with
+            # the tile edges computed exactly as in tile_bbox.
+            first = max(start * scale, int(np.floor(lower)) - 1)
+            last = min((start + 1) * scale - 1, int(np.floor(upper)) + 1)
+            return np.arange(first, last + 1)
+
+        xs = tile_range(start_x, (min_x - x0) / box_w, (max_x - x0) / box_w)
+        xs = xs[(x0 + xs * box_w <= max_x) &
+                (x0 + (xs + 1.) * box_w >= min_x)]
+        # Google tiles number y down from the top (north) of the CRS.
+        ys = tile_range(start_y, (y1 - max_y) / box_h, (y1 - min_y) / box_h)
+        ys = ys[(y1 - (ys + 1.) * box_h <= max_y) &
+                (y1 - ys * box_h >= min_y)]
+
+        xs, ys = [a.ravel() for a in np.meshgrid(xs, ys, indexing='ij')]
+        # Sort by the quadtree (Morton) order, with the x bit of each level
+        # being the most significant.
+        order = np.zeros(xs.shape, dtype=np.int64)
+        for bit in range(target_z):
+            order |= ((xs >> bit) & 1) << (2 * bit + 1)
+            order |= ((ys >> bit) & 1) << (2 * bit)
+        order = np.argsort(order, kind='mergesort')
+        return [(int(x), int(y), target_z)
+                for x, y in zip(xs[order], ys[order])]
+
     find_images = _find_images
 
     def subtiles(self, x_y_z):
@@ -154,10 +281,11 @@ class GoogleWTS(six.with_metaclass(ABCMeta, object)):
 
         # Compute the native x & y extents of the tile.
         n_xs = x0 + (x + np.arange(0, 2, dtype=np.float64)) * box_w
-        n_ys = y0 + (y + np.arange(0, 2, dtype=np.float64)) * box_h
-
         if y0_at_north_pole:
-            n_ys = -1 * n_ys[::-1]
+            # Count the rows down from the top of the CRS.
+            n_ys = y1 - (y + np.arange(1, -1, -1, dtype=np.float64)) * box_h
+        else:
+            n_ys = y0 + (y + np.arange(0, 2, dtype=np.float64)) * box_h
 
         return n_xs, n_ys
 
@@ -174,22 +302,24 @@ class GoogleWTS(six.with_metaclass(ABCMeta, object)):
         pass
 
     def get_image(self, tile):
-        if six.PY3:
-            from urllib.request import urlopen
-        else:
-            from urllib2 import urlopen
-
-        url = self._image_url(tile)
-
-        fh = urlopen(url)
-        im_data = six.BytesIO(fh.read())
-        fh.close()
+        im_data = six.BytesIO(self._tile_data(tile))
         img = Image.open(im_data)
 
         img = img.convert(self.desired_tile_form)
 
         return img, self.tileextent(tile), 'lower'
 
+    def get_image_async(self, tile, loop=None):
+        """
+        Return an :mod:`asyncio` future of the result of
+        :meth:`get_image` for the given tile, which is fetched by one of
+        the worker threads of the tile fetcher.
+
+        """
+        import asyncio
+        future = self._fetcher().submit(self.get_image, tile)
+        return asyncio.wrap_future(future, loop=loop)
+
 
 class GoogleTiles(GoogleWTS):
     def __init__(self, desired_tile_form='RGB', style="street",
@@ -484,6 +614,10 @@ class QuadtreeTiles(GoogleWTS):
             y = (2 ** z - 1) - y
         return (x, y, z)
 
+    def _tile_xyz(self, quadkey):
+        x, y, z = self.quadkey_to_tms(quadkey, google=True)
+        return z, x, y
+
     def subtiles(self, quadkey):
         for i in range(4):
             yield quadkey + str(i)
@@ -566,56 +700,30 @@ class OrdnanceSurvey(GoogleWTS):
 
 
 def _merge_tiles(tiles):
-    """Return a single image, merging the given images."""
+    """
+    Return a single image, merging the given images.
+
+    Each tile is given as an ``[img, x, y, origin]`` item, where ``x`` and
+    ``y`` are the (ascending) coordinates of the columns and rows of the
+    image. The tiles must lie on a common grid, which is the union of their
+    coordinates, and each tile is written directly into its position in a
+    preallocated mosaic.
+
+    """
     if not tiles:
         raise ValueError('A non-empty list of tiles should '
                          'be provided to merge.')
-    xset = [set(x) for i, x, y, _ in tiles]
-    yset = [set(y) for i, x, y, _ in tiles]
-
-    xs = xset[0]
-    xs.update(*xset[1:])
-    ys = yset[0]
-    ys.update(*yset[1:])
-    xs = sorted(xs)
-    ys = sorted(ys)
+    xs = np.unique(np.concatenate([x for _, x, _, _ in tiles]))
+    ys = np.unique(np.concatenate([y for _, _, y, _ in tiles]))
 
     other_len = tiles[0][0].shape[2:]
-    img = np.zeros((len(ys), len(xs)) + other_len, dtype=np.uint8) - 1
+    img = np.full((len(ys), len(xs)) + other_len, 255, dtype=np.uint8)
 
     for tile_img, x, y, origin in tiles:
-        y_first, y_last = y[0], y[-1]
-        yi0, yi1 = np.where((y_first == ys) | (y_last == ys))[0]
-        if origin == 'upper':
-            yi0 = tile_img.shape[0] - yi0 - 1
-            yi1 = tile_img.shape[0] - yi1 - 1
-        start, stop, step = yi0, yi1, 1 if yi0 < yi1 else -1
-        if step == 1 and stop == img.shape[0] - 1:
-            stop = None
-        elif step == -1 and stop == 0:
-            stop = None
-        else:
-            stop += step
-        y_slice = slice(start, stop, step)
-
-        xi0, xi1 = np.where((x[0] == xs) | (x[-1] == xs))[0]
-
-        start, stop, step = xi0, xi1, 1 if xi0 < xi1 else -1
-
-        if step == 1 and stop == img.shape[1] - 1:
-            stop = None
-        elif step == -1 and stop == 0:
-            stop = None
-        else:
-            stop += step
-
-        x_slice = slice(start, stop, step)
-
-        img_slice = (y_slice, x_slice, Ellipsis)
-
-        if origin == 'lower':
-            tile_img = tile_img[::-1, ::]
-
-        img[img_slice] = tile_img
+        xi = np.searchsorted(xs, x[0])
+        yi = np.searchsorted(ys, y[0])
+        # The rows of the tile images run from north to south, whereas
+        # those of the merged image run from south to north.
+        img[yi:yi + len(y), xi:xi + len(x), ...] = tile_img[::-1]
 
-    return img, [min(xs), max(xs), min(ys), max(ys)], 'lower'
+    return img, [xs[0], xs[-1], ys[0], ys[-1]], 'lower'
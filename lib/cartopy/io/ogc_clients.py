@@ -33,8 +33,11 @@ from __future__ import (absolute_import, division, print_function)
 import six
 
 import collections
+import concurrent.futures
 import io
+import itertools
 import math
+import threading
 import warnings
 import weakref
 from xml.etree import ElementTree
@@ -57,6 +60,7 @@ except ImportError:
 
 import cartopy.crs as ccrs
 from cartopy.io import LocatedImage, RasterSource
+from cartopy.io.fetch import default_fetcher
 from cartopy.img_transform import warp_array
 
 _OWSLIB_REQUIRED = 'OWSLib is required to use OGC web services.'
@@ -334,6 +338,105 @@ class WMSRasterSource(RasterSource):
         return located_images
 
 
+class _TileImages(dict):
+    """
+    The cached images of the tiles of a single WMTS layer and tile matrix,
+    keyed by (row, column).
+
+    A dict which, unlike the builtin, may be weakly referenced, and which
+    has a token, unique among all such mappings, by which
+    :class:`_ImageLRU` identifies it.
+
+    """
+    _tokens = itertools.count()
+
+    def __init__(self, *args, **kwargs):
+        super(_TileImages, self).__init__(*args, **kwargs)
+        self.token = next(_TileImages._tokens)
+
+
+class _ImageLRU(object):
+    """
+    Track the use of the images held in :class:`_TileImages` mappings, to
+    bound their total size by evicting the least recently used images.
+
+    The images of a mapping which is garbage collected stop counting
+    towards the bound.
+
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        # The size of each tracked image, keyed by (mapping token, key), in
+        # order of use.
+        self._entries = collections.OrderedDict()
+        # A weak reference to each mapping, and the keys of its tracked
+        # images, keyed by mapping token.
+        self._mappings = {}
+        # The tokens of the mappings which have been garbage collected.
+        # These are appended by weakref callbacks, which may run at any
+        # time, so they are only purged under the lock.
+        self._dead_tokens = collections.deque()
+        #: The total size, in bytes, of the tracked images.
+        self.nbytes = 0
+
+    def _purge(self):
+        while self._dead_tokens:
+            token = self._dead_tokens.popleft()
+            _, keys = self._mappings.pop(token, (None, ()))
+            for key in keys:
+                self.nbytes -= self._entries.pop((token, key))
+
+    def get(self, images, key):
+        """
+        Return the image with the given key from the given
+        :class:`_TileImages`, or None, marking it as recently used.
+
+        """
+        with self._lock:
+            self._purge()
+            img = images.get(key)
+            if img is not None:
+                entry_key = (images.token, key)
+                nbytes = self._entries.pop(entry_key, None)
+                if nbytes is not None:
+                    self._entries[entry_key] = nbytes
+            return img
+
+    def add(self, images, key, img, max_size):
+        """
+        Add the given image to the given :class:`_TileImages`, then evict
+        the least recently used images until their total size (in bytes)
+        is no more than the given maximum.
+
+        """
+        nbytes = img.size[0] * img.size[1] * len(img.getbands())
+        with self._lock:
+            self._purge()
+            images[key] = img
+            token = images.token
+            if token not in self._mappings:
+                dead_tokens = self._dead_tokens
+                ref = weakref.ref(images,
+                                  lambda ref: dead_tokens.append(token))
+                self._mappings[token] = (ref, set())
+            self._mappings[token][1].add(key)
+            entry_key = (token, key)
+            old_nbytes = self._entries.pop(entry_key, None)
+            if old_nbytes is not None:
+                self.nbytes -= old_nbytes
+            self._entries[entry_key] = nbytes
+            self.nbytes += nbytes
+            while self.nbytes > max_size and len(self._entries) > 1:
+                (old_token, old_key), old_nbytes = self._entries.popitem(
+                    last=False)
+                self.nbytes -= old_nbytes
+                ref, keys = self._mappings[old_token]
+                keys.discard(old_key)
+                old_images = ref()
+                if old_images is not None:
+                    old_images.pop(old_key, None)
+
+
 class WMTSRasterSource(RasterSource):
     """
     A WMTS imagery retriever which can be added to a map.
@@ -356,6 +459,27 @@ class WMTSRasterSource(RasterSource):
     This provides a significant boost when producing multiple maps of the
     same projection or with an interactive figure.
 
+    The total size of the cached images is bounded by
+    :attr:`image_cache_size`, with the least recently used images being
+    evicted first.
+
+    """
+
+    _shared_image_lru = _ImageLRU()
+    """Tracks the use of the images in the :attr:`_shared_image_cache`."""
+
+    image_cache_size = 256 * 1024 ** 2
+    """
+    The maximum total size, in (decoded) bytes, of the tile images cached
+    by all WMTS raster sources.
+
+    """
+
+    tiled = True
+    """
+    WMTS rasters are fetched in tiles, as the service is itself tiled and
+    its tile images are cached (see :attr:`image_cache_size`).
+
     """
 
     def __init__(self, wmts, layer_name, gettile_extra_kwargs=None):
@@ -597,42 +721,73 @@ class WMTSRasterSource(RasterSource):
         cache_by_wmts = WMTSRasterSource._shared_image_cache
         cache_by_layer_matrix = cache_by_wmts.setdefault(wmts, {})
         image_cache = cache_by_layer_matrix.setdefault((layer.id,
-                                                        tile_matrix_id), {})
+                                                        tile_matrix_id),
+                                                       _TileImages())
+        image_lru = WMTSRasterSource._shared_image_lru
+
+        def fetch_tile(row, col):
+            tile = wmts.gettile(
+                layer=layer.id,
+                tilematrixset=matrix_set_name,
+                tilematrix=str(tile_matrix_id),
+                row=str(row), column=str(col),
+                **self.gettile_extra_kwargs)
+            img = Image.open(io.BytesIO(tile.read()))
+            # Decode the image in the worker, rather than when pasting.
+            img.load()
+            return img
+
+        # Fetch the tiles which are not cached concurrently.
+        cached_imgs = []
+        futures = {}
+        fetcher = default_fetcher()
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                img_key = (row, col)
+                img = image_lru.get(image_cache, img_key)
+                if img is None:
+                    futures[fetcher.submit(fetch_tile, row, col)] = img_key
+                else:
+                    cached_imgs.append((img_key, img))
+
+        # Ignore out-of-range errors if the current version of OWSLib
+        # doesn't provide the regional information.
+        ignore_out_of_range = tile_matrix_set_links is None
+
+        def tile_imgs():
+            for item in cached_imgs:
+                yield item
+            for future in concurrent.futures.as_completed(futures):
+                img_key = futures[future]
+                try:
+                    img = future.result()
+                except owslib.util.ServiceException as exception:
+                    if ('TileOutOfRange' in exception.message and
+                            ignore_out_of_range):
+                        continue
+                    raise exception
+                image_lru.add(image_cache, img_key, img,
+                              self.image_cache_size)
+                yield img_key, img
 
         # To avoid nasty seams between the individual tiles, we
-        # accumulate the tile images into a single image.
+        # accumulate the tile images into a single image, pasting each
+        # tile as it arrives.
         big_img = None
         n_rows = 1 + max_row - min_row
         n_cols = 1 + max_col - min_col
-        # Ignore out-of-range errors if the current version of OWSLib
-        # doesn't provide the regional information.
-        ignore_out_of_range = tile_matrix_set_links is None
-        for row in range(min_row, max_row + 1):
-            for col in range(min_col, max_col + 1):
-                # Get the tile's Image from the cache if possible.
-                img_key = (row, col)
-                img = image_cache.get(img_key)
-                if img is None:
-                    try:
-                        tile = wmts.gettile(
-                            layer=layer.id,
-                            tilematrixset=matrix_set_name,
-                            tilematrix=str(tile_matrix_id),
-                            row=str(row), column=str(col),
-                            **self.gettile_extra_kwargs)
-                    except owslib.util.ServiceException as exception:
-                        if ('TileOutOfRange' in exception.message and
-                                ignore_out_of_range):
-                            continue
-                        raise exception
-                    img = Image.open(io.BytesIO(tile.read()))
-                    image_cache[img_key] = img
+        try:
+            for (row, col), img in tile_imgs():
                 if big_img is None:
                     size = (img.size[0] * n_cols, img.size[1] * n_rows)
                     big_img = Image.new('RGBA', size, (255, 255, 255, 255))
                 top = (row - min_row) * tile_matrix.tileheight
                 left = (col - min_col) * tile_matrix.tilewidth
                 big_img.paste(img, (left, top))
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
 
         if big_img is None:
             img_extent = None
@@ -44,6 +44,7 @@ from __future__ import (absolute_import, division, print_function)
 import glob
 import itertools
 import os
+import struct
 
 import shapely.geometry as sgeom
 import shapefile
@@ -127,6 +128,19 @@ class FionaRecord(Record):
         self._bounds = geometry.bounds
 
 
+def _bbox_intersects(bbox, other):
+    """
+    Return whether two ``(xmin, ymin, xmax, ymax)`` boxes overlap.
+
+    """
+    return not (bbox[0] > other[2] or bbox[2] < other[0] or
+                bbox[1] > other[3] or bbox[3] < other[1])
+
+
+#: The shape types whose records hold a single point rather than a bbox.
+_POINT_SHAPE_TYPES = (shapefile.POINT, shapefile.POINTZ, shapefile.POINTM)
+
+
 class BasicReader(object):
     """
     Provide an interface for accessing the contents of a shapefile.
@@ -135,7 +149,7 @@ class BasicReader(object):
     :meth:`~Reader.records` and :meth:`~Reader.geometries`.
 
     """
-    def __init__(self, filename):
+    def __init__(self, filename, bbox=None):
         # Validate the filename/shapefile
         self._reader = reader = shapefile.Reader(filename)
         if reader.shp is None or reader.shx is None or reader.dbf is None:
@@ -143,6 +157,16 @@ class BasicReader(object):
                              "in '%s'." % filename)
 
         self._fields = self._reader.fields
+        self._bbox = self._check_bbox(bbox)
+
+    @staticmethod
+    def _check_bbox(bbox):
+        if bbox is not None:
+            if len(bbox) != 4:
+                raise ValueError('bbox must be a (xmin, ymin, xmax, ymax) '
+                                 'sequence, got {!r}.'.format(bbox))
+            bbox = tuple(float(value) for value in bbox)
+        return bbox
 
     def close(self):
         return self._reader.close()
@@ -150,7 +174,55 @@ class BasicReader(object):
     def __len__(self):
         return self._reader.numRecords
 
-    def geometries(self):
+    def _record_bbox(self, index):
+        """
+        Return the bounding box of the given record, read straight from the
+        record header in the .shp file, or None for a null shape.
+
+        """
+        shx = self._reader.shx
+        # The .shx file is a 100 byte header followed by an 8 byte
+        # (offset, content length) pair per record, with the offset
+        # counted in 16 bit words.
+        shx.seek(100 + 8 * index)
+        offset, = struct.unpack('>i', shx.read(4))
+        shp = self._reader.shp
+        # Skip the 8 byte record header of the .shp file.
+        shp.seek(offset * 2 + 8)
+        shape_type, = struct.unpack('<i', shp.read(4))
+        if shape_type == shapefile.NULL:
+            return None
+        elif shape_type in _POINT_SHAPE_TYPES:
+            x, y = struct.unpack('<2d', shp.read(16))
+            return (x, y, x, y)
+        return struct.unpack('<4d', shp.read(32))
+
+    def _indices(self, bbox):
+        """
+        Return an iterator of the indices of the records whose bounding box
+        intersects the given bbox (or of every record if it is None).
+
+        Only the record headers are read when filtering, so records outside
+        of the bbox never have their geometry constructed.
+
+        """
+        bbox = self._check_bbox(bbox)
+        if bbox is None:
+            bbox = self._bbox
+        n_records = self._reader.numRecords
+        if bbox is None:
+            return iter(range(n_records))
+        if (self._reader.shapeType != shapefile.NULL and
+                not _bbox_intersects(bbox, tuple(self._reader.bbox))):
+            return iter([])
+        return (i for i in range(n_records)
+                if self._intersects(i, bbox))
+
+    def _intersects(self, index, bbox):
+        record_bbox = self._record_bbox(index)
+        return record_bbox is not None and _bbox_intersects(bbox, record_bbox)
+
+    def geometries(self, bbox=None):
         """
         Return an iterator of shapely geometries from the shapefile.
 
@@ -161,19 +233,33 @@ class BasicReader(object):
         interface instead, extracting the geometry from the record with the
         :meth:`~Record.geometry` method.
 
+        Parameters
+        ----------
+        bbox: optional
+            A ``(xmin, ymin, xmax, ymax)`` bounding box. If given (or if one
+            was given to the reader), only the geometries whose bounding box
+            intersects it are returned.
+
         """
-        for i in range(self._reader.numRecords):
+        for i in self._indices(bbox):
             yield sgeom.shape(self._reader.shape(i))
 
-    def records(self):
+    def records(self, bbox=None):
         """
         Return an iterator of :class:`~Record` instances.
 
+        Parameters
+        ----------
+        bbox: optional
+            A ``(xmin, ymin, xmax, ymax)`` bounding box. If given (or if one
+            was given to the reader), only the records whose bounding box
+            intersects it are returned.
+
         """
         # Ignore the "DeletionFlag" field which always comes first
         fields = self._reader.fields[1:]
         field_names = [field[0] for field in fields]
-        for i in range(self._reader.numRecords):
+        for i in self._indices(bbox):
             shape_record = self._reader.shapeRecord(i)
             attributes = dict(zip(field_names, shape_record.record))
             yield Record(shape_record.shape, attributes, fields)
@@ -187,49 +273,48 @@ class FionaReader(object):
     The primary methods used on a Reader instance are
     :meth:`~Reader.records` and :meth:`~Reader.geometries`.
 
+    The underlying fiona collection is kept open until :meth:`close` is
+    called, so that features are read lazily as they are iterated over.
+
     """
     def __init__(self, filename, bbox=None):
-        self._data = []
-
-        with fiona.open(filename) as f:
-            if bbox is not None:
-                assert len(bbox) == 4
-                features = f.filter(bbox=bbox)
-            else:
-                features = f
-
-            # Handle feature collections
-            if hasattr(features, "__geo_interface__"):
-                fs = features.__geo_interface__
-            else:
-                fs = features
-
-            if isinstance(fs, dict) and fs.get('type') == 'FeatureCollection':
-                features_lst = fs['features']
-            else:
-                features_lst = features
-
-            for feature in features_lst:
-                if hasattr(f, "__geo_interface__"):
-                    feature = feature.__geo_interface__
-                else:
-                    feature = feature
-
-                d = {'geometry': sgeom.shape(feature['geometry'])
-                     if feature['geometry'] else None}
-                d.update(feature['properties'])
-                self._data.append(d)
+        self._collection = fiona.open(filename)
+        self._bbox = BasicReader._check_bbox(bbox)
+        self._len = None
 
     def close(self):
-        # TODO: Keep the Fiona handle open until this is called.
-        # This will enable us to pass down calls for bounding box queries,
-        # rather than having to have it all in memory.
-        pass
+        self._collection.close()
 
     def __len__(self):
-        return len(self._data)
+        if self._len is None:
+            if self._bbox is None:
+                self._len = len(self._collection)
+            else:
+                self._len = sum(1 for _ in self._features())
+        return self._len
+
+    def _features(self, bbox=None):
+        """
+        Return an iterator of ``(geometry, properties)`` pairs for the
+        features intersecting the given bbox (or all features if it is None).
 
-    def geometries(self):
+        """
+        bbox = BasicReader._check_bbox(bbox)
+        if bbox is None:
+            bbox = self._bbox
+        if bbox is not None:
+            features = self._collection.filter(bbox=bbox)
+        else:
+            features = iter(self._collection)
+
+        for feature in features:
+            if hasattr(feature, "__geo_interface__"):
+                feature = feature.__geo_interface__
+            geometry = feature['geometry']
+            yield (sgeom.shape(geometry) if geometry else None,
+                   dict(feature['properties']))
+
+    def geometries(self, bbox=None):
         """
         Returns an iterator of shapely geometries from the shapefile.
 
@@ -240,19 +325,31 @@ class FionaReader(object):
         interface instead, extracting the geometry from the record with the
         :meth:`~Record.geometry` method.
 
+        Parameters
+        ----------
+        bbox: optional
+            A ``(xmin, ymin, xmax, ymax)`` bounding box. If given (or if one
+            was given to the reader), only the geometries intersecting it
+            are returned.
+
         """
-        for item in self._data:
-            yield item['geometry']
+        for geometry, _ in self._features(bbox):
+            yield geometry
 
-    def records(self):
+    def records(self, bbox=None):
         """
         Returns an iterator of :class:`~Record` instances.
 
+        Parameters
+        ----------
+        bbox: optional
+            A ``(xmin, ymin, xmax, ymax)`` bounding box. If given (or if one
+            was given to the reader), only the records intersecting it are
+            returned.
+
         """
-        for item in self._data:
-            yield FionaRecord(item['geometry'],
-                              {key: value for key, value in
-                               item.items() if key != 'geometry'})
+        for geometry, attributes in self._features(bbox):
+            yield FionaRecord(geometry, attributes)
 
 
 if _HAS_FIONA:
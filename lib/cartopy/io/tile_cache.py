@@ -0,0 +1,297 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of cartopy.
+#
+# cartopy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cartopy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with cartopy.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Provides persistent caches of the image tiles downloaded by the tile sources
+of :mod:`cartopy.io.img_tiles`.
+
+A cache may be given to a single tile source, or to all of them at once::
+
+    import cartopy.io.img_tiles as cimgt
+    from cartopy.io.tile_cache import DirectoryTileCache
+
+    cimgt.GoogleWTS.cache = DirectoryTileCache('/path/to/tiles',
+                                               max_size=2 * 1024 ** 3)
+
+Tiles are keyed by the URL template of their source and their ``(z, x, y)``
+position. An ``offline`` cache never downloads tiles, but serves only those
+it already holds (even if they have expired).
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+from abc import ABCMeta, abstractmethod
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import six
+
+from cartopy.io import _atomic_write
+
+
+class TileCache(six.with_metaclass(ABCMeta, object)):
+    """
+    The base class of the persistent caches of image tiles.
+
+    Parameters
+    ----------
+    max_size: optional
+        The maximum total size, in bytes, of the cached tiles. The least
+        recently used tiles are evicted when it is exceeded. Defaults to
+        None, meaning the size of the cache is unbounded.
+    ttl: optional
+        The time, in seconds, after which a cached tile expires and is
+        downloaded again. Defaults to None, meaning tiles never expire.
+    offline: optional
+        If True, tiles are never downloaded, and expired tiles are still
+        served. Defaults to False.
+
+    """
+    def __init__(self, max_size=None, ttl=None, offline=False):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.offline = offline
+
+    def _expired(self, created):
+        """Return whether a tile cached at the given time has expired."""
+        return (not self.offline and self.ttl is not None and
+                time.time() - created >= self.ttl)
+
+    @abstractmethod
+    def get(self, key):
+        """
+        Return the data of the tile with the given ``(source, z, x, y)``
+        key, or None if it is not cached (or has expired).
+
+        """
+        pass
+
+    @abstractmethod
+    def put(self, key, data):
+        """
+        Cache the data of the tile with the given ``(source, z, x, y)``
+        key, evicting the least recently used tiles if the cache has grown
+        too large.
+
+        """
+        pass
+
+
+class DirectoryTileCache(TileCache):
+    """
+    A cache of image tiles stored as individual files in a directory.
+
+    The modification time of each file records when the tile was
+    downloaded, and its access time when it was last used.
+
+    Parameters
+    ----------
+    directory
+        The directory to cache tiles in, which is created if necessary.
+
+    Other Parameters
+    ----------------
+    max_size, ttl, offline
+        See :class:`TileCache`.
+
+    """
+    def __init__(self, directory, max_size=None, ttl=None, offline=False):
+        super(DirectoryTileCache, self).__init__(max_size, ttl, offline)
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._size = None
+
+    def _path(self, key):
+        source, z, x, y = key
+        digest = hashlib.sha1(source.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest, str(z), str(x),
+                            '{}.tile'.format(y))
+
+    def _files(self):
+        """Return a list of the (access time, size, path) of each tile."""
+        files = []
+        for root, _, fnames in os.walk(self.directory):
+            for fname in fnames:
+                if not fname.endswith('.tile'):
+                    continue
+                path = os.path.join(root, fname)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_atime, stat.st_size, path))
+        return files
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            stat = os.stat(path)
+            if self._expired(stat.st_mtime):
+                return None
+            with open(path, 'rb') as fh:
+                data = fh.read()
+        except (IOError, OSError):
+            return None
+        try:
+            # Mark the tile as recently used, keeping its download time.
+            os.utime(path, (time.time(), stat.st_mtime))
+        except OSError:
+            pass
+        return data
+
+    def put(self, key, data):
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # Another thread (or process) may have created it.
+                if not os.path.isdir(directory):
+                    raise
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        # Write to a temporary file, then move it into place, so that a
+        # partially written tile can never be read.
+        with _atomic_write(path) as fh:
+            fh.write(data)
+
+        if self.max_size is None:
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._files())
+            else:
+                self._size += len(data) - old_size
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self):
+        files = sorted(self._files())
+        self._size = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if self._size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+
+
+class SQLiteTileCache(TileCache):
+    """
+    A cache of image tiles stored in a single SQLite database file.
+
+    Parameters
+    ----------
+    filename
+        The database file to cache tiles in, which is created if necessary.
+
+    Other Parameters
+    ----------------
+    max_size, ttl, offline
+        See :class:`TileCache`.
+
+    """
+    def __init__(self, filename, max_size=None, ttl=None, offline=False):
+        super(SQLiteTileCache, self).__init__(max_size, ttl, offline)
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(filename,
+                                           check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS tiles ('
+                'source TEXT NOT NULL, z INTEGER NOT NULL, '
+                'x INTEGER NOT NULL, y INTEGER NOT NULL, '
+                'data BLOB NOT NULL, created REAL NOT NULL, '
+                'accessed REAL NOT NULL, PRIMARY KEY (source, z, x, y))')
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS tiles_accessed '
+                'ON tiles (accessed)')
+            # The total size of the tiles is kept up to date as tiles are
+            # added and evicted, so that it is only summed once.
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS tiles_size '
+                '(size INTEGER NOT NULL)')
+            if self._connection.execute(
+                    'SELECT size FROM tiles_size').fetchone() is None:
+                self._connection.execute(
+                    'INSERT INTO tiles_size (size) '
+                    'SELECT COALESCE(SUM(LENGTH(data)), 0) FROM tiles')
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def get(self, key):
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                'SELECT data, created FROM tiles '
+                'WHERE source = ? AND z = ? AND x = ? AND y = ?',
+                key).fetchone()
+            if row is None or self._expired(row[1]):
+                return None
+            self._connection.execute(
+                'UPDATE tiles SET accessed = ? '
+                'WHERE source = ? AND z = ? AND x = ? AND y = ?',
+                (time.time(), ) + tuple(key))
+        return bytes(row[0])
+
+    def put(self, key, data):
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                'SELECT LENGTH(data) FROM tiles '
+                'WHERE source = ? AND z = ? AND x = ? AND y = ?',
+                key).fetchone()
+            self._connection.execute(
+                'INSERT OR REPLACE INTO tiles '
+                '(source, z, x, y, data, created, accessed) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                tuple(key) + (sqlite3.Binary(data), now, now))
+            self._connection.execute(
+                'UPDATE tiles_size SET size = size + ?',
+                (len(data) - (row[0] if row else 0), ))
+            if self.max_size is not None:
+                self._evict()
+
+    def _evict(self):
+        size, = self._connection.execute(
+            'SELECT size FROM tiles_size').fetchone()
+        if size <= self.max_size:
+            return
+        evicted = []
+        evicted_size = 0
+        rows = self._connection.execute(
+            'SELECT rowid, LENGTH(data) FROM tiles ORDER BY accessed')
+        for rowid, tile_size in rows:
+            if size - evicted_size <= self.max_size:
+                break
+            evicted.append((rowid, ))
+            evicted_size += tile_size
+        self._connection.executemany('DELETE FROM tiles WHERE rowid = ?',
+                                     evicted)
+        self._connection.execute('UPDATE tiles_size SET size = size - ?',
+                                 (evicted_size, ))
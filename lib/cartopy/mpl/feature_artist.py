@@ -22,14 +22,22 @@ This module defines the :class:`FeatureArtist` class, for drawing
 
 from __future__ import (absolute_import, division, print_function)
 
+import atexit
 from collections import OrderedDict
+import hashlib
+import os
 import warnings
 import weakref
 
 import numpy as np
 import matplotlib.artist
 import matplotlib.collections
+from matplotlib.path import Path
+import shapely.errors
+import shapely.geometry as sgeom
 
+from cartopy import config
+from cartopy.io import _atomic_write, _evict_lru
 import cartopy.mpl.patch as cpatch
 from .style import merge as style_merge, finalize as style_finalize
 
@@ -69,6 +77,237 @@ def _freeze(obj):
     return obj
 
 
+#: The errors that may be raised when clipping an invalid geometry.
+_CLIP_ERRORS = tuple(getattr(shapely.errors, name)
+                     for name in ('TopologicalError', 'GEOSException')
+                     if hasattr(shapely.errors, name))
+
+
+def _clip_tile(extent, buffer=0.1):
+    """
+    Return the ``(x0, x1, y0, y1)`` tile which contains the given extent,
+    grown by the given fraction of its size, or None if the extent is empty.
+
+    The tile is aligned to a grid whose spacing is the power of two no
+    smaller than the size of the grown extent, so that small pans and zooms
+    of the view resolve to the same tile.
+
+    """
+    x0, x1, y0, y1 = extent
+    span = max(x1 - x0, y1 - y0)
+    if not span > 0:
+        return None
+    pad = buffer * span
+    size = 2.0 ** np.ceil(np.log2(span + 2 * pad))
+    return (float(np.floor((x0 - pad) / size) * size),
+            float(np.ceil((x1 + pad) / size) * size),
+            float(np.floor((y0 - pad) / size) * size),
+            float(np.ceil((y1 + pad) / size) * size))
+
+
+def _within_tile(bounds, tile):
+    """
+    Return whether the given ``(minx, miny, maxx, maxy)`` geometry bounds
+    lie within the given ``(x0, x1, y0, y1)`` tile.
+
+    """
+    if not bounds:
+        # Empty geometries have no bounds.
+        return True
+    return (tile[0] <= bounds[0] and bounds[2] <= tile[1] and
+            tile[2] <= bounds[1] and bounds[3] <= tile[3])
+
+
+def _simplify_path(path, tolerance):
+    """
+    Return a copy of the given path with each of its parts simplified, with
+    the Douglas-Peucker algorithm, to the given tolerance.
+
+    Closed parts (rings) smaller than the tolerance are dropped entirely,
+    and None is returned if no part of the path remains.
+
+    """
+    vertices = path.vertices
+    codes = path.codes
+    if codes is None:
+        starts = np.array([0])
+    else:
+        starts = np.flatnonzero(codes == Path.MOVETO)
+        if len(starts) == 0 or starts[0] != 0:
+            # Not a path we know how to split into parts.
+            return path
+    stops = np.append(starts[1:], len(vertices))
+
+    new_vertices = []
+    new_codes = []
+    for start, stop in zip(starts, stops):
+        part = vertices[start:stop]
+        closed = codes is not None and codes[stop - 1] == Path.CLOSEPOLY
+        if closed and np.ptp(part, axis=0).max() < tolerance:
+            continue
+        if len(part) > 3:
+            line = sgeom.LineString(part)
+            part = np.asarray(line.simplify(tolerance,
+                                            preserve_topology=False).coords)
+        part_codes = np.full(len(part), Path.LINETO, dtype=Path.code_type)
+        part_codes[0] = Path.MOVETO
+        if closed:
+            part_codes[-1] = Path.CLOSEPOLY
+        new_vertices.append(part)
+        new_codes.append(part_codes)
+
+    if not new_vertices:
+        return None
+    new_vertices = np.concatenate(new_vertices)
+    if len(new_vertices) == len(vertices):
+        return path
+    return Path(new_vertices, np.concatenate(new_codes))
+
+
+class _PathStore(object):
+    """
+    A persistent, on-disk store of the projected paths of the geometries
+    of a feature, for a single target projection.
+
+    Geometries are identified by their position in the feature's sequence
+    of geometries, so a store must only be used with features that can
+    provide a persistent key (see :meth:`Feature._persistent_key`).
+
+    """
+    #: The version of the on-disk format. Stores with a different version
+    #: are ignored (and eventually evicted).
+    version = 1
+
+    #: The store is only rewritten once the geometries added since it was
+    #: last written number at least this fraction of those already written,
+    #: so that the cost of writing a growing store stays proportional to
+    #: its size. Any remaining geometries are written at exit.
+    save_fraction = 0.25
+
+    def __init__(self, directory, feature_key, geometries, projection):
+        key = repr((self.version, feature_key, projection.proj4_init))
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        self.directory = directory
+        self.fname = os.path.join(directory, digest + '.npz')
+        self._index = {id(geom): i for i, geom in enumerate(geometries)}
+        # Keep the geometries alive so that their ids remain valid.
+        self._geometries = geometries
+        self._paths = {}
+        self.modified = False
+        self._load()
+        self._n_saved = len(self._paths)
+        self._n_unsaved = 0
+
+    def _load(self):
+        try:
+            with np.load(self.fname) as data:
+                if int(data['version']) != self.version:
+                    return
+                geom_index = data['geom_index']
+                n_vertices = data['n_vertices']
+                has_codes = data['has_codes']
+                vertices = data['vertices']
+                codes = data['codes']
+                for i in data['geoms']:
+                    self._paths[int(i)] = []
+        except (IOError, OSError, KeyError, ValueError):
+            # A missing, partially written or otherwise unreadable store is
+            # simply treated as empty.
+            return
+
+        offsets = np.concatenate([[0], np.cumsum(n_vertices)])
+        for i, start, stop, coded in zip(geom_index, offsets[:-1],
+                                         offsets[1:], has_codes):
+            path_codes = codes[start:stop] if coded else None
+            self._paths[int(i)].append(Path(vertices[start:stop],
+                                            path_codes))
+        # Touch the file so that eviction is least-recently-used.
+        os.utime(self.fname, None)
+
+    def get(self, geom):
+        """Return the stored paths for the given geometry, or None."""
+        index = self._index.get(id(geom))
+        return self._paths.get(index)
+
+    def add(self, geom, paths):
+        """Store the projected paths of the given geometry."""
+        index = self._index.get(id(geom))
+        if index is not None:
+            self._paths[index] = paths
+            self._n_unsaved += 1
+            self.modified = True
+
+    def save(self, max_size, force=False):
+        """
+        Write the store to disk, evicting the least recently used stores
+        in the same directory so that it does not exceed ``max_size`` bytes.
+
+        Unless ``force`` is True, the write is deferred until enough new
+        geometries have been added (see :attr:`save_fraction`).
+
+        """
+        if (not force and
+                self._n_unsaved < self.save_fraction * self._n_saved):
+            return
+        geom_index = []
+        n_vertices = []
+        has_codes = []
+        vertices = []
+        codes = []
+        for i, paths in self._paths.items():
+            for path in paths:
+                geom_index.append(i)
+                n_vertices.append(len(path.vertices))
+                has_codes.append(path.codes is not None)
+                vertices.append(path.vertices)
+                if path.codes is None:
+                    codes.append(np.zeros(len(path.vertices), np.uint8))
+                else:
+                    codes.append(path.codes)
+        if not vertices:
+            vertices = [np.empty((0, 2))]
+            codes = [np.empty(0, np.uint8)]
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        with _atomic_write(self.fname) as fh:
+            np.savez(fh, version=self.version,
+                     geoms=np.array(list(self._paths), dtype=np.int64),
+                     geom_index=np.array(geom_index, dtype=np.int64),
+                     n_vertices=np.array(n_vertices, dtype=np.int64),
+                     has_codes=np.array(has_codes, dtype=bool),
+                     vertices=np.concatenate(vertices).astype(np.float64),
+                     codes=np.concatenate(codes).astype(Path.code_type))
+        self.modified = False
+        self._n_saved = len(self._paths)
+        self._n_unsaved = 0
+        _evict_lru(self.directory, max_size)
+
+
+def _flush_path_stores():
+    """Write the geometries not yet written by each path store."""
+    for store in list(FeatureArtist._path_stores.values()):
+        if store.modified:
+            try:
+                store.save(FeatureArtist.persistent_cache_size, force=True)
+            except (IOError, OSError):
+                pass
+
+
+atexit.register(_flush_path_stores)
+
+
+def _geom_to_paths(geom, projection, feature_crs):
+    """
+    Project (if necessary) the given geometry from the feature CRS to the
+    given projection and convert it to a list of Matplotlib paths.
+
+    """
+    if projection != feature_crs:
+        geom = projection.project_geometry(geom, feature_crs)
+    return cpatch.geos_to_path(geom)
+
+
 class FeatureArtist(matplotlib.artist.Artist):
     """
     A subclass of :class:`~matplotlib.artist.Artist` capable of
@@ -92,6 +331,62 @@ class FeatureArtist(matplotlib.artist.Artist):
     This provides a significant boost when producing multiple maps of the
     same projection.
 
+    """
+    _path_stores = {}
+    """
+    A mapping from persistent feature key and target projection to the
+    :class:`_PathStore` that persists the projected paths of that feature
+    in the ``feature_cache_dir`` of :data:`cartopy.config`.
+
+    """
+    _geom_key_to_clipped_path_cache = weakref.WeakKeyDictionary()
+    """
+    A nested mapping from geometry (converted to a _GeomKey), target
+    projection and clip tile to the transformed Matplotlib paths of the
+    geometry clipped to that tile::
+
+        {geom: {(target_projection, tile): list_of_paths}}
+
+    Only the most recently used :attr:`clipped_cache_size` tiles are kept
+    for each geometry.
+
+    """
+    clipped_cache_size = 8
+    """
+    The maximum number of clip tiles for which the clipped paths of a
+    geometry are cached.
+
+    """
+    _geom_key_to_simplified_path_cache = weakref.WeakKeyDictionary()
+    """
+    A nested mapping from geometry (converted to a _GeomKey), target
+    projection, clip tile (or None) and tolerance to the simplified
+    transformed Matplotlib paths of the geometry::
+
+        {geom: {(target_projection, tile, tolerance): list_of_paths}}
+
+    Only the most recently used :attr:`simplified_cache_size` variants are
+    kept for each geometry.
+
+    """
+    simplified_cache_size = 8
+    """
+    The maximum number of simplified variants of the paths of a geometry
+    which are cached.
+
+    """
+    simplify_tolerance = 0.5
+    """
+    The tolerance, in pixels, to which geometries are simplified when
+    drawn by an artist created with ``simplify=True``.
+
+    """
+    persistent_cache_size = 256 * 1024 ** 2
+    """
+    The maximum size, in bytes, of the ``feature_cache_dir`` of
+    :data:`cartopy.config`. The least recently used projected features are
+    evicted when this is exceeded.
+
     """
 
     def __init__(self, feature, **kwargs):
@@ -103,6 +398,18 @@ class FeatureArtist(matplotlib.artist.Artist):
         styler
             A callable that given a gemometry, returns matplotlib styling
             parameters.
+        clip_to_extent: optional
+            If True, geometries which extend beyond the (buffered) extent of
+            the axes are clipped to it, in the coordinate system of the
+            feature, before they are projected. This keeps the cost of
+            projecting large geometries proportional to the visible part of
+            them when zoomed in. Defaults to False.
+        simplify: optional
+            If True, projected geometries are simplified to a tolerance of
+            :attr:`simplify_tolerance` pixels, given the current extent and
+            size of the axes, before they are drawn. This keeps the number
+            of vertices drawn proportional to the size of the output rather
+            than to the resolution of the feature. Defaults to False.
 
         Other Parameters
         ----------------
@@ -116,6 +423,8 @@ class FeatureArtist(matplotlib.artist.Artist):
         if kwargs is None:
             kwargs = {}
         self._styler = kwargs.pop('styler', None)
+        self._clip_to_extent = kwargs.pop('clip_to_extent', False)
+        self._simplify = kwargs.pop('simplify', False)
         self._kwargs = dict(kwargs)
 
         if 'color' in self._kwargs:
@@ -172,9 +481,20 @@ class FeatureArtist(matplotlib.artist.Artist):
         # need to unfreeze this with dict(frozen) before passing to mpl.
         prepared_kwargs = _freeze(prepared_kwargs)
 
+        # The tile to clip geometries to before projecting them, if any.
+        tile = None
+        if self._clip_to_extent and extent is not None:
+            tile = _clip_tile(extent)
+
+        # The tolerance to simplify projected geometries to, if any.
+        tolerance = None
+        if self._simplify:
+            tolerance = self._tolerance()
+
         # Project (if necessary) and convert geometries to matplotlib paths.
         stylised_paths = OrderedDict()
         key = ax.projection
+        store = self._path_store(key)
         for geom in geoms:
             # As Shapely geometries cannot be relied upon to be
             # hashable, we have to use a WeakValueDictionary to manage
@@ -190,17 +510,27 @@ class FeatureArtist(matplotlib.artist.Artist):
             geom_key = _GeomKey(geom)
             FeatureArtist._geom_key_to_geometry_cache.setdefault(
                 geom_key, geom)
-            mapping = FeatureArtist._geom_key_to_path_cache.setdefault(
-                geom_key, {})
-            geom_paths = mapping.get(key)
-            if geom_paths is None:
-                if ax.projection != feature_crs:
-                    projected_geom = ax.projection.project_geometry(
-                        geom, feature_crs)
-                else:
-                    projected_geom = geom
-                geom_paths = cpatch.geos_to_path(projected_geom)
-                mapping[key] = geom_paths
+            if tile is not None and not _within_tile(geom.bounds, tile):
+                geom_tile = tile
+                geom_paths = self._clipped_paths(geom_key, geom, tile,
+                                                 key, feature_crs)
+            else:
+                geom_tile = None
+                mapping = FeatureArtist._geom_key_to_path_cache.setdefault(
+                    geom_key, {})
+                geom_paths = mapping.get(key)
+                if geom_paths is None and store is not None:
+                    geom_paths = store.get(geom)
+                    if geom_paths is not None:
+                        mapping[key] = geom_paths
+                if geom_paths is None:
+                    geom_paths = _geom_to_paths(geom, key, feature_crs)
+                    mapping[key] = geom_paths
+                    if store is not None:
+                        store.add(geom, geom_paths)
+            if tolerance is not None:
+                geom_paths = self._simplified_paths(
+                    geom_key, geom_paths, (key, geom_tile, tolerance))
 
             if not self._styler:
                 style = prepared_kwargs
@@ -211,6 +541,13 @@ class FeatureArtist(matplotlib.artist.Artist):
 
             stylised_paths.setdefault(style, []).extend(geom_paths)
 
+        if store is not None and store.modified:
+            try:
+                store.save(self.persistent_cache_size)
+            except (IOError, OSError) as err:
+                warnings.warn('Unable to write to the feature cache: '
+                              '{}'.format(err))
+
         transform = ax.projection._as_mpl_transform(ax)
 
         # Draw one PathCollection per style. We could instead pass an array
@@ -227,3 +564,90 @@ class FeatureArtist(matplotlib.artist.Artist):
 
         # n.b. matplotlib.collection.Collection.draw returns None
         return None
+
+    def _clipped_paths(self, geom_key, geom, tile, projection, feature_crs):
+        """
+        Return the paths of the given geometry, clipped to the given tile
+        and projected to the given projection.
+
+        """
+        mapping = FeatureArtist._geom_key_to_clipped_path_cache.setdefault(
+            geom_key, OrderedDict())
+        key = (projection, tile)
+        geom_paths = mapping.pop(key, None)
+        if geom_paths is None:
+            x0, x1, y0, y1 = tile
+            try:
+                clipped_geom = geom.intersection(sgeom.box(x0, y0, x1, y1))
+            except _CLIP_ERRORS:
+                # Invalid geometries cannot be clipped, so project them
+                # whole instead.
+                clipped_geom = geom
+            geom_paths = _geom_to_paths(clipped_geom, projection, feature_crs)
+        mapping[key] = geom_paths
+        while len(mapping) > self.clipped_cache_size:
+            mapping.popitem(last=False)
+        return geom_paths
+
+    def _simplified_paths(self, geom_key, geom_paths, key):
+        """
+        Return the given paths of a geometry simplified to the tolerance
+        given as the last item of the cache key.
+
+        """
+        mapping = FeatureArtist._geom_key_to_simplified_path_cache.setdefault(
+            geom_key, OrderedDict())
+        simplified_paths = mapping.pop(key, None)
+        if simplified_paths is None:
+            tolerance = key[-1]
+            simplified_paths = []
+            for path in geom_paths:
+                path = _simplify_path(path, tolerance)
+                if path is not None:
+                    simplified_paths.append(path)
+        mapping[key] = simplified_paths
+        while len(mapping) > self.simplified_cache_size:
+            mapping.popitem(last=False)
+        return simplified_paths
+
+    def _tolerance(self):
+        """
+        Return the simplification tolerance, in projected units, for the
+        current extent and size of the axes, or None if it is unknown.
+
+        The tolerance is rounded down to a power of two so that simplified
+        paths can be reused across similar resolutions.
+
+        """
+        view = self.axes.viewLim
+        bbox = self.axes.bbox
+        if not (bbox.width > 0 and bbox.height > 0):
+            return None
+        pixel_size = min(abs(view.width) / bbox.width,
+                         abs(view.height) / bbox.height)
+        tolerance = self.simplify_tolerance * pixel_size
+        if not (np.isfinite(tolerance) and tolerance > 0):
+            return None
+        return 2.0 ** np.floor(np.log2(tolerance))
+
+    def _path_store(self, projection):
+        """
+        Return the :class:`_PathStore` persisting the projected paths of
+        this artist's feature in the given projection, or None if the
+        persistent cache is disabled or the feature cannot be persisted.
+
+        """
+        directory = config.get('feature_cache_dir')
+        if directory is None:
+            return None
+        feature_key = self._feature._persistent_key()
+        if feature_key is None:
+            return None
+        store_key = (directory, feature_key, projection)
+        store = FeatureArtist._path_stores.get(store_key)
+        if store is None:
+            geometries = tuple(self._feature.geometries())
+            store = _PathStore(directory, feature_key, geometries,
+                               projection)
+            FeatureArtist._path_stores[store_key] = store
+        return store
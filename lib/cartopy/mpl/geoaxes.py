@@ -26,6 +26,8 @@ from __future__ import (absolute_import, division, print_function)
 
 import collections
 import contextlib
+import hashlib
+import os
 import warnings
 import weakref
 
@@ -46,6 +48,8 @@ from cartopy import config
 import cartopy.crs as ccrs
 import cartopy.feature
 import cartopy.img_transform
+from cartopy.io import _atomic_write, _evict_lru
+import cartopy.io.img_pyramid as img_pyramid
 import cartopy.mpl.feature_artist as feature_artist
 import cartopy.mpl.patch as cpatch
 from cartopy.mpl.slippy_image_artist import SlippyImageArtist
@@ -80,6 +84,21 @@ A dictionary of background images in the directory specified by the
 CARTOPY_USER_BACKGROUNDS environment variable.
 """
 
+_WARPED_IMG_CACHE = collections.OrderedDict()
+"""
+A least recently used mapping from the key of a background image, the
+target projection, extent and regrid shape, to the image warped into that
+projection and its extent, so that maps sharing a projection warp a
+background image only once::
+
+    {(image_key, proj4_init, target_extent, regrid_shape): (img, extent)}
+
+"""
+
+#: The version of the on-disk format of the warped background images in
+#: the ``warped_image_cache_dir`` of :data:`cartopy.config`.
+_WARPED_IMG_VERSION = 1
+
 
 # XXX call this InterCRSTransform
 class InterProjectionTransform(mtransforms.Transform):
@@ -144,8 +163,7 @@ class InterProjectionTransform(mtransforms.Transform):
         """
         prj = self.target_projection
         if isinstance(xy, np.ndarray):
-            return prj.transform_points(self.source_projection,
-                                        xy[:, 0], xy[:, 1])[:, 0:2]
+            return prj.transform_coords(self.source_projection, xy)
         else:
             x, y = xy
             x, y = prj.transform_point(x, y, self.source_projection)
@@ -297,6 +315,16 @@ class GeoAxes(matplotlib.axes.Axes):
         plt.contourf(x, y, data, transform=cartopy.crs.PlateCarree())
 
     """
+    #: The maximum number of background images, warped into the projection
+    #: of a map by :meth:`stock_img` or :meth:`background_img`, which are
+    #: kept in memory for reuse by other maps.
+    warped_image_cache_size = 16
+
+    #: The maximum size, in bytes, of the ``warped_image_cache_dir`` of
+    #: :data:`cartopy.config`, beyond which the least recently used warped
+    #: background images are removed.
+    warped_image_dir_size = 512 * 1024 ** 2
+
     def __init__(self, *args, **kwargs):
         """
         Create a GeoAxes object using standard matplotlib
@@ -614,6 +642,14 @@ class GeoAxes(matplotlib.axes.Axes):
             The cartopy CRS in which the provided geometries are defined.
         styler
             A callable that returns matplotlib patch styling given a geometry.
+        clip_to_extent: optional
+            Whether to clip the geometries to the extent of the map before
+            projecting them. See
+            :class:`~cartopy.mpl.feature_artist.FeatureArtist`.
+        simplify: optional
+            Whether to simplify the projected geometries to the resolution
+            of the map. See
+            :class:`~cartopy.mpl.feature_artist.FeatureArtist`.
 
         Returns
         -------
@@ -628,9 +664,12 @@ class GeoAxes(matplotlib.axes.Axes):
 
 
         """
-        styler = kwargs.pop('styler', None)
+        artist_kwargs = {'styler': kwargs.pop('styler', None)}
+        for name in ('clip_to_extent', 'simplify'):
+            if name in kwargs:
+                artist_kwargs[name] = kwargs.pop(name)
         feature = cartopy.feature.ShapelyFeature(geoms, crs, **kwargs)
-        return self.add_feature(feature, styler=styler)
+        return self.add_feature(feature, **artist_kwargs)
 
     def get_extent(self, crs=None):
         """
@@ -679,7 +718,7 @@ class GeoAxes(matplotlib.axes.Axes):
                                  ' coordinate system {!r}'.format(crs))
 
         # Calculate intersection with boundary and project if necessary.
-        boundary_poly = sgeom.Polygon(self.projection.boundary)
+        boundary_poly = self.projection.domain
         if proj != self.projection:
             # Erode boundary by threshold to avoid transform issues.
             # This is a workaround for numerical issues at the boundary.
@@ -879,17 +918,22 @@ class GeoAxes(matplotlib.axes.Axes):
         Currently, the only (and default) option is a downsampled version of
         the Natural Earth shaded relief raster.
 
+        The image warped into the projection of the map is cached, so that
+        other maps with the same projection and extent reuse it (see
+        :attr:`warped_image_cache_size`).
+
         """
         if name == 'ne_shaded':
-            import os
             source_proj = ccrs.PlateCarree()
             fname = os.path.join(config["repo_data_dir"],
                                  'raster', 'natural_earth',
                                  '50-natural-earth-1-downsampled.png')
 
-            return self.imshow(imread(fname), origin='upper',
-                               transform=source_proj,
-                               extent=[-180, 180, -90, 90])
+            def load():
+                return imread(fname), [-180, 180, -90, 90]
+
+            return self._imshow_background(
+                (fname, os.path.getmtime(fname)), load, source_proj)
         else:
             raise ValueError('Unknown stock image %r.' % name)
 
@@ -931,11 +975,19 @@ class GeoAxes(matplotlib.axes.Axes):
             images into memory. The images are stored before the
             extent is used.
 
+        If the resolution gives an image pyramid (see
+        :mod:`cartopy.io.img_pyramid`), only the tiles covering the extent,
+        or else the map, are read, from the coarsest level of the pyramid
+        which still resolves the map.
+
+        The image warped into the projection of the map is always cached, so
+        that other maps with the same projection and extent reuse it (see
+        :attr:`warped_image_cache_size`).
+
         """
         # read in the user's background image directory:
         if len(_USER_BG_IMGS) == 0:
             self.read_user_background_images()
-        import os
         bgdir = os.getenv('CARTOPY_USER_BACKGROUNDS')
         if bgdir is None:
             bgdir = os.path.join(config["repo_data_dir"],
@@ -947,20 +999,6 @@ class GeoAxes(matplotlib.axes.Axes):
             msg = ('Image "{}" and resolution "{}" are not present in '
                    'the user background image metadata in directory "{}"')
             raise ValueError(msg.format(name, resolution, bgdir))
-        # Now obtain the image data from file or cache:
-        fpath = os.path.join(bgdir, fname)
-        if cache:
-            if fname in _BACKG_IMG_CACHE:
-                img = _BACKG_IMG_CACHE[fname]
-            else:
-                img = imread(fpath)
-                _BACKG_IMG_CACHE[fname] = img
-        else:
-            img = imread(fpath)
-        if len(img.shape) == 2:
-            # greyscale images are only 2-dimensional, so need replicating
-            # to 3 colour channels:
-            img = np.repeat(img[:, :, np.newaxis], 3, axis=2)
         # now get the projection from the metadata:
         if _USER_BG_IMGS[name]['__projection__'] == 'PlateCarree':
             # currently only PlateCarree is defined:
@@ -968,12 +1006,30 @@ class GeoAxes(matplotlib.axes.Axes):
         else:
             raise NotImplementedError('Background image projection undefined')
 
-        if extent is None:
-            # not specifying an extent, so return all of it:
-            return self.imshow(img, origin='upper',
-                               transform=source_proj,
-                               extent=[-180, 180, -90, 90])
-        else:
+        fpath = os.path.join(bgdir, fname)
+        if img_pyramid.is_pyramid(fpath):
+            return self._pyramid_background_img(fname, fpath, source_proj,
+                                                extent, cache)
+
+        def load():
+            # Now obtain the image data from file or cache:
+            if cache:
+                if fname in _BACKG_IMG_CACHE:
+                    img = _BACKG_IMG_CACHE[fname]
+                else:
+                    img = imread(fpath)
+                    _BACKG_IMG_CACHE[fname] = img
+            else:
+                img = imread(fpath)
+            if len(img.shape) == 2:
+                # greyscale images are only 2-dimensional, so need
+                # replicating to 3 colour channels:
+                img = np.repeat(img[:, :, np.newaxis], 3, axis=2)
+
+            if extent is None:
+                # not specifying an extent, so return all of it:
+                return img, [-180, 180, -90, 90]
+
             # return only a subset of the image:
             # set up coordinate arrays:
             d_lat = 180.0 / img.shape[0]
@@ -1011,10 +1067,44 @@ class GeoAxes(matplotlib.axes.Axes):
                               lon_pts[lon_in_range][-1] + d_lon / 2.0,
                               lat_pts[lat_in_range][-1] - d_lat / 2.0,
                               lat_pts[lat_in_range][0] + d_lat / 2.0]
+            return img_subset, ret_extent
+
+        image_key = (fpath, os.path.getmtime(fpath),
+                     None if extent is None else tuple(extent))
+        return self._imshow_background(image_key, load, source_proj)
 
-            return self.imshow(img_subset, origin='upper',
-                               transform=source_proj,
-                               extent=ret_extent)
+    def _pyramid_background_img(self, fname, fpath, source_proj, extent,
+                                cache):
+        """
+        Add a background image from the image pyramid in the given
+        directory, decoding only the tiles which cover the given extent (or
+        else the map) from the coarsest level which resolves the map.
+
+        """
+        if cache and fname in _BACKG_IMG_CACHE:
+            pyramid = _BACKG_IMG_CACHE[fname]
+        else:
+            pyramid = img_pyramid.ImagePyramid(fpath)
+            if cache:
+                # Keep the pyramid, and so its decoded tiles.
+                _BACKG_IMG_CACHE[fname] = pyramid
+        if extent is None:
+            extent = self.get_extent(source_proj)
+        target_res = self._regrid_shape_aspect(
+            750, self.get_extent(self.projection))
+
+        def load():
+            img, img_extent = pyramid.image(extent, target_res)
+            if img.ndim == 2:
+                # greyscale images are only 2-dimensional, so need
+                # replicating to 3 colour channels:
+                img = np.repeat(img[:, :, np.newaxis], 3, axis=2)
+            return img, img_extent
+
+        mtime = os.path.getmtime(os.path.join(fpath,
+                                              img_pyramid.METADATA_FNAME))
+        image_key = (fpath, mtime, tuple(extent))
+        return self._imshow_background(image_key, load, source_proj)
 
     def read_user_background_images(self, verify=True):
         """
@@ -1028,7 +1118,9 @@ class GeoAxes(matplotlib.axes.Axes):
         level dictionary. The first level is the image type.
         For each image type there must be the fields:
         __comment__, __source__ and __projection__
-        and then an element giving the filename for each resolution.
+        and then an element giving the filename for each resolution. In
+        place of a filename, a resolution may give the directory of an
+        image pyramid built by :func:`cartopy.io.img_pyramid.build_pyramid`.
 
         An example JSON file can be found at:
         lib/cartopy/data/raster/natural_earth/images.json
@@ -1068,7 +1160,8 @@ class GeoAxes(matplotlib.axes.Axes):
                         if resln not in required_info:
                             img_it_r = _USER_BG_IMGS[img_type][resln]
                             test_file = os.path.join(bgdir, img_it_r)
-                            if not os.path.isfile(test_file):
+                            if not (os.path.isfile(test_file) or
+                                    img_pyramid.is_pyramid(test_file)):
                                 msg = 'File "{}" not found'
                                 raise ValueError(msg.format(test_file))
 
@@ -1089,6 +1182,14 @@ class GeoAxes(matplotlib.axes.Axes):
              Note that image retrievals are done at draw time,
              not at creation time.
 
+        Other Parameters
+        ----------------
+        **slippy_image_kwargs
+            Passed through to
+            :class:`~cartopy.mpl.slippy_image_artist.SlippyImageArtist`.
+            For example, ``background_fetch=True`` fetches images in the
+            background, keeping an interactive figure responsive.
+
         """
         # Allow a fail-fast error if the raster source cannot provide
         # images in the current projection.
@@ -1139,6 +1240,12 @@ class GeoAxes(matplotlib.axes.Axes):
             image being transformed into a global PlateCarree
             projection the resulting transformed image would
             have a shape of ``(750, 1500)``.
+        regrid_method: {'nearest', 'bilinear', 'area'}
+            The method used to transform the image. The smoother
+            ``'bilinear'`` and ``'area'`` methods give good results with
+            a much smaller *regrid_shape*. See
+            :class:`~cartopy.img_transform.Regridder` for details.
+            Default is ``'nearest'``.
         extent: tuple
             The corner coordinates of the image in the form
             ``(left, right, bottom, top)``. The coordinates should
@@ -1183,35 +1290,144 @@ class GeoAxes(matplotlib.axes.Axes):
             regrid_shape = kwargs.pop('regrid_shape', 750)
             regrid_shape = self._regrid_shape_aspect(regrid_shape,
                                                      target_extent)
-            warp_array = cartopy.img_transform.warp_array
-            img, extent = warp_array(img,
-                                     source_proj=transform,
-                                     source_extent=extent,
-                                     target_proj=self.projection,
-                                     target_res=regrid_shape,
-                                     target_extent=target_extent,
-                                     mask_extrapolated=True,
-                                     )
-
-            # As a workaround to a matplotlib limitation, turn any images
-            # which are RGB with a mask into RGBA images with an alpha
-            # channel.
-            if (isinstance(img, np.ma.MaskedArray) and
-                    img.shape[2:3] == (3, ) and
-                    img.mask is not False):
-                old_img = img
-                img = np.zeros(img.shape[:2] + (4, ), dtype=img.dtype)
-                img[:, :, 0:3] = old_img
-                # Put an alpha channel in if the image was masked.
-                img[:, :, 3] = ~ np.any(old_img.mask, axis=2)
-                if img.dtype.kind == 'u':
-                    img[:, :, 3] *= 255
-
+            regrid_method = kwargs.pop('regrid_method', 'nearest')
+            img, extent = self._warp_image(img, transform, extent,
+                                           target_extent, regrid_shape,
+                                           regrid_method)
             result = matplotlib.axes.Axes.imshow(self, img, *args,
                                                  extent=extent, **kwargs)
 
         return result
 
+    def _warp_image(self, img, source_proj, source_extent, target_extent,
+                    regrid_shape, regrid_method='nearest'):
+        """
+        Warp an image (with a 'lower' origin) from the source projection into
+        the given extent of the projection of these axes, returning the
+        warped image and its extent.
+
+        """
+        warp_array = cartopy.img_transform.warp_array
+        img, extent = warp_array(img,
+                                 source_proj=source_proj,
+                                 source_extent=source_extent,
+                                 target_proj=self.projection,
+                                 target_res=regrid_shape,
+                                 target_extent=target_extent,
+                                 mask_extrapolated=True,
+                                 method=regrid_method,
+                                 )
+
+        # As a workaround to a matplotlib limitation, turn any images
+        # which are RGB with a mask into RGBA images with an alpha
+        # channel.
+        if (isinstance(img, np.ma.MaskedArray) and
+                img.shape[2:3] == (3, ) and
+                img.mask is not False):
+            old_img = img
+            img = np.zeros(img.shape[:2] + (4, ), dtype=img.dtype)
+            img[:, :, 0:3] = old_img
+            # Put an alpha channel in if the image was masked.
+            img[:, :, 3] = ~ np.any(old_img.mask, axis=2)
+            if img.dtype.kind == 'u':
+                img[:, :, 3] *= 255
+        return img, extent
+
+    def _imshow_background(self, image_key, load, source_proj):
+        """
+        Add a background image to the map, reusing the image warped into
+        the projection of these axes by any map (in this session, or in the
+        ``warped_image_cache_dir`` of :data:`cartopy.config`) which showed
+        the same image, with the same key, over the same extent.
+
+        Parameters
+        ----------
+        image_key
+            A key, which must have a stable repr, identifying the image
+            and its source extent.
+        load
+            A callable returning the image (with an 'upper' origin) and its
+            extent in the source projection.
+        source_proj
+            The :class:`~cartopy.crs.Projection` of the image.
+
+        """
+        if self.projection == source_proj:
+            # There is nothing to warp.
+            img, extent = load()
+            return self.imshow(img, origin='upper', transform=source_proj,
+                               extent=extent)
+
+        target_extent = self.get_extent(self.projection)
+        regrid_shape = self._regrid_shape_aspect(750, target_extent)
+        key = (image_key, self.projection.proj4_init, tuple(target_extent),
+               tuple(regrid_shape))
+        warped = _WARPED_IMG_CACHE.pop(key, None)
+        if warped is None:
+            warped = self._load_warped_image(key)
+        if warped is None:
+            img, extent = load()
+            warped = self._warp_image(np.asanyarray(img)[::-1], source_proj,
+                                      extent, target_extent, regrid_shape)
+            self._save_warped_image(key, warped)
+        _WARPED_IMG_CACHE[key] = warped
+        while len(_WARPED_IMG_CACHE) > self.warped_image_cache_size:
+            _WARPED_IMG_CACHE.popitem(last=False)
+
+        img, extent = warped
+        return matplotlib.axes.Axes.imshow(self, img, origin='lower',
+                                           extent=extent)
+
+    @staticmethod
+    def _warped_image_fname(key):
+        """
+        Return the name of the file in the ``warped_image_cache_dir`` of
+        :data:`cartopy.config` for the warped image with the given key, or
+        None if that directory is not configured.
+
+        """
+        directory = config.get('warped_image_cache_dir')
+        if directory is None:
+            return None
+        key = repr((_WARPED_IMG_VERSION, key))
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(directory, digest + '.npz')
+
+    def _load_warped_image(self, key):
+        fname = self._warped_image_fname(key)
+        if fname is None:
+            return None
+        try:
+            with np.load(fname) as data:
+                img = data['img']
+                if 'mask' in data:
+                    img = np.ma.array(img, mask=data['mask'])
+                extent = [float(value) for value in data['extent']]
+        except (IOError, OSError, KeyError, ValueError):
+            # A missing, partially written or otherwise unreadable image is
+            # simply warped again.
+            return None
+        # Touch the file so that eviction is least-recently-used.
+        os.utime(fname, None)
+        return img, extent
+
+    def _save_warped_image(self, key, warped):
+        fname = self._warped_image_fname(key)
+        if fname is None:
+            return
+        img, extent = warped
+        arrays = {'img': np.ma.getdata(img), 'extent': np.asarray(extent)}
+        if np.ma.isMaskedArray(img):
+            arrays['mask'] = np.ma.getmaskarray(img)
+        directory = os.path.dirname(fname)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        # Write to a temporary file first so that concurrent readers never
+        # see a partially written image.
+        with _atomic_write(fname) as fh:
+            np.savez(fh, **arrays)
+        _evict_lru(directory, self.warped_image_dir_size)
+
     def gridlines(self, crs=None, draw_labels=False, xlocs=None,
                   ylocs=None, **kwargs):
         """
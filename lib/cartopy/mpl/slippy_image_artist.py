@@ -23,8 +23,33 @@ dragging and zooming of raster data.
 
 from __future__ import (absolute_import, division, print_function)
 
+from collections import OrderedDict
+import concurrent.futures
+import threading
+import warnings
+
 from matplotlib.image import AxesImage
 import matplotlib.artist
+import numpy as np
+
+
+_BACKGROUND_EXECUTOR = None
+"""
+The executor, shared by all :class:`SlippyImageArtist` instances, which
+fetches rasters in the background.
+
+"""
+
+_BACKGROUND_EXECUTOR_LOCK = threading.Lock()
+
+
+def _background_executor():
+    global _BACKGROUND_EXECUTOR
+    with _BACKGROUND_EXECUTOR_LOCK:
+        if _BACKGROUND_EXECUTOR is None:
+            _BACKGROUND_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                max_workers=SlippyImageArtist.background_workers)
+        return _BACKGROUND_EXECUTOR
 
 
 class SlippyImageArtist(AxesImage):
@@ -34,20 +59,89 @@ class SlippyImageArtist(AxesImage):
     interface for getting a raster from the given object with interactive
     slippy map type functionality.
 
-    Kwargs are passed to the AxesImage constructor.
+    Parameters
+    ----------
+    ax
+        The :class:`~cartopy.mpl.geoaxes.GeoAxes` to draw the raster in.
+    raster_source
+        The :class:`~cartopy.io.RasterSource` to fetch the raster from.
+    background_fetch: optional
+        If True, the raster is fetched by worker threads rather than during
+        the draw, which draws whatever imagery is already available and
+        requests another draw of the canvas as new imagery arrives. Fetches
+        of tiles which are no longer visible, and have not yet started, are
+        cancelled. Defaults to False.
+    tiled: optional
+        Whether to fetch the raster in tiles (see below). Defaults to None,
+        meaning the ``tiled`` attribute of the raster source (see
+        :attr:`cartopy.io.RasterSource.tiled`).
+
+    Other kwargs are passed to the AxesImage constructor.
+
+    By default, the raster of the whole view is fetched in a single request,
+    and the most recently fetched view is drawn whilst the user is
+    interacting (or whilst the raster of a new view is fetched in the
+    background).
+
+    A tiled raster is instead fetched in square tiles of :attr:`tile_size`
+    pixels, aligned to a grid in the projection of the axes whose
+    resolution is the power of two closest to (but no coarser than) that of
+    the view. Fetched tiles are cached, so that panning only fetches the
+    newly exposed tiles and, whilst a tile is unavailable, a coarser cached
+    tile covering it is drawn in its place. This suits sources whose
+    rasters are cheap to fetch in small pieces, such as WMTS, but multiplies
+    the requests (and warps) of sources which render each request
+    separately, such as WMS.
+
+    """
+    tile_size = 256
+    """The width and height, in pixels, of the tiles of the raster."""
+
+    max_cached_tiles = 512
+    """The number of most recently drawn tiles which are kept."""
+
+    max_placeholder_levels = 6
+    """
+    The number of coarser resolutions that are searched for a cached tile to
+    draw in place of one which is unavailable.
 
     """
-    def __init__(self, ax, raster_source, **kwargs):
+
+    background_workers = 4
+    """
+    The number of worker threads, shared by all artists, which fetch
+    rasters in the background.
+
+    """
+
+    def __init__(self, ax, raster_source, background_fetch=False, tiled=None,
+                 **kwargs):
         self.raster_source = raster_source
+        self.background_fetch = background_fetch
+        if tiled is None:
+            tiled = getattr(raster_source, 'tiled', False)
+        self.tiled = tiled
         super(SlippyImageArtist, self).__init__(ax, **kwargs)
         self.set_clip_path(ax.background_patch)
-        self.cache = []
+        self._tile_cache = OrderedDict()
+        self._drawn_images = []
+        self._pending = {}
+        self._timer = None
 
         ax.figure.canvas.mpl_connect('button_press_event', self.on_press)
         ax.figure.canvas.mpl_connect('button_release_event', self.on_release)
 
         self.on_release()
 
+    @property
+    def cache(self):
+        """
+        The located images (see :class:`cartopy.io.LocatedImage`) drawn by
+        the most recent draw of the artist.
+
+        """
+        return list(self._drawn_images)
+
     def on_press(self, event=None):
         self.user_is_interacting = True
 
@@ -63,13 +157,20 @@ class SlippyImageArtist(AxesImage):
         ax = self.axes
         window_extent = ax.get_window_extent()
         [x1, y1], [x2, y2] = ax.viewLim.get_points()
+        tiles = self._visible_tiles([x1, x2, y1, y2], window_extent.width,
+                                    window_extent.height)
+        if self._pending:
+            self._collect_pending()
         if not self.user_is_interacting:
-            located_images = self.raster_source.fetch_raster(
-                ax.projection, extent=[x1, x2, y1, y2],
-                target_resolution=(window_extent.width, window_extent.height))
-            self.cache = located_images
+            missing = [tile for tile in tiles
+                       if tile not in self._tile_cache]
+            if self.background_fetch:
+                self._fetch_tiles_in_background(tiles, missing)
+            else:
+                self._fetch_tiles(missing)
 
-        for img, extent in self.cache:
+        self._drawn_images = self._located_images(tiles)
+        for img, extent in self._drawn_images:
             self.set_array(img)
             with ax.hold_limits():
                 self.set_extent(extent)
@@ -79,3 +180,160 @@ class SlippyImageArtist(AxesImage):
         # As per https://github.com/SciTools/cartopy/issues/689, disable
         # compositing multiple raster sources.
         return False
+
+    def _visible_tiles(self, extent, width, height):
+        """
+        Return the ``(level, i, j)`` tiles which cover the given extent of
+        the view, which is drawn at the given size in pixels.
+
+        A tile at a given level is ``tile_size * 2 ** level`` projected units
+        across, and ``i`` and ``j`` are its position in the grid of those
+        tiles. If the raster is not tiled, the whole view is the single
+        ``(None, extent, (width, height))`` tile.
+
+        """
+        x1, x2, y1, y2 = extent
+        if not (width > 0 and height > 0):
+            return []
+        if not self.tiled:
+            return [(None, (x1, x2, y1, y2), (width, height))]
+        # There is nothing to fetch outside of the projection.
+        projection = self.axes.projection
+        x1, x2 = np.clip(sorted([x1, x2]), *projection.x_limits)
+        y1, y2 = np.clip(sorted([y1, y2]), *projection.y_limits)
+        pixel_size = min((x2 - x1) / width, (y2 - y1) / height)
+        if not pixel_size > 0:
+            return []
+
+        level = int(np.floor(np.log2(pixel_size)))
+        size = self.tile_size * 2.0 ** level
+        i_range = range(int(np.floor(x1 / size)), int(np.ceil(x2 / size)))
+        j_range = range(int(np.floor(y1 / size)), int(np.ceil(y2 / size)))
+        return [(level, i, j) for i in i_range for j in j_range]
+
+    def _tile_extent(self, tile):
+        level, i, j = tile
+        size = self.tile_size * 2.0 ** level
+        return [i * size, (i + 1) * size, j * size, (j + 1) * size]
+
+    def _fetch_tile(self, tile):
+        """Return the list of located images of the given tile."""
+        if tile[0] is None:
+            _, extent, target_resolution = tile
+        else:
+            extent = self._tile_extent(tile)
+            target_resolution = (self.tile_size, self.tile_size)
+        located_images = self.raster_source.fetch_raster(
+            self.axes.projection, extent=list(extent),
+            target_resolution=target_resolution)
+        return list(located_images or [])
+
+    def _fetch_tiles(self, tiles):
+        for tile in tiles:
+            self._cache_tile(tile, self._fetch_tile(tile))
+
+    def _fetch_tiles_in_background(self, tiles, missing):
+        """
+        Submit the fetches of the given missing tiles to the background
+        workers, cancelling those of tiles which are no longer visible.
+
+        """
+        visible = set(tiles)
+        for tile, future in list(self._pending.items()):
+            if tile not in visible and future.cancel():
+                del self._pending[tile]
+
+        executor = _background_executor()
+        for tile in missing:
+            if tile not in self._pending:
+                self._pending[tile] = executor.submit(self._fetch_tile, tile)
+
+        if self._pending and self._timer is None:
+            # Poll for the arrival of the tiles from the event loop of the
+            # canvas, rather than from the worker threads.
+            self._timer = self.axes.figure.canvas.new_timer(interval=100)
+            self._timer.add_callback(self._on_timer)
+            self._timer.start()
+
+    def _collect_pending(self):
+        """
+        Cache the tiles whose background fetches have completed, returning
+        whether any have.
+
+        """
+        arrived = False
+        for tile, future in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[tile]
+            if future.cancelled():
+                continue
+            try:
+                located_images = future.result()
+            except Exception as err:
+                warnings.warn('Unable to fetch the raster of the tile {}: '
+                              '{}'.format(tile, err))
+                continue
+            self._cache_tile(tile, located_images)
+            arrived = True
+        return arrived
+
+    def _on_timer(self):
+        if self._collect_pending():
+            self.stale = True
+            self.axes.figure.canvas.draw_idle()
+        if not self._pending and self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def _cache_tile(self, tile, located_images):
+        self._tile_cache[tile] = located_images
+        # Only the most recently fetched view of an untiled raster is kept.
+        max_cached_tiles = self.max_cached_tiles if self.tiled else 1
+        while len(self._tile_cache) > max_cached_tiles:
+            self._tile_cache.popitem(last=False)
+
+    def _cached_tile(self, tile):
+        """
+        Return the located images of the given tile, or None if it is not
+        cached, marking it as recently used.
+
+        """
+        located_images = self._tile_cache.pop(tile, None)
+        if located_images is not None:
+            self._tile_cache[tile] = located_images
+        return located_images
+
+    def _located_images(self, tiles):
+        """
+        Return the located images to draw for the given tiles, with those
+        of the coarser placeholder tiles (for tiles which are not cached)
+        first, so that they are drawn beneath.
+
+        """
+        images = []
+        placeholders = {}
+        for tile in tiles:
+            located_images = self._cached_tile(tile)
+            if located_images is not None:
+                images.extend(located_images)
+                continue
+            level, i, j = tile
+            if level is None:
+                # Draw the most recently fetched view in place of this one.
+                for located_images in self._tile_cache.values():
+                    images.extend(located_images)
+                continue
+            for k in range(1, self.max_placeholder_levels + 1):
+                parent = (level + k, i >> k, j >> k)
+                if parent in placeholders:
+                    break
+                located_images = self._cached_tile(parent)
+                if located_images is not None:
+                    placeholders[parent] = located_images
+                    break
+
+        placeholder_images = []
+        for parent in sorted(placeholders, reverse=True):
+            placeholder_images.extend(placeholders[parent])
+        return placeholder_images + images
@@ -185,3 +185,20 @@ def test_transform_points():
     result[[1, 3, 4], :] = expect_result[[1, 3, 4], :]
     assert not np.any(np.isnan(result))
     assert np.allclose(result, expect_result)
+
+
+def test_transform_points_2d_nan_out():
+    # A 2-dimensional input, containing NaNs, into an (N, 3) output.
+    x = np.array([[10.0, np.nan], [0.0, 77.7]])
+    y = np.array([[10.0, 10.0], [np.nan, 77.7]])
+    out = np.empty((4, 3))
+    result = _CRS_ROB.transform_points(_CRS_PC, x.copy(), y.copy(), out=out)
+    assert result is out
+    assert np.all(np.isnan(result[[1, 2], :]))
+    assert_array_almost_equal(result[0], [9.40422591e+05, 1.06952091e+06, 0],
+                              _TOL)
+    assert not np.any(np.isnan(result[[0, 3], :]))
+
+    result = _CRS_ROB.transform_points(_CRS_PC, x.copy(), y.copy())
+    assert result.shape == (2, 2, 3)
+    assert np.all(np.isnan(result[0, 1])) and np.all(np.isnan(result[1, 0]))
@@ -0,0 +1,150 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of cartopy.
+#
+# cartopy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cartopy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with cartopy.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import (absolute_import, division, print_function)
+
+import threading
+
+import pytest
+import six
+from six.moves import BaseHTTPServer, socketserver
+from six.moves.urllib.error import HTTPError
+
+from cartopy.io.fetch import HTTPFetcher
+
+
+class _StubHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    # Keep connections alive between requests.
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append(self.path)
+            failures = self.server.failures.get(self.path, 0)
+            if failures:
+                self.server.failures[self.path] = failures - 1
+        if failures:
+            status, body = 503, b'unavailable'
+        elif self.path.startswith('/missing'):
+            status, body = 404, b'missing'
+        elif self.path.startswith('/redirect'):
+            self.send_response(302)
+            self.send_header('Location', '/tile' + self.path[9:])
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        else:
+            status, body = 200, self.path.encode('ascii')
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _StubServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        BaseHTTPServer.HTTPServer.__init__(self, ('127.0.0.1', 0),
+                                           _StubHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = []
+        self.failures = {}
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self.server_address[1])
+
+
+@pytest.fixture
+def server():
+    server = _StubServer()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = HTTPFetcher(max_connections=4, backoff=0)
+    yield fetcher
+    fetcher.close()
+
+
+def test_fetch_reuses_connections(server, fetcher):
+    for i in range(5):
+        url = '{}/tile/{}'.format(server.url, i)
+        assert fetcher.fetch(url) == '/tile/{}'.format(i).encode('ascii')
+    assert len(server.requests) == 5
+    assert server.connections == 1
+
+
+def test_fetch_concurrent(server, fetcher):
+    urls = ['{}/tile/{}'.format(server.url, i) for i in range(20)]
+    futures = [fetcher.submit(fetcher.fetch, url) for url in urls]
+    results = [future.result() for future in futures]
+    assert results == ['/tile/{}'.format(i).encode('ascii')
+                       for i in range(20)]
+    # No more connections than the fetcher allows are ever made.
+    assert server.connections <= 4
+
+
+def test_fetch_retries(server, fetcher):
+    server.failures['/tile/0'] = 2
+    assert fetcher.fetch(server.url + '/tile/0') == b'/tile/0'
+    assert server.requests == ['/tile/0'] * 3
+
+    server.failures['/tile/1'] = fetcher.max_retries + 1
+    with pytest.raises(HTTPError) as err:
+        fetcher.fetch(server.url + '/tile/1')
+    assert err.value.code == 503
+
+
+def test_fetch_errors(server, fetcher):
+    with pytest.raises(HTTPError) as err:
+        fetcher.fetch(server.url + '/missing/0')
+    assert err.value.code == 404
+    # Client errors are not retried.
+    assert server.requests == ['/missing/0']
+
+    assert fetcher.fetch(server.url + '/redirect/3') == b'/tile/3'
+
+
+@pytest.mark.skipif(six.PY2, reason='asyncio requires Python 3.')
+def test_fetch_async(server, fetcher):
+    import asyncio
+
+    urls = ['{}/tile/{}'.format(server.url, i) for i in range(3)]
+    loop = asyncio.new_event_loop()
+    try:
+        results = loop.run_until_complete(asyncio.gather(
+            *[fetcher.fetch_async(url, loop=loop) for url in urls]))
+    finally:
+        loop.close()
+    assert results == [b'/tile/0', b'/tile/1', b'/tile/2']
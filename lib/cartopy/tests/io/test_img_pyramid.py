@@ -0,0 +1,93 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of cartopy.
+#
+# cartopy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cartopy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with cartopy.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import (absolute_import, division, print_function)
+
+import numpy as np
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+import pytest
+
+from cartopy.io.img_pyramid import ImagePyramid, build_pyramid, is_pyramid
+
+
+@pytest.fixture
+def image():
+    # A 1.5 degree global image, whose pixels are all distinct.
+    rows, cols = np.mgrid[:120, :240]
+    return np.dstack([rows, cols, (rows + cols) % 256]).astype(np.uint8)
+
+
+def test_build(image, tmpdir):
+    directory = str(tmpdir.join('pyramid'))
+    pyramid = build_pyramid(image, directory, tile_size=64)
+    assert is_pyramid(directory)
+    assert not is_pyramid(str(tmpdir))
+    assert pyramid.shapes == [(120, 240), (60, 120), (30, 60)]
+    assert tmpdir.join('pyramid', '0', '1', '3.png').check()
+    assert not tmpdir.join('pyramid', '0', '2', '0.png').check()
+
+    pyramid = ImagePyramid(directory)
+    img, extent = pyramid.image([-180, 180, -90, 90])
+    assert_array_equal(img, image)
+    assert extent == [-180, 180, -90, 90]
+
+
+def test_subset(image, tmpdir):
+    pyramid = build_pyramid(image, str(tmpdir), tile_size=64)
+    img, extent = pyramid.image([-10, 10, 40, 60])
+    assert_array_equal(img, image[20:34, 113:127])
+    assert_array_almost_equal(extent, [-10.5, 10.5, 39, 60])
+    # Only the tiles covering the extent were decoded.
+    assert list(pyramid._tiles) == [(0, 0, 1)]
+
+
+def test_dateline(image, tmpdir):
+    pyramid = build_pyramid(image, str(tmpdir), tile_size=64)
+    img, extent = pyramid.image([170, 190, -90, 90])
+    assert_array_equal(img, np.concatenate([image[:, 233:], image[:, :7]],
+                                           axis=1))
+    assert_array_almost_equal(extent, [169.5, 190.5, -90, 90])
+
+
+def test_level(image, tmpdir):
+    pyramid = build_pyramid(image, str(tmpdir), tile_size=64)
+    assert pyramid.level([-180, 180, -90, 90], (50, 25)) == 2
+    assert pyramid.level([-180, 180, -90, 90], (100, 50)) == 1
+    assert pyramid.level([-180, 180, -90, 90], (200, 100)) == 0
+    # A smaller extent needs a finer level for the same resolution.
+    assert pyramid.level([0, 90, 0, 45], (50, 25)) == 0
+
+    img, extent = pyramid.image([-180, 180, -90, 90], (50, 25))
+    assert img.shape == (30, 60, 3)
+    assert extent == [-180, 180, -90, 90]
+
+
+def test_level_partial_overlap(image, tmpdir):
+    pyramid = build_pyramid(image, str(tmpdir), extent=(0, 60, 0, 30),
+                            tile_size=64)
+    # Only the overlapping half of the extent is resolved by the image.
+    assert pyramid.level([-60, 60, 0, 30], (100, 25)) == 1
+    assert pyramid.level([0, 60, 0, 30], (100, 25)) == 1
+    assert pyramid.level([0, 60, 0, 30], (50, 25)) == 2
+
+
+def test_rebuild(image, tmpdir):
+    build_pyramid(image, str(tmpdir), tile_size=64)
+    pyramid = build_pyramid(image[:, :128], str(tmpdir), tile_size=64)
+    assert pyramid.shapes[0] == (120, 128)
+    assert [path.basename for path in tmpdir.listdir()
+            if path.isfile()] == ['pyramid.json']
@@ -22,6 +22,9 @@ try:
 except ImportError:
     import mock
 
+import io
+import threading
+
 import numpy as np
 try:
     from owslib.wfs import WebFeatureService
@@ -31,6 +34,7 @@ except ImportError:
     WebMapService = None
     ContentMetadata = None
     WebMapTileService = None
+from PIL import Image
 import pytest
 
 import cartopy.crs as ccrs
@@ -219,6 +223,95 @@ class TestWMTSRasterSource(object):
         assert im2.extent == extent
 
 
+def _mock_wmts():
+    # A global CRS84 tile matrix of 4 x 2 tiles, each 4 pixels square.
+    tile_matrix = mock.Mock(
+        identifier='1', topleftcorner=(-180, 90),
+        tilewidth=4, tileheight=4, matrixwidth=4, matrixheight=2,
+        scaledenominator=22.5 * ogc._WGS84_METERS_PER_UNIT /
+        ogc.METERS_PER_PIXEL)
+    tile_matrix_set = mock.Mock(crs='urn:ogc:def:crs:OGC:1.3:CRS84',
+                                tilematrix={'1': tile_matrix})
+    layer = mock.Mock(id='layer', tilematrixsetlinks=None)
+    threads = set()
+
+    def gettile(row, column, **kwargs):
+        threads.add(threading.current_thread())
+        img = Image.new('RGBA', (4, 4), (int(row), int(column), 0, 255))
+        data = io.BytesIO()
+        img.save(data, format='png')
+        data.seek(0)
+        return data
+
+    wmts = mock.Mock(tilematrixsets={'set': tile_matrix_set},
+                     contents={'layer': layer},
+                     gettile=mock.Mock(side_effect=gettile))
+    return wmts, layer, threads
+
+
+@pytest.mark.skipif(not _OWSLIB_AVAILABLE, reason='OWSLib is unavailable.')
+def test_wmts_images():
+    wmts, layer, threads = _mock_wmts()
+    source = ogc.WMTSRasterSource(wmts, 'layer')
+    # The tiles of the service are also the tiles of the raster.
+    assert source.tiled
+    with mock.patch.object(ogc.WMTSRasterSource, '_shared_image_lru',
+                           ogc._ImageLRU()):
+        img, extent = source._wmts_images(wmts, layer, 'set',
+                                          (-180, 180, -90, 90), 100)
+        assert wmts.gettile.call_count == 8
+        # The tiles are fetched by worker threads.
+        assert threading.current_thread() not in threads
+        assert img.size == (16, 8)
+        np.testing.assert_allclose(extent, (-180, 180, -90, 90))
+        img = np.array(img)
+        for row in range(2):
+            for col in range(4):
+                tile = img[row * 4:(row + 1) * 4, col * 4:(col + 1) * 4]
+                assert (tile == [row, col, 0, 255]).all()
+
+        # The tiles are now cached.
+        source._wmts_images(wmts, layer, 'set', (-180, 180, -90, 90), 100)
+        assert wmts.gettile.call_count == 8
+
+
+@pytest.mark.skipif(not _OWSLIB_AVAILABLE, reason='OWSLib is unavailable.')
+def test_wmts_image_cache_size():
+    wmts, layer, _ = _mock_wmts()
+    source = ogc.WMTSRasterSource(wmts, 'layer')
+    image_lru = ogc._ImageLRU()
+    # Room for three (4 x 4 RGBA) tile images.
+    with mock.patch.object(ogc.WMTSRasterSource, '_shared_image_lru',
+                           image_lru), \
+            mock.patch.object(ogc.WMTSRasterSource, 'image_cache_size',
+                              3 * 4 * 4 * 4):
+        source._wmts_images(wmts, layer, 'set', (-180, 180, -90, 90), 100)
+        image_cache = ogc.WMTSRasterSource._shared_image_cache[wmts]
+        assert len(image_cache[('layer', '1')]) == 3
+        assert image_lru.nbytes == 3 * 4 * 4 * 4
+
+
+def test_image_lru_collected_mapping():
+    image_lru = ogc._ImageLRU()
+    img = Image.new('RGBA', (4, 4))
+    images = ogc._TileImages()
+    image_lru.add(images, (0, 0), img, 1024)
+    image_lru.add(images, (0, 1), img, 1024)
+    assert image_lru.nbytes == 2 * 4 * 4 * 4
+
+    # The images of a collected mapping no longer count towards the bound,
+    # nor are they confused with those of a new mapping.
+    del images
+    images = ogc._TileImages()
+    assert image_lru.get(images, (0, 0)) is None
+    assert image_lru.nbytes == 0
+    image_lru.add(images, (0, 0), img, 2 * 4 * 4 * 4)
+    image_lru.add(images, (0, 1), img, 2 * 4 * 4 * 4)
+    image_lru.add(images, (1, 0), img, 2 * 4 * 4 * 4)
+    assert sorted(images) == [(0, 1), (1, 0)]
+    assert image_lru.nbytes == 2 * 4 * 4 * 4
+
+
 @pytest.mark.network
 @pytest.mark.skipif(not _OWSLIB_AVAILABLE, reason='OWSLib is unavailable.')
 class TestWFSGeometrySource(object):
@@ -0,0 +1,139 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of cartopy.
+#
+# cartopy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cartopy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with cartopy.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import (absolute_import, division, print_function)
+
+import os
+import time
+
+from PIL import Image
+import pytest
+import six
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import cartopy.io.img_tiles as cimgt
+from cartopy.io.tile_cache import DirectoryTileCache, SQLiteTileCache
+
+
+SOURCE = 'https://tiles.example.com/{z}/{x}/{y}.png'
+
+
+@pytest.fixture(params=['directory', 'sqlite'])
+def make_cache(request, tmpdir):
+    def make_cache(**kwargs):
+        if request.param == 'directory':
+            return DirectoryTileCache(str(tmpdir.join('tiles')), **kwargs)
+        else:
+            return SQLiteTileCache(str(tmpdir.join('tiles.sqlite')),
+                                   **kwargs)
+    return make_cache
+
+
+def test_get_put(make_cache):
+    cache = make_cache()
+    assert cache.get((SOURCE, 1, 0, 1)) is None
+    cache.put((SOURCE, 1, 0, 1), b'tile data')
+    assert cache.get((SOURCE, 1, 0, 1)) == b'tile data'
+    assert cache.get((SOURCE, 1, 1, 0)) is None
+    assert cache.get(('other source', 1, 0, 1)) is None
+
+    # The cache persists.
+    cache = make_cache()
+    assert cache.get((SOURCE, 1, 0, 1)) == b'tile data'
+
+
+def test_lru_eviction(make_cache):
+    cache = make_cache(max_size=30)
+    for x in range(3):
+        cache.put((SOURCE, 2, x, 0), b'0123456789')
+        time.sleep(0.01)
+    # Use the first tile, so that the second is the least recently used.
+    assert cache.get((SOURCE, 2, 0, 0)) is not None
+    time.sleep(0.01)
+    cache.put((SOURCE, 2, 3, 0), b'0123456789')
+
+    assert cache.get((SOURCE, 2, 1, 0)) is None
+    for x in (0, 2, 3):
+        assert cache.get((SOURCE, 2, x, 0)) == b'0123456789'
+
+
+def test_ttl(make_cache):
+    cache = make_cache(ttl=60)
+    cache.put((SOURCE, 0, 0, 0), b'tile data')
+    assert cache.get((SOURCE, 0, 0, 0)) == b'tile data'
+
+    later = time.time() + 120
+    with mock.patch('cartopy.io.tile_cache.time.time',
+                    return_value=later):
+        assert cache.get((SOURCE, 0, 0, 0)) is None
+        # Expired tiles are still served when offline.
+        cache.offline = True
+        assert cache.get((SOURCE, 0, 0, 0)) == b'tile data'
+
+
+def test_tile_source_cache(tmpdir):
+    png = six.BytesIO()
+    Image.new('RGB', (256, 256), (0, 0, 255)).save(png, format='png')
+    fetcher = mock.Mock(fetch=mock.Mock(return_value=png.getvalue()))
+
+    osm = cimgt.OSM()
+    osm.fetcher = fetcher
+    osm.cache = DirectoryTileCache(str(tmpdir))
+    osm.get_image((1, 2, 3))
+    img, _, _ = osm.get_image((1, 2, 3))
+    assert fetcher.fetch.call_count == 1
+    assert img.getpixel((0, 0)) == (0, 0, 255)
+    assert os.path.exists(osm.cache._path(
+        ('cartopy.io.img_tiles.OSM()', 3, 1, 2)))
+
+    # An offline cache never downloads tiles.
+    osm.cache.offline = True
+    with pytest.raises(IOError):
+        osm.get_image((2, 2, 3))
+    assert fetcher.fetch.call_count == 1
+
+
+def test_cache_source():
+    assert cimgt.OSM()._cache_source() == 'cartopy.io.img_tiles.OSM()'
+    assert (cimgt.Stamen('toner')._cache_source() ==
+            "cartopy.io.img_tiles.Stamen(style='toner')")
+    assert (cimgt.Stamen('toner')._cache_source() !=
+            cimgt.Stamen('watercolor')._cache_source())
+    # The source does not depend on how the URL of a tile is formed.
+    assert (cimgt.QuadtreeTiles()._cache_source() ==
+            'cartopy.io.img_tiles.QuadtreeTiles()')
+
+
+def test_sqlite_size(tmpdir):
+    fname = str(tmpdir.join('tiles.sqlite'))
+    cache = SQLiteTileCache(fname, max_size=30)
+    for x in range(3):
+        cache.put((SOURCE, 2, x, 0), b'0123456789')
+    # Replacing a tile only counts the difference in size.
+    cache.put((SOURCE, 2, 0, 0), b'01234')
+    size_sql = 'SELECT size FROM tiles_size'
+    assert cache._connection.execute(size_sql).fetchone() == (25, )
+    cache.put((SOURCE, 2, 3, 0), b'0123456789')
+    assert cache._connection.execute(size_sql).fetchone() == (25, )
+    cache.close()
+
+    # The size persists.
+    cache = SQLiteTileCache(fname, max_size=30)
+    assert cache._connection.execute(size_sql).fetchone() == (25, )
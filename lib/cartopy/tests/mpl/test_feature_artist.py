@@ -20,7 +20,8 @@ from __future__ import (absolute_import, division, print_function)
 import numpy as np
 import pytest
 import shapely.geometry as sgeom
-from matplotlib.transforms import IdentityTransform
+from matplotlib.path import Path
+from matplotlib.transforms import Bbox, IdentityTransform
 try:
     from unittest import mock
 except ImportError:
@@ -29,7 +30,8 @@ except ImportError:
 import cartopy.crs as ccrs
 import cartopy.mpl.geoaxes as geoaxes
 from cartopy.feature import ShapelyFeature
-from cartopy.mpl.feature_artist import FeatureArtist, _freeze, _GeomKey
+from cartopy.mpl.feature_artist import (FeatureArtist, _freeze, _GeomKey,
+                                        _PathStore)
 from cartopy.mpl import style
 
 @pytest.mark.parametrize("source, expected", [
@@ -135,3 +137,138 @@ def test_feature_artist_draw_styler(path_collection_cls, feature):
         assert expected_call['paths'] == actual_args
         assert transform == actual_kwargs.pop('transform')
         assert expected_call['style'] == actual_kwargs
+
+
+class _PersistentFeature(ShapelyFeature):
+    def _persistent_key(self):
+        return ('test', 'persistent_feature')
+
+
+@mock.patch('matplotlib.collections.PathCollection')
+def test_feature_artist_draw_persistent_cache(path_collection_cls, tmpdir):
+    unit_circle = sgeom.Point(0, 0).buffer(0.5)
+    geoms = [unit_circle, unit_circle.envelope]
+    prj_crs = ccrs.Robinson()
+    cache_dir = str(tmpdir.join('feature_cache'))
+
+    with mock.patch.dict('cartopy.config', feature_cache_dir=cache_dir), \
+            mock.patch.dict(FeatureArtist._path_stores, clear=True):
+        fa = FeatureArtist(_PersistentFeature(geoms, ccrs.PlateCarree()))
+        fa.axes = mocked_axes(extent=[-10, 10, -10, 10], projection=prj_crs)
+        fa.draw(mock.sentinel.renderer)
+        expected = [cached_paths(geom, prj_crs) for geom in geoms]
+        assert len(tmpdir.join('feature_cache').listdir()) == 1
+
+    # A new session: nothing cached in memory, so the paths must come from
+    # the persistent cache rather than from projecting the geometries.
+    geoms = [sgeom.Polygon(geom.exterior) for geom in geoms]
+    with mock.patch.dict('cartopy.config', feature_cache_dir=cache_dir), \
+            mock.patch.dict(FeatureArtist._path_stores, clear=True), \
+            mock.patch.object(ccrs.Robinson, 'project_geometry',
+                              side_effect=AssertionError):
+        fa = FeatureArtist(_PersistentFeature(geoms, ccrs.PlateCarree()))
+        fa.axes = mocked_axes(extent=[-10, 10, -10, 10], projection=prj_crs)
+        fa.draw(mock.sentinel.renderer)
+        for geom, expected_paths in zip(geoms, expected):
+            paths = cached_paths(geom, prj_crs)
+            assert len(paths) == len(expected_paths)
+            for path, expected_path in zip(paths, expected_paths):
+                np.testing.assert_array_equal(path.vertices,
+                                              expected_path.vertices)
+                np.testing.assert_array_equal(path.codes,
+                                              expected_path.codes)
+
+
+def test_path_store_batches_writes(tmpdir):
+    geoms = [sgeom.Point(i, 0).buffer(0.5) for i in range(12)]
+    key = ('test', 'batched_feature')
+    path = Path([[0, 0], [1, 1]])
+    store = _PathStore(str(tmpdir), key, geoms, ccrs.PlateCarree())
+    for geom in geoms[:8]:
+        store.add(geom, [path])
+    store.save(1024 ** 2)
+    assert not store.modified
+
+    # A single new geometry is not worth rewriting the whole store for...
+    store.add(geoms[8], [path])
+    store.save(1024 ** 2)
+    assert store.modified
+    reloaded = _PathStore(str(tmpdir), key, geoms, ccrs.PlateCarree())
+    assert reloaded.get(geoms[8]) is None
+
+    # ...unless the write is forced, as it is at exit.
+    store.save(1024 ** 2, force=True)
+    assert not store.modified
+    reloaded = _PathStore(str(tmpdir), key, geoms, ccrs.PlateCarree())
+    np.testing.assert_array_equal(reloaded.get(geoms[8])[0].vertices,
+                                  path.vertices)
+
+
+@mock.patch('matplotlib.collections.PathCollection')
+def test_feature_artist_draw_clip_to_extent(path_collection_cls):
+    big_square = sgeom.box(-100, -50, 100, 50)
+    small_square = sgeom.box(1, 1, 2, 2)
+    feature = ShapelyFeature([big_square, small_square], ccrs.PlateCarree())
+    prj_crs = ccrs.Robinson()
+
+    fa = FeatureArtist(feature, clip_to_extent=True)
+    fa.axes = mocked_axes(extent=[0, 4, 0, 4], projection=prj_crs)
+    fa.draw(mock.sentinel.renderer)
+
+    # The small geometry lies within the clip tile, so is projected whole.
+    assert cached_paths(small_square, prj_crs) is not None
+
+    # Only the part of the big geometry within the tile is projected.
+    assert cached_paths(big_square, prj_crs) is None
+    clipped = FeatureArtist._geom_key_to_clipped_path_cache[
+        _GeomKey(big_square)]
+    assert len(clipped) == 1
+    (projection, tile), paths = list(clipped.items())[0]
+    assert projection == prj_crs
+    x0, x1, y0, y1 = tile
+    assert x0 <= 0 and x1 >= 4 and y0 <= 0 and y1 >= 4
+    extent = prj_crs.transform_points(ccrs.PlateCarree(),
+                                      np.array([x0, x1]), np.array([y0, y1]))
+    for path in paths:
+        assert path.vertices[:, 0].min() >= extent[0, 0] - 1e-6
+        assert path.vertices[:, 0].max() <= extent[1, 0] + 1e-6
+
+    # Panning slightly resolves to the same tile, so nothing is reprojected.
+    with mock.patch.object(ccrs.Robinson, 'project_geometry',
+                           side_effect=AssertionError):
+        fa.axes = mocked_axes(extent=[0.2, 4.2, 0, 4], projection=prj_crs)
+        fa.draw(mock.sentinel.renderer)
+    assert len(clipped) == 1
+
+
+@mock.patch('matplotlib.collections.PathCollection')
+def test_feature_artist_draw_simplify(path_collection_cls):
+    circle = sgeom.Point(0, 0).buffer(10, 256)
+    speck = sgeom.Point(50, 50).buffer(0.01)
+    feature = ShapelyFeature([circle, speck], ccrs.PlateCarree())
+    prj_crs = ccrs.PlateCarree()
+
+    fa = FeatureArtist(feature, simplify=True)
+    fa.axes = mocked_axes(extent=[-180, 180, -90, 90], projection=prj_crs)
+    # A 360 pixel wide map, so a pixel is a degree across.
+    fa.axes.viewLim = Bbox.from_extents(-180, -90, 180, 90)
+    fa.axes.bbox = Bbox.from_bounds(0, 0, 360, 180)
+    fa.draw(mock.sentinel.renderer)
+
+    full_paths = cached_paths(circle, prj_crs)
+    (paths, ), _ = path_collection_cls.call_args
+    # The sub-pixel speck is dropped and the circle is simplified.
+    assert len(paths) == 1
+    assert len(paths[0].vertices) < len(full_paths[0].vertices) // 10
+    assert paths[0].codes[-1] == paths[0].CLOSEPOLY
+
+    simplified = FeatureArtist._geom_key_to_simplified_path_cache[
+        _GeomKey(circle)]
+    assert list(simplified.keys()) == [(prj_crs, None, 0.5)]
+
+    # Zooming out by less than a factor of two reuses the simplified paths.
+    fa.axes.viewLim = Bbox.from_extents(-200, -100, 200, 100)
+    fa.draw(mock.sentinel.renderer)
+    (new_paths, ), _ = path_collection_cls.call_args
+    assert new_paths[0] is paths[0]
+    assert len(simplified) == 1
@@ -17,9 +17,14 @@
 
 from __future__ import (absolute_import, division, print_function)
 
+import collections
 import os
 import types
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
 import numpy as np
 import matplotlib.pyplot as plt
 from PIL import Image
@@ -28,7 +33,9 @@ import shapely.geometry as sgeom
 
 from cartopy import config
 import cartopy.crs as ccrs
+import cartopy.img_transform
 import cartopy.io.img_tiles as cimgt
+import cartopy.mpl.geoaxes as cgeoaxes
 
 from cartopy.tests.mpl import MPL_VERSION, ImageTesting
 import cartopy.tests.test_img_tiles as ctest_tiles
@@ -177,3 +184,40 @@ def test_pil_Image():
 def test_background_img():
     ax = plt.axes(projection=ccrs.Orthographic())
     ax.background_img(name='ne_shaded', resolution='low')
+
+
+def test_stock_img_warp_cache(tmpdir):
+    warp_array = cartopy.img_transform.warp_array
+    with mock.patch.dict(config, warped_image_cache_dir=str(tmpdir)), \
+            mock.patch.object(cgeoaxes, '_WARPED_IMG_CACHE',
+                              collections.OrderedDict()) as cache, \
+            mock.patch('cartopy.img_transform.warp_array',
+                       side_effect=warp_array) as warp:
+        images = []
+        for _ in range(2):
+            fig = plt.figure()
+            ax = fig.add_subplot(1, 1, 1, projection=ccrs.Robinson())
+            images.append(ax.stock_img().get_array())
+            plt.close(fig)
+        # The second map reuses the image warped for the first.
+        assert warp.call_count == 1
+        assert len(cache) == 1
+
+        # The warped image is also persisted between sessions.
+        cache.clear()
+        fig = plt.figure()
+        ax = fig.add_subplot(1, 1, 1, projection=ccrs.Robinson())
+        images.append(ax.stock_img().get_array())
+        plt.close(fig)
+        assert warp.call_count == 1
+        assert len(tmpdir.listdir()) == 1
+
+        # A different projection needs a new warp.
+        fig = plt.figure()
+        ax = fig.add_subplot(1, 1, 1, projection=ccrs.Mollweide())
+        ax.stock_img()
+        plt.close(fig)
+        assert warp.call_count == 2
+
+    np.testing.assert_array_equal(images[0], images[1])
+    np.testing.assert_array_equal(images[0], images[2])
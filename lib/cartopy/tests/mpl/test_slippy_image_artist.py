@@ -0,0 +1,178 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of cartopy.
+#
+# cartopy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# cartopy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with cartopy.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import (absolute_import, division, print_function)
+
+import concurrent.futures
+import threading
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import cartopy.crs as ccrs
+from cartopy.io import LocatedImage, RasterSource
+
+
+class CountingRasterSource(RasterSource):
+    tiled = True
+
+    def __init__(self):
+        self.extents = []
+
+    def validate_projection(self, projection):
+        pass
+
+    def fetch_raster(self, projection, extent, target_resolution):
+        self.extents.append(tuple(extent))
+        width, height = target_resolution
+        img = np.zeros((int(height), int(width), 3), dtype=np.uint8)
+        return [LocatedImage(img, tuple(extent))]
+
+
+def test_untiled_fetches_view():
+    source = CountingRasterSource()
+    fig = plt.figure(figsize=(4, 2), dpi=100)
+    ax = fig.add_axes([0, 0, 1, 1], projection=ccrs.PlateCarree())
+    img = ax.add_raster(source, tiled=False)
+    ax.set_extent([-40, 40, -20, 20], crs=ccrs.PlateCarree())
+    try:
+        # The whole view is fetched in a single request.
+        fig.canvas.draw()
+        assert len(source.extents) == 1
+        np.testing.assert_array_almost_equal(source.extents[0],
+                                             [-40, 40, -20, 20])
+
+        fig.canvas.draw()
+        assert len(source.extents) == 1
+
+        # Whilst interacting, the previous view is drawn in place of a new
+        # one.
+        img.on_press()
+        ax.set_extent([-10, 70, -20, 20], crs=ccrs.PlateCarree())
+        fig.canvas.draw()
+        assert len(source.extents) == 1
+        img.on_release()
+        fig.canvas.draw()
+        assert len(source.extents) == 2
+        np.testing.assert_array_almost_equal(source.extents[1],
+                                             [-10, 70, -20, 20])
+        assert len(img._tile_cache) == 1
+        assert len(img.cache) == 1
+        np.testing.assert_array_almost_equal(img.cache[0].extent,
+                                             [-10, 70, -20, 20])
+    finally:
+        plt.close(fig)
+
+
+def test_pan_fetches_exposed_tiles():
+    source = CountingRasterSource()
+    fig = plt.figure(figsize=(4, 2), dpi=100)
+    ax = fig.add_axes([0, 0, 1, 1], projection=ccrs.PlateCarree())
+    img = ax.add_raster(source)
+    ax.set_extent([-40, 40, -20, 20], crs=ccrs.PlateCarree())
+    try:
+        fig.canvas.draw()
+        n_tiles = len(source.extents)
+        assert n_tiles > 0
+        assert len(img._tile_cache) == n_tiles
+
+        # Redrawing the same view uses the cached tiles.
+        fig.canvas.draw()
+        assert len(source.extents) == n_tiles
+
+        # Panning only fetches the newly exposed tiles.
+        ax.set_extent([-10, 70, -20, 20], crs=ccrs.PlateCarree())
+        fig.canvas.draw()
+        assert 0 < len(source.extents) - n_tiles < n_tiles
+        assert len(set(source.extents)) == len(source.extents)
+    finally:
+        plt.close(fig)
+
+
+def test_placeholder_tiles():
+    source = CountingRasterSource()
+    fig = plt.figure(figsize=(4, 2), dpi=100)
+    ax = fig.add_axes([0, 0, 1, 1], projection=ccrs.PlateCarree())
+    img = ax.add_raster(source)
+    ax.set_extent([-40, 40, -20, 20], crs=ccrs.PlateCarree())
+    try:
+        fig.canvas.draw()
+        n_tiles = len(source.extents)
+
+        # Whilst interacting, zooming in fetches nothing, but the coarser
+        # cached tiles are drawn in place of the finer tiles.
+        img.on_press()
+        ax.set_extent([-10, 10, -5, 5], crs=ccrs.PlateCarree())
+        [x1, y1], [x2, y2] = ax.viewLim.get_points()
+        window_extent = ax.get_window_extent()
+        tiles = img._visible_tiles([x1, x2, y1, y2], window_extent.width,
+                                   window_extent.height)
+        assert not any(tile in img._tile_cache for tile in tiles)
+        located_images = img._located_images(tiles)
+        assert located_images
+        fig.canvas.draw()
+        assert len(source.extents) == n_tiles
+
+        img.on_release()
+        fig.canvas.draw()
+        assert len(source.extents) == n_tiles + len(tiles)
+    finally:
+        plt.close(fig)
+
+
+class BlockingRasterSource(CountingRasterSource):
+    def __init__(self):
+        super(BlockingRasterSource, self).__init__()
+        self.release = threading.Event()
+
+    def fetch_raster(self, projection, extent, target_resolution):
+        self.release.wait(10)
+        return super(BlockingRasterSource, self).fetch_raster(
+            projection, extent, target_resolution)
+
+
+def test_background_fetch():
+    source = BlockingRasterSource()
+    fig = plt.figure(figsize=(4, 2), dpi=100)
+    ax = fig.add_axes([0, 0, 1, 1], projection=ccrs.PlateCarree())
+    img = ax.add_raster(source, background_fetch=True)
+    ax.set_extent([-40, 40, -20, 20], crs=ccrs.PlateCarree())
+    try:
+        # The draw does not wait for the raster.
+        fig.canvas.draw()
+        assert source.extents == []
+        assert len(img._tile_cache) == 0
+        first_tiles = set(img._pending)
+        assert first_tiles
+
+        # Moving the view cancels the fetches of the tiles that have not
+        # started and are no longer visible.
+        ax.set_extent([100, 180, 40, 80], crs=ccrs.PlateCarree())
+        fig.canvas.draw()
+        for tile, future in img._pending.items():
+            if tile in first_tiles:
+                assert future.running() or future.done()
+
+        source.release.set()
+        concurrent.futures.wait(list(img._pending.values()))
+        fig.canvas.draw()
+        assert not img._pending
+        assert len(img._tile_cache) > 0
+        assert len(source.extents) == len(img._tile_cache)
+    finally:
+        source.release.set()
+        plt.close(fig)
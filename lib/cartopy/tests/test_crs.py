@@ -153,6 +153,75 @@ class TestCRS(object):
         assert_arr_almost_eq(unrotated_lon, solx)
         assert_arr_almost_eq(unrotated_lat, soly)
 
+    def test_transform_points_threads(self):
+        lons, lats = np.meshgrid(np.linspace(-180, 180, 37),
+                                 np.linspace(-80, 80, 17))
+        src_proj = ccrs.Geodetic()
+        target_proj = ccrs.Robinson()
+        expected = target_proj.transform_points(src_proj, lons, lats)
+
+        for threads in [1, 4]:
+            res = target_proj.transform_points(src_proj, lons, lats,
+                                               threads=threads)
+            assert_array_equal(res, expected)
+
+        out = np.empty(lons.shape + (3, ))
+        res = target_proj.transform_points(src_proj, lons, lats, out=out,
+                                           threads=3)
+        assert res is out
+        assert_array_equal(out, expected)
+
+    def test_transform_points_bad_out(self):
+        x = y = np.arange(4.)
+        crs = ccrs.PlateCarree()
+        with pytest.raises(ValueError):
+            crs.transform_points(crs, x, y, out=np.empty((4, 2)))
+        with pytest.raises(ValueError):
+            crs.transform_points(crs, x, y,
+                                 out=np.empty((4, 3), dtype=np.float32))
+
+    def test_transform_coords(self):
+        lons, lats = np.meshgrid(np.linspace(-180, 180, 37),
+                                 np.linspace(-80, 80, 17))
+        coords = np.column_stack([lons.ravel(), lats.ravel()])
+        src_proj = ccrs.Geodetic()
+        target_proj = ccrs.Robinson()
+        expected = target_proj.transform_points(src_proj, lons.ravel(),
+                                                lats.ravel())
+
+        res = target_proj.transform_coords(src_proj, coords)
+        assert res is not coords
+        assert_array_equal(res, expected[:, :2])
+
+        # Strided output, e.g. the first two columns of an (N, 3) array.
+        out = np.zeros((len(coords), 3))
+        res = target_proj.transform_coords(src_proj, coords, out=out[:, :2])
+        assert_array_equal(out[:, :2], expected[:, :2])
+
+        # In place.
+        res = src_proj.transform_coords(target_proj, out, out=out)
+        assert res is out
+        assert_arr_almost_eq(out[:, :2], coords)
+
+    def test_transformer(self):
+        src_proj = ccrs.Geodetic()
+        target_proj = ccrs.Mercator()
+        transformer = ccrs.Transformer.from_crs(src_proj, target_proj)
+        assert transformer.src_geodetic
+        assert not transformer.dest_geodetic
+        # Transformers are memoized on the CRS pair.
+        assert ccrs.Transformer.from_crs(ccrs.Geodetic(),
+                                         ccrs.Mercator()) is transformer
+        assert ccrs.Transformer.from_crs(target_proj,
+                                         src_proj) is not transformer
+
+        lons = np.array([-10., 0., 20.])
+        lats = np.array([-45., 0., 60.])
+        assert_array_equal(transformer.transform_points(lons, lats),
+                           target_proj.transform_points(src_proj, lons, lats))
+        assert (transformer.transform_point(20, 60) ==
+                target_proj.transform_point(20, 60, src_proj))
+
     def test_transform_points_xyz(self):
         # Test geodetic transforms when using z value
         rx = np.array([2574.32516e3])
@@ -275,3 +344,30 @@ def test_transform_points_empty():
     result = crs.transform_points(ccrs.PlateCarree(),
                                   np.array([]), np.array([]))
     assert_array_equal(result, np.array([], dtype=np.float64).reshape(0, 3))
+
+
+def test_prepared_domain_and_boundary_cached():
+    crs = ccrs.InterruptedGoodeHomolosine()
+    assert crs._prepared_domain is crs._prepared_domain
+    for is_ccw, boundary in [(True, crs.ccw_boundary),
+                             (False, crs.cw_boundary)]:
+        points = crs._boundary_points(is_ccw)
+        assert points is crs._boundary_points(is_ccw)
+        assert len(points) == len(boundary.coords) - 1
+        for distance, point in points:
+            assert distance == boundary.project(point)
+
+
+def test_shared_boundary_geometries():
+    # Equal projections share the geometries derived from their boundary.
+    crs1 = ccrs.Robinson(central_longitude=10)
+    crs2 = ccrs.Robinson(central_longitude=10)
+    assert crs1.domain is crs2.domain
+    assert crs1._prepared_domain is crs2._prepared_domain
+    assert crs1.cw_boundary is crs2.cw_boundary
+
+    # Projections which differ only in their boundary do not.
+    crs1 = ccrs.LambertConformal(cutoff=-30)
+    crs2 = ccrs.LambertConformal(cutoff=-40)
+    assert crs1 == crs2
+    assert not crs1.domain.equals(crs2.domain)
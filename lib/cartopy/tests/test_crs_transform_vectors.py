@@ -20,7 +20,7 @@ from __future__ import (absolute_import, division, print_function)
 import warnings
 
 import numpy as np
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 import pytest
 
 import cartopy.crs as ccrs
@@ -165,3 +165,39 @@ class TestTransformVectors(object):
         with pytest.warns(UserWarning):
             warnings.simplefilter('always')
             ut, vt = target_proj.transform_vectors(src_proj, rlon, rlat, u, v)
+
+    def test_zero_and_masked_vectors(self):
+        # Vectors of zero magnitude stay zero, and masked vectors stay
+        # masked.
+        x2d, y2d = np.meshgrid(np.arange(-60, 60, 20.), np.arange(0, 80, 20.))
+        u = np.ma.masked_array(np.ones(x2d.shape), mask=x2d > 30)
+        v = np.zeros(x2d.shape)
+        u[0, 0] = 0
+        src_proj = ccrs.PlateCarree()
+        target_proj = ccrs.Stereographic(central_latitude=90,
+                                         central_longitude=0)
+        ut, vt = target_proj.transform_vectors(src_proj, x2d, y2d, u, v)
+        assert ut.shape == vt.shape == x2d.shape
+        assert_array_almost_equal(ut[0, 0], 0)
+        assert_array_almost_equal(vt[0, 0], 0)
+        assert np.array_equal(np.ma.getmaskarray(ut), x2d > 30)
+        assert_array_almost_equal(np.hypot(ut, vt).compressed(),
+                                  np.hypot(u, v).compressed())
+
+    def test_nan_grid(self):
+        # A 2-D grid of points, some of which are NaN, in a projection which
+        # handles NaNs itself, gives NaN vectors at (only) those points.
+        src_proj = ccrs.Robinson()
+        target_proj = ccrs.PlateCarree()
+        lons, lats = np.meshgrid([-30., 0., 30.], [-20., 20.])
+        xyz = src_proj.transform_points(target_proj, lons, lats)
+        x, y = xyz[..., 0].copy(), xyz[..., 1].copy()
+        x[0, 1] = np.nan
+        y[1, 2] = np.nan
+        u = v = np.ones(x.shape)
+        ut, vt = target_proj.transform_vectors(src_proj, x, y, u, v)
+        assert ut.shape == vt.shape == x.shape
+        nans = np.zeros(x.shape, dtype=bool)
+        nans[0, 1] = nans[1, 2] = True
+        assert_array_equal(np.isnan(ut), nans)
+        assert_array_equal(np.isnan(vt), nans)
@@ -17,6 +17,9 @@
 
 from __future__ import (absolute_import, division, print_function)
 
+import shapely.geometry as sgeom
+
+import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 
 small_extent = (-6, -8, 56, 59)
@@ -71,3 +74,29 @@ class TestFeatures(object):
         # '110m' when the extent is large and autoscale is True.
         auto_land.intersecting_geometries(large_extent)
         assert auto_land.scale == '110m'
+
+
+def test_geometry_index():
+    geoms = [sgeom.box(i, 0, i + 0.5, 1) for i in range(10)]
+    geoms += [None, sgeom.Polygon(), sgeom.LineString([(0, 0), (9, 0.2)])]
+    index = cfeature._GeometryIndex(geoms)
+    assert list(index) == geoms
+
+    result = index.intersecting(sgeom.box(2.2, 0, 5.1, 1))
+    # The matches are returned in their original order.
+    assert result == [geoms[2], geoms[3], geoms[4], geoms[5], geoms[-1]]
+
+    empty_index = cfeature._GeometryIndex([])
+    assert empty_index.intersecting(sgeom.box(0, 0, 1, 1)) == []
+
+    # Repeated geometries are all found.
+    index = cfeature._GeometryIndex([geoms[0], geoms[1], geoms[0]])
+    result = index.intersecting(sgeom.box(0, 0, 2, 1))
+    assert result == [geoms[0], geoms[1], geoms[0]]
+
+
+def test_shapely_feature_intersecting_geometries():
+    geoms = [sgeom.box(i, 0, i + 0.5, 1) for i in range(10)]
+    feature = cfeature.ShapelyFeature(geoms, ccrs.PlateCarree())
+    result = list(feature.intersecting_geometries((2.2, 5.1, 0, 1)))
+    assert result == geoms[2:6]
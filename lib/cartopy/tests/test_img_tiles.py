@@ -22,8 +22,15 @@ import types
 
 import numpy as np
 from numpy.testing import assert_array_almost_equal as assert_arr_almost
+from PIL import Image
 import pytest
 import shapely.geometry as sgeom
+from shapely.prepared import prep
+import six
+try:
+    from unittest import mock
+except ImportError:
+    import mock
 
 import cartopy.crs as ccrs
 import cartopy.io.img_tiles as cimgt
@@ -154,6 +161,46 @@ def test_tile_find_images():
             [(7, 4, 4), (7, 5, 4), (8, 4, 4), (8, 5, 4)])
 
 
+@pytest.mark.parametrize('target_domain', [
+    sgeom.box(-3e6, 2e6, 5e6, 7e6),
+    # A rectangle whose edges lie on tile boundaries.
+    sgeom.box(0, 0, 5009377.085697312, 5009377.085697312),
+    sgeom.Polygon([(-3e6, 2e6), (5e6, 2e6), (-3e6, 7e6)]),
+])
+def test_find_images_matches_tile_extents(target_domain):
+    gt = cimgt.GoogleTiles()
+    target_z = 4
+    expected = set()
+    for x in range(2 ** target_z):
+        for y in range(2 ** target_z):
+            x0, x1, y0, y1 = gt.tileextent((x, y, target_z))
+            if sgeom.box(x0, y0, x1, y1).intersects(target_domain):
+                expected.add((x, y, target_z))
+
+    tiles = list(gt.find_images(target_domain, target_z))
+    assert set(tiles) == expected
+    assert len(tiles) == len(expected)
+    # Tiles are in quadtree order, so those of a parent tile are together.
+    parents = [(x // 2, y // 2) for x, y, _ in tiles]
+    assert parents == sorted(parents, key=parents.index)
+
+
+def test_find_images_asymmetric_y_limits():
+    gt = cimgt.GoogleTiles()
+    gt.crs = mock.Mock(x_limits=(-100., 100.), y_limits=(-50., 150.))
+    # Rows are counted down from the top of the CRS.
+    assert_arr_almost(gt.tileextent((0, 0, 1)), (-100, 0, 50, 150))
+    assert_arr_almost(gt.tileextent((1, 1, 1)), (0, 100, -50, 50))
+
+    target_domain = sgeom.box(-30, -20, 60, 90)
+    for target_z in range(5):
+        expected = list(gt._find_images_prepared(prep(target_domain),
+                                                 target_z, (0, 0, 0)))
+        assert expected
+        assert gt._find_images_in_bounds(target_domain.bounds, target_z,
+                                         (0, 0, 0)) == expected
+
+
 @pytest.mark.network
 def test_image_for_domain():
     gt = cimgt.GoogleTiles()
@@ -178,6 +225,47 @@ def test_image_for_domain():
                            [11.25, 61.60639637]])
 
 
+def test_get_image_fetcher():
+    png = six.BytesIO()
+    Image.new('RGB', (256, 256), (255, 0, 0)).save(png, format='png')
+    fetcher = mock.Mock(fetch=mock.Mock(return_value=png.getvalue()))
+
+    osm = cimgt.OSM()
+    osm.fetcher = fetcher
+    img, extent, origin = osm.get_image((1, 2, 3))
+
+    fetcher.fetch.assert_called_once_with(osm._image_url((1, 2, 3)))
+    assert img.size == (256, 256)
+    assert img.getpixel((0, 0)) == (255, 0, 0)
+    assert extent == osm.tileextent((1, 2, 3))
+    assert origin == 'lower'
+
+
+def test_merge_tiles():
+    tiles = []
+    for i, j in [(0, 0), (1, 0), (0, 1)]:
+        # Rows of tile images run from north to south.
+        img = np.zeros((4, 5, 3), dtype=np.uint8)
+        img[:] = 10 * (i + 2 * j + 1)
+        img[0, :] = 200
+        x = np.linspace(i * 5, (i + 1) * 5, 5, endpoint=False)
+        y = np.linspace(j * 4, (j + 1) * 4, 4, endpoint=False)
+        tiles.append([img, x, y, 'lower'])
+
+    img, extent, origin = cimgt._merge_tiles(tiles)
+    assert img.shape == (8, 10, 3)
+    assert img.dtype == np.uint8
+    assert extent == [0, 9, 0, 7]
+    assert origin == 'lower'
+    assert (img[:3, :5] == 10).all()
+    assert (img[:3, 5:] == 20).all()
+    assert (img[4:7, :5] == 30).all()
+    # The north row of each tile is at the top of its place in the mosaic.
+    assert (img[[3, 7], :5] == 200).all()
+    # The missing tile is left white.
+    assert (img[4:, 5:] == 255).all()
+
+
 def test_quadtree_wts():
     qt = cimgt.QuadtreeTiles()
 
@@ -19,6 +19,7 @@ from __future__ import (absolute_import, division, print_function)
 
 import numpy as np
 from numpy.testing import assert_array_equal
+import pytest
 
 import cartopy.img_transform as img_trans
 import cartopy.crs as ccrs
@@ -89,3 +90,111 @@ def test_griding_data_outside_projection():
     assert_array_equal([-180, 180, -90, 90], extent)
     assert_array_equal(expected, image)
     assert_array_equal(expected_mask, image.mask)
+
+
+def test_regridder_reuse():
+    source_proj = ccrs.PlateCarree()
+    target_proj = ccrs.PlateCarree(central_longitude=180)
+    source_x, source_y, _ = img_trans.mesh_projection(
+        source_proj, 36, 18, x_extents=[-90, 90])
+    target_x, target_y, _ = img_trans.mesh_projection(target_proj, 24, 12)
+    regridder = img_trans.Regridder(source_x, source_y, source_proj,
+                                    target_proj, target_x, target_y,
+                                    mask_extrapolated=True)
+
+    frames = np.arange(5 * 18 * 36).reshape(5, 18, 36)
+    for frame in frames:
+        expected = img_trans.regrid(frame, source_x, source_y, source_proj,
+                                    target_proj, target_x, target_y,
+                                    mask_extrapolated=True)
+        image = regridder.regrid(frame)
+        assert_array_equal(expected, image)
+        assert_array_equal(expected.mask, image.mask)
+
+    # Stacked frames are regridded together, with a single mask.
+    stacked = regridder.regrid(np.dstack(frames))
+    assert stacked.shape == (12, 24, 5)
+    for i, frame in enumerate(frames):
+        assert_array_equal(regridder.regrid(frame), stacked[..., i])
+
+
+def test_warp_array_regular_grid():
+    # The cells of the regular source grid found arithmetically are those
+    # found by the nearest neighbour search.
+    source_proj = ccrs.PlateCarree()
+    target_proj = ccrs.PlateCarree(central_longitude=-170)
+    data = np.arange(90 * 180).reshape(90, 180)
+    source_extent = [10, 370, -90, 90]
+
+    image, extent = img_trans.warp_array(data, target_proj, source_proj,
+                                         target_res=(300, 200),
+                                         source_extent=source_extent,
+                                         mask_extrapolated=True)
+
+    source_x, source_y, _ = img_trans.mesh_projection(
+        source_proj, 180, 90, source_extent[:2], source_extent[2:])
+    target_x, target_y, _ = img_trans.mesh_projection(target_proj, 300, 200)
+    expected = img_trans.regrid(data, source_x, source_y, source_proj,
+                                target_proj, target_x, target_y,
+                                mask_extrapolated=True)
+    assert_array_equal([-180, 180, -90, 90], extent)
+    assert_array_equal(expected, image)
+    assert_array_equal(expected.mask, image.mask)
+
+
+def test_warp_array_area():
+    # Downsampling by whole source cells gives the mean of each block.
+    source_proj = ccrs.PlateCarree()
+    data = np.arange(90 * 180, dtype=np.float64).reshape(90, 180)
+    image, _ = img_trans.warp_array(data, source_proj, source_proj,
+                                    target_res=(45, 30), method='area')
+    expected = data.reshape(30, 3, 45, 4).mean(axis=(1, 3))
+    np.testing.assert_allclose(expected, image)
+
+
+def test_regrid_bilinear():
+    source_proj = ccrs.PlateCarree()
+    source_x, source_y, source_extent = img_trans.mesh_projection(
+        source_proj, 180, 90)
+    data = 2 * source_x + 3 * source_y
+    target_x, target_y, _ = img_trans.mesh_projection(
+        source_proj, 77, 41, [-150, 150], [-60, 60])
+    image = img_trans.regrid(data, source_x, source_y, source_proj,
+                             source_proj, target_x, target_y,
+                             source_extent=source_extent, method='bilinear')
+    np.testing.assert_allclose(2 * target_x + 3 * target_y, image,
+                               atol=1e-9)
+
+    # Global grids are interpolated across the dateline.
+    data = np.zeros((90, 180))
+    data[:, 0] = 1
+    image = img_trans.regrid(data, source_x, source_y, source_proj,
+                             source_proj, np.array([[179.5, -179.5]]),
+                             np.array([[0.5, 0.5]]),
+                             source_extent=source_extent, method='bilinear')
+    np.testing.assert_allclose([[0.25, 0.75]], image)
+
+
+@pytest.mark.parametrize('method', ['nearest', 'bilinear', 'area'])
+def test_regridder_blocks(tmpdir, method):
+    # Regridding a block of target rows at a time, into a memory-mapped
+    # output, gives the same result as regridding all at once.
+    source_proj = ccrs.PlateCarree()
+    target_proj = ccrs.PlateCarree(central_longitude=100)
+    source_x, source_y, source_extent = img_trans.mesh_projection(
+        source_proj, 90, 45, [-100, 160], [-70, 80])
+    target_x, target_y, _ = img_trans.mesh_projection(target_proj, 37, 29)
+    data = np.random.RandomState(0).rand(45, 90, 2)
+    args = (source_x, source_y, source_proj, target_proj, target_x,
+            target_y, True, source_extent, method)
+
+    expected = img_trans.Regridder(*args).regrid(data)
+
+    regridder = img_trans.Regridder(*args)
+    regridder.block_size = 40
+    out = np.memmap(str(tmpdir.join('out')), dtype=np.float64, mode='w+',
+                    shape=(29, 37, 2))
+    image = regridder.regrid(data, out=out)
+    np.testing.assert_allclose(np.ma.getdata(expected), out)
+    np.testing.assert_allclose(expected, image)
+    assert_array_equal(expected.mask, image.mask)
@@ -25,6 +25,7 @@ import pytest
 import shapely.geometry as sgeom
 
 import cartopy.crs as ccrs
+import cartopy.trace
 
 
 class TestLineString(object):
@@ -238,6 +239,21 @@ class TestMisc(object):
         multi_line_string = merc.project_geometry(linear_ring, merc)
         assert len(multi_line_string) > 0
 
+    def test_project_linears(self):
+        # Projecting many lines at once matches projecting them one by one.
+        projection = ccrs.Robinson(170.5)
+        src_crs = ccrs.Geodetic()
+        line_strings = [sgeom.LineString([(-10, 30), (10, 60)]),
+                        sgeom.LineString([(150, 0), (-150, 0)]),
+                        sgeom.LinearRing([(0, 0), (20, 0), (20, 20)])]
+        results = cartopy.trace.project_linears(line_strings, src_crs,
+                                                projection)
+        assert len(results) == len(line_strings)
+        for line_string, result in zip(line_strings, results):
+            expected = cartopy.trace.project_linear(line_string, src_crs,
+                                                    projection)
+            assert result.equals(expected)
+
 
 class TestSymmetry(object):
     @pytest.mark.xfail
@@ -68,6 +68,24 @@ class TestLakes(object):
         assert actual == expected
         assert lake_record.geometry == self.test_lake_geometry
 
+    def test_bbox(self):
+        bbox = (-86, 11, -84.5, 12)
+        geometries = list(self.reader.geometries(bbox=bbox))
+        assert self.test_lake_geometry in geometries
+        assert len(geometries) < len(self.reader)
+        for geometry in geometries:
+            xmin, ymin, xmax, ymax = geometry.bounds
+            assert xmin <= bbox[2] and xmax >= bbox[0]
+            assert ymin <= bbox[3] and ymax >= bbox[1]
+
+        names = [record.attributes['name']
+                 for record in self.reader.records(bbox=bbox)]
+        assert self.lake_name in names
+        assert len(names) == len(geometries)
+
+        # A bbox away from all of the lakes matches nothing.
+        assert list(self.reader.geometries(bbox=(0, -80, 1, -79))) == []
+
     @pytest.mark.skipif(shp._HAS_FIONA,
                         reason="Fiona reader doesn't support lazy loading.")
     def test_bounds(self):
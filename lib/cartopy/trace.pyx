@@ -573,6 +573,70 @@ cdef void _project_segment(GEOSContextHandle_t handle,
                 lines.new_line()
 
 
+@cython.final
+cdef class PreparedDomain:
+    """
+    A GEOS prepared geometry of a projection domain, which is reused by all
+    the projection calls into that domain.
+
+    Instances are created and owned by :class:`cartopy.crs.Projection`
+    (see ``Projection._prepared_domain``) and the GEOS handle is freed when
+    the instance is deallocated.
+
+    """
+    cdef object domain
+    cdef const GEOSPreparedGeometry *gp_domain
+
+    def __cinit__(self, domain not None):
+        self.gp_domain = NULL
+        # Keep a reference to the shapely geometry, as the prepared
+        # geometry refers to its GEOS geometry.
+        self.domain = domain
+        self.gp_domain = GEOSPrepare_r(get_geos_context_handle(),
+                                       geos_from_shapely(domain))
+
+    def __dealloc__(self):
+        if self.gp_domain != NULL:
+            GEOSPreparedGeom_destroy_r(get_geos_context_handle(),
+                                       self.gp_domain)
+
+
+cdef GEOSGeometry *_project_linear(GEOSContextHandle_t handle,
+                                   GEOSGeometry *g_linear,
+                                   Interpolator interpolator,
+                                   const GEOSPreparedGeometry *gp_domain,
+                                   double threshold):
+    """
+    Project a single GEOS LineString/LinearRing with the given (already
+    initialised) interpolator, returning a new GEOS MultiLineString.
+
+    """
+    cdef:
+        const GEOSCoordSequence *src_coords
+        unsigned int src_size, src_idx
+        LineAccumulator lines
+
+    src_coords = GEOSGeom_getCoordSeq_r(handle, g_linear)
+    GEOSCoordSeq_getSize_r(handle, src_coords, &src_size)  # check exceptions
+
+    lines = LineAccumulator()
+    for src_idx in range(1, src_size):
+        _project_segment(handle, src_coords, src_idx - 1, src_idx,
+                         interpolator, gp_domain, threshold, lines);
+
+    return lines.as_geom(handle)
+
+
+cdef Interpolator _interpolator(CRS src_crs, dest_projection):
+    cdef Interpolator interpolator
+    if src_crs.is_geodetic():
+        interpolator = SphericalInterpolator()
+    else:
+        interpolator = CartesianInterpolator()
+    interpolator.init(src_crs.proj4, (<CRS>dest_projection).proj4)
+    return interpolator
+
+
 def project_linear(geometry not None, CRS src_crs not None,
                    dest_projection not None):
     """
@@ -594,40 +658,50 @@ def project_linear(geometry not None, CRS src_crs not None,
         into the destination projection.
 
     """
-    cdef:
-        double threshold = dest_projection.threshold
-        GEOSContextHandle_t handle = get_geos_context_handle()
-        GEOSGeometry *g_linear = geos_from_shapely(geometry)
-        Interpolator interpolator
-        GEOSGeometry *g_domain
-        const GEOSCoordSequence *src_coords
-        unsigned int src_size, src_idx
-        const GEOSPreparedGeometry *gp_domain
-        LineAccumulator lines
-        GEOSGeometry *g_multi_line_string
+    return project_linears([geometry], src_crs, dest_projection)[0]
 
-    g_domain = geos_from_shapely(dest_projection.domain)
 
-    if src_crs.is_geodetic():
-        interpolator = SphericalInterpolator()
-    else:
-        interpolator = CartesianInterpolator()
-    interpolator.init(src_crs.proj4, (<CRS>dest_projection).proj4)
+def project_linears(geometries not None, CRS src_crs not None,
+                    dest_projection not None):
+    """
+    Project many geometries from one projection to another.
 
-    src_coords = GEOSGeom_getCoordSeq_r(handle, g_linear)
-    gp_domain = GEOSPrepare_r(handle, g_domain)
+    This is equivalent to calling :func:`project_linear` for each geometry,
+    but the interpolator is set up only once for the whole sequence. The
+    prepared domain of the destination projection is shared between all
+    calls into that projection.
 
-    GEOSCoordSeq_getSize_r(handle, src_coords, &src_size)  # check exceptions
+    Parameters
+    ----------
+    geometries : iterable of `shapely.geometry.LineString` or \
+`shapely.geometry.LinearRing`
+        The geometries to be projected.
+    src_crs : cartopy.crs.CRS
+        The coordinate system of the lines to be projected.
+    dest_projection : cartopy.crs.Projection
+        The projection for the resulting projected lines.
 
-    lines = LineAccumulator()
-    for src_idx in range(1, src_size):
-        _project_segment(handle, src_coords, src_idx - 1, src_idx,
-                         interpolator, gp_domain, threshold, lines);
+    Returns
+    -------
+    list of `shapely.geometry.MultiLineString`
+        The result of projecting each of the given geometries from the source
+        projection into the destination projection.
 
-    GEOSPreparedGeom_destroy_r(handle, gp_domain)
+    """
+    cdef:
+        double threshold = dest_projection.threshold
+        GEOSContextHandle_t handle = get_geos_context_handle()
+        Interpolator interpolator = _interpolator(src_crs, dest_projection)
+        PreparedDomain prepared = dest_projection._prepared_domain
+        GEOSGeometry *g_multi_line_string
 
-    g_multi_line_string = lines.as_geom(handle)
+    results = []
+    for geometry in geometries:
+        if geometry is None:
+            raise TypeError('Cannot project a geometry of None.')
+        g_multi_line_string = _project_linear(
+            handle, geos_from_shapely(geometry), interpolator,
+            prepared.gp_domain, threshold)
+        results.append(shapely_from_geos(g_multi_line_string))
 
-    del lines, interpolator
-    multi_line_string = shapely_from_geos(g_multi_line_string)
-    return multi_line_string
+    return results